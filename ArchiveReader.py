@@ -0,0 +1,172 @@
+import gzip
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from io import BytesIO
+
+archive_formats = {'.zip': 'zip', '.ufdr': 'zip', '.7z': '7z', '.tar': 'tar', '.gz': 'gzip', '.tgz': 'tar', '.rar': 'rar',
+                   '.rar5': 'rar'}
+archive_extensions = list(archive_formats)
+zip_extensions = ['.zip', '.ufdr']  # Members of these can be read one by one, so they are scanned in parallel
+in_memory_size = 256 * 1024 * 1024  # Larger members, nested archives included, are spilled to a temp file instead
+# Nested zip files up to this size are kept open in memory by the workers, see cached_zipfile. The cache isn't leased
+# from the memory budget, so its 4 entries together stay at the size of a scan window
+cached_zip_size = 16 * 1024 * 1024
+
+
+class ArchiveMember:
+    """
+    ArchiveMember is a single file inside an archive, read on demand.
+    content_key is the size and CRC for zip members, which is the same for members with the same content.
+    """
+    def __init__(self, name, size, opener, disk_path=None, content_key=None):
+        self.name = name
+        self.size = size
+        self.opener = opener
+        self.disk_path = disk_path
+        self.content_key = content_key
+
+    def in_memory(self):
+        return self.disk_path is None and self.size <= in_memory_size
+
+    def read(self):
+        with self.opener() as member_file:
+            return member_file.read()
+
+    @contextmanager
+    def spill(self, temppath):
+        if self.disk_path:
+            yield self.disk_path
+            return
+
+        with tempfile.TemporaryDirectory(dir=temppath) as temp_dir:
+            spill_path = os.path.join(temp_dir, os.path.basename(self.name))
+            with self.opener() as member_file, open(spill_path, 'wb') as spill_file:
+                shutil.copyfileobj(member_file, spill_file, 1024 * 1024)
+            yield spill_path
+
+
+def is_archive(file_path):
+    return os.path.splitext(file_path)[1].lower() in archive_extensions
+
+
+def is_zip(file_path):
+    return os.path.splitext(file_path)[1].lower() in zip_extensions
+
+
+def zip_members(archive):
+    for info in archive.infolist():
+        if not info.is_dir():
+            yield ArchiveMember(info.filename, info.file_size, partial(archive.open, info))
+
+
+def tar_members(archive):
+    # The archive is opened as a stream, so each member has to be read before moving on to the next one
+    for info in archive:
+        if info.isfile():
+            yield ArchiveMember(info.name, info.size, partial(archive.extractfile, info))
+
+
+def rar_members(archive):
+    for info in archive.infolist():
+        if not info.is_dir():
+            yield ArchiveMember(info.filename, info.file_size, partial(archive.open, info))
+
+
+def gzip_member(archive_path, archive_data):
+    # A gzip file holds a single file, named like the gzip file without .gz. The size in the trailer is modulo 4GB,
+    # it's only counted when the data could be that large, deflate shrinks data by about 1032:1 at most
+    member_name = os.path.basename(archive_path.replace("\\", "/"))
+    if member_name.lower().endswith('.gz'):
+        member_name = member_name[:-3]
+
+    if archive_data is not None:
+        opener = lambda: gzip.GzipFile(fileobj=BytesIO(archive_data))  # Every reader gets its own position
+        compressed_size, trailer = len(archive_data), archive_data[-4:]
+    else:
+        opener = partial(gzip.open, archive_path, 'rb')
+        with open(archive_path, 'rb') as archive_file:
+            compressed_size = archive_file.seek(0, os.SEEK_END)
+            archive_file.seek(max(compressed_size - 4, 0))
+            trailer = archive_file.read(4)
+
+    size = int.from_bytes(trailer, 'little')
+    if compressed_size * 1032 >= 2 ** 32:
+        with opener() as member_file:
+            size = sum(len(block) for block in iter(partial(member_file.read, 1024 * 1024), b''))
+    return ArchiveMember(member_name, size, opener)
+
+
+def directory_members(directory):
+    for root, dirs, files in os.walk(directory):
+        for file_name in files:
+            full_path = os.path.join(root, file_name)
+            yield ArchiveMember(os.path.relpath(full_path, directory), os.path.getsize(full_path),
+                                partial(open, full_path, 'rb'), full_path)
+
+
+@contextmanager
+def open_archive(archive_path, archive_data=None, temppath=None, archive_format=None):
+    # Yields the members of a zip, tar, gzip, 7z or rar archive, read from archive_data when given instead of archive_path.
+    # The format is taken from the extension unless the caller found it in the content, see FileType
+    source = BytesIO(archive_data) if archive_data is not None else archive_path
+    archive_format = archive_format or archive_formats.get(os.path.splitext(archive_path)[1].lower())
+
+    if archive_format == 'zip':
+        with zipfile.ZipFile(source, 'r') as archive:
+            yield zip_members(archive)
+
+    elif archive_format == 'tar':
+        if archive_data is not None:
+            archive = tarfile.open(fileobj=source, mode='r|*')
+        else:
+            archive = tarfile.open(source, 'r|*')
+        with archive:
+            yield tar_members(archive)
+
+    elif archive_format == 'gzip':
+        # Tar files compressed with gzip are found by FileType and read as 'tar'
+        yield iter([gzip_member(archive_path, archive_data)])
+
+    elif archive_format == 'rar':
+        import rarfile
+        with rarfile.RarFile(source, 'r') as archive:
+            yield rar_members(archive)
+
+    elif archive_format == '7z':
+        # 7z members can't be opened one by one, so small archives are decompressed in one go and larger ones
+        # are extracted to a temp dir
+        import py7zr
+        with py7zr.SevenZipFile(source, 'r') as archive:
+            if hasattr(archive, 'readall') and sum(info.uncompressed for info in archive.list()) <= in_memory_size:
+                yield (ArchiveMember(name, len(data.getbuffer()), partial(BytesIO, data.getvalue()))
+                       for name, data in archive.readall().items() if data is not None)
+            else:
+                with tempfile.TemporaryDirectory(dir=temppath) as temp_dir:
+                    archive.extractall(temp_dir)
+                    yield directory_members(temp_dir)
+
+    else:
+        yield iter(())
+
+
+@lru_cache(maxsize=4)
+def cached_zipfile(archive_path, member_chain=()):
+    # Workers keep the archives they read from open, so the central directory is only parsed once per worker.
+    # Nested zip files are given by the chain of member names leading to them and are held in memory, they are only
+    # listed this way up to cached_zip_size. Larger ones are scanned whole by one worker, like other archives
+    if not member_chain:
+        return zipfile.ZipFile(archive_path, 'r')
+    parent_archive = cached_zipfile(archive_path, member_chain[:-1])
+    return zipfile.ZipFile(BytesIO(parent_archive.read(member_chain[-1])), 'r')
+
+
+def zip_chain_members(archive_path, member_chain, member_names=None):
+    archive = cached_zipfile(archive_path, member_chain)
+    infos = archive.infolist() if member_names is None else map(archive.getinfo, member_names)
+    return [ArchiveMember(info.filename, info.file_size, partial(archive.open, info), content_key=(info.file_size, info.CRC))
+            for info in infos if not info.is_dir()]
@@ -0,0 +1,71 @@
+import hashlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+sample_size = 64 * 1024
+hash_threads = 8
+
+
+def sample_hash(path, size):
+    # Size plus the first and last 64KB of the file, which is the whole file up to 128KB
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, 'rb') as file:
+        digest.update(file.read(sample_size))
+        if size > sample_size:
+            file.seek(max(sample_size, size - sample_size))
+            digest.update(file.read(sample_size))
+    return digest.hexdigest()
+
+
+def full_hash(path, size):
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def group_by_hash(executor, files, hash_function, scan_key):
+    # Files that can't be read get their path as hash, so they are never grouped with other files
+    def file_hash(file):
+        try:
+            return hash_function(file[0], file[1])
+        except OSError:
+            return file[0]
+
+    groups = defaultdict(list)
+    for file, content_hash in zip(files, executor.map(file_hash, files)):
+        groups[(file[1], scan_key(file[0]), content_hash)].append(file)
+    return groups.values()
+
+
+def group_duplicates(files, scan_key=lambda file_path: None):
+    # Returns the files to scan and a dict of the path of every scanned file to the files with the same content.
+    # Only files of the same size are hashed, and only when their samples match as well the whole file is hashed.
+    # Files are only grouped when scan_key gives the same key for their paths, see Process.scan_key
+    unique_files = []
+    duplicates = {}
+    same_size = defaultdict(list)
+    for file in files:
+        same_size[(file[1], scan_key(file[0]))].append(file)
+
+    with ThreadPoolExecutor(hash_threads) as executor:
+        candidates = []
+        for group in same_size.values():
+            if len(group) == 1:
+                unique_files.append(group[0])
+            else:
+                candidates += group
+
+        for group in group_by_hash(executor, candidates, sample_hash, scan_key):
+            if len(group) > 1 and group[0][1] > 2 * sample_size:
+                groups = group_by_hash(executor, group, full_hash, scan_key)
+            else:
+                groups = [group]
+
+            for same_content in groups:
+                unique_files.append(same_content[0])
+                if len(same_content) > 1:
+                    duplicates[same_content[0][0]] = same_content[1:]
+
+    return unique_files, duplicates
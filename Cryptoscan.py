@@ -1,24 +1,35 @@
 import argparse
+import collections
 import csv
 import datetime
 import functools
 import multiprocessing
 import os
+import queue
 import re
+import subprocess
 import sys
-import tempfile
 import time
-import zipfile
-from itertools import chain, zip_longest
+from itertools import zip_longest
 from signal import SIGINT, SIG_IGN, signal
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
+import psutil
 
+import ArchiveReader
+import ContentHash
+import DirectoryWalker
+import FileType
+import PatternProfiles
 import Process
+import WalletFinder
+from FileHandler import FileHandler
+from MemoryBudget import MemoryBudget
+from ScanCache import ScanCache
 
 version = "2.0"
 output_name = datetime.datetime.now().strftime("Cryptoscan_%Y_%m_%d_%H%M%S.csv")
+# Imported on first use of a file type, validator or the xlsx output, see import_time_report
+lazy_modules = ['fitz', 'striprtf.striprtf', 'py7zr', 'rarfile', 'pytsk3', 'pyewf', 'monero.address', 'web3', 'openpyxl']
 
 
 class StatsTracker:
@@ -27,10 +38,19 @@ class StatsTracker:
         self.total_bytes_processed = 0
         self.count_seedstrings = 0
         self.count_addresses = 0
+        self.cached_files_count = 0
+        self.duplicate_files_count = 0
+        self.prefilter_counts = collections.Counter()
+        self.scan_counts = collections.Counter()
 
 
-def init_worker():
+def init_worker(memory_budget, prefilters_enabled, pattern_descriptions, raw_scan_types, scan_policies):
     signal(SIGINT, SIG_IGN)
+    Process.memory_budget = memory_budget
+    Process.prefilters_enabled = prefilters_enabled
+    Process.select_patterns(pattern_descriptions)
+    FileType.set_raw_scan(raw_scan_types)
+    FileType.set_scan_policies(scan_policies)
 
 
 def convertsizestring_to_bytesint(size_str):
@@ -59,42 +79,80 @@ def convertbytesint_to_sizestring(size_int):
 
 
 def process_result(result, lock, file, stats_):
+    # Returns the rows written to the csv
+    rows = []
     with lock:
         try:
             if result[0]:  # Special check for result from too small file in zipfile
                 if isinstance(result[0][0][0], tuple):  # Unpacks result if it's a result from an archive
                     for single_result in result[0]:
-                        write_to_csv(single_result, file, stats_)
+                        rows += write_to_csv(single_result, file, stats_)
                 else:
-                    write_to_csv(result, file, stats_)
+                    rows += write_to_csv(result, file, stats_)
         except Exception as err:
             print("Error in processing result: " + str(err))
+    return rows
 
 
 def write_to_csv(result, file, stats_):
+    rows = [(str(pattern), str(address), str(result[1]), str(offset))
+            for pattern, address, offset in zip_longest(result[0][0], result[0][1], result[0][2], fillvalue='N/A')]
+    write_rows(rows, file, stats_)
+    return rows
+
+
+def write_rows(rows, file, stats_):
     try:
-        for pattern, address, offset in zip_longest(result[0][0], result[0][1], result[0][2], fillvalue='N/A'):
+        for pattern, address, filename, offset in rows:
             if "BIP-39 Seed String" in pattern:
                 stats_.count_seedstrings += 1
             else:
                 stats_.count_addresses += 1
-            file.write(str(pattern) + "," + str(address) + "," + str(result[1]) + "," + str(offset) + '\n')
+            file.write(pattern + "," + address + "," + filename + "," + offset + '\n')
             file.flush()
     except Exception as err:
         print("Error in writing to .csv: " + str(err))
 
 
-def process_single_file(path, max_filesize, excl_paths, stats_, temppath_):
+def duplicate_rows(rows, file_path, duplicate_path):
+    # Rows of file_path for a file with the same content. Wallet hits depend on the path, so they are redone
+    archive_prefix = file_path.replace('/', "\\")
+    duplicate_archive_prefix = duplicate_path.replace('/', "\\")
+    duplicate = []
+    for pattern, address, filename, offset in rows:
+        if filename == file_path:
+            if pattern in ('Wallet File', 'Wallet Path'):
+                continue
+            filename = duplicate_path
+        elif filename.startswith(archive_prefix):  # Archive members
+            filename = duplicate_archive_prefix + filename[len(archive_prefix):]
+        duplicate.append((pattern, address, filename, offset))
+
+    if not ArchiveReader.is_archive(duplicate_path):
+        if WalletFinder.findwallets(duplicate_path):
+            duplicate.append(("Wallet File", "N/A", duplicate_path, "0"))
+        if WalletFinder.findwalletpath(duplicate_path):
+            duplicate.append(("Wallet Path", "N/A", duplicate_path, "0"))
+    return duplicate
+
+
+def process_single_file(path, max_filesize, excl_paths, stats_, temppath_, memory_budget, scan_cache, disk_image):
     lock = multiprocessing.Lock()
-    extension = os.path.splitext(path)[1].lower()
-    if extension == '.ufdr' or extension == '.zip':
-        process_single_archive(path, max_filesize, excl_paths, stats_, temppath_)
+    tasks = Process.file_tasks(path, os.path.getsize(path), disk_image)
+    files = [(path, os.path.getsize(path), os.path.getmtime(path))]
+    if tasks[0][0] in ('archive', 'image'):
+        scan_files(files, max_filesize, excl_paths, stats_, temppath_, memory_budget, scan_cache, disk_image)
+    elif len(tasks) > 1 or scan_cache:
+        scan_files(files, 1000000000000, excl_paths, stats_, temppath_, memory_budget, scan_cache)
     else:
+        Process.memory_budget = memory_budget
         result = Process.process_file(1000000000000, excl_paths, None, temppath_, path)
+        stats_.prefilter_counts.update(Process.prefilter_counts)
+        stats_.scan_counts.update(Process.scan_counts)
         try:
             stats_.processed_files_count += 1
             stats_.total_bytes_processed += int(result[2])
-            if result and all(result[0]):
+            if result and result[0] is not None and all(result[0]):
                 with open(output_name, 'a') as file:
                     file.write('Pattern,Found addresses,Filename,Offset\n')
                     process_result(result, lock, file, stats_)
@@ -102,53 +160,129 @@ def process_single_file(path, max_filesize, excl_paths, stats_, temppath_):
             print(f'Error: {err}')
 
 
-def process_single_archive(path, max_filesize, excl_paths, stats_, temppath_):
-    if temppath_:
-        temp_dir = tempfile.TemporaryDirectory(dir=temppath_)
-    else:
-        temp_dir = tempfile.TemporaryDirectory()
-    with temp_dir as temp_dir:
-        with zipfile.ZipFile(path, 'r') as archive_ref:
-            print("Processing single archive file. Make sure you have enough storage space as all files will be extracted to a temp directory.")
-            archive_ref.extractall(temp_dir)
-            cpucount = multiprocessing.cpu_count() - 2
-            pool = multiprocessing.Pool(cpucount, init_worker)
-            lock = multiprocessing.Lock()
-            file_generator = chain.from_iterable((os.path.join(root, file) for file in files) for root, dirs, files in os.walk(temp_dir))
-
-            try:
-                with open(output_name, 'a') as file:
-                    file.write('Pattern,Found addresses,Filename,Offset\n')
-                    run_worker = pool.imap_unordered(functools.partial(Process.process_file, max_filesize, excl_paths, None, temppath_), file_generator)
-                    for result in run_worker:
-                        if result:
-                            stats_.processed_files_count += 1
-                            stats_.total_bytes_processed += int(result[2])
-                            if all(result[0]):
-                                process_result(result, lock, file, stats_)
-
-            except Exception as err:
-                print(f'Error: {err}')
-            pool.close()
-            pool.join()
-
-
-def process_directory(path, max_filesize, excl_paths, stats_, temppath_):
+def file_tasks(files, max_filesize, excl_paths, disk_image=False):
+    # Largest files first, so a huge file doesn't end up alone on one core at the end of the run
+    tasks = []
+    range_counts = {}
+    for file_path, filesize, mtime in sorted(files, key=lambda file: file[1], reverse=True):
+        tasks_for_file = Process.file_tasks(file_path, filesize, disk_image)
+        if len(tasks_for_file) > 1:
+            file_instance = FileHandler(file_path)
+            if file_instance.check_if_excluded(excl_paths) or file_instance.filecheck(max_filesize):
+                continue
+            range_counts[file_path] = len(tasks_for_file)
+        tasks.extend(tasks_for_file)
+    return tasks, range_counts
+
+
+def scan_files(files, max_filesize, excl_paths, stats_, temppath_, memory_budget, scan_cache, disk_image=False):
+    # Work queue on the shared pool. Listing a zip file adds tasks for its members, nested zip files included,
+    # so the members of a large archive are scanned on all cores. Disk images are listed the same way.
+    # Files that didn't change since they were put in the scan cache are replayed from there instead, and files with
+    # the same content are only scanned once
     cpucount = multiprocessing.cpu_count() - 2
-    pool = multiprocessing.Pool(cpucount, init_worker)
+    pool = multiprocessing.Pool(cpucount, init_worker, (memory_budget, Process.prefilters_enabled,
+                                                      [description for pattern, description in Process.patterns],
+                                                      FileType.raw_scan_types(), FileType.select_scan_policies()))
     lock = multiprocessing.Lock()
-    file_generator = chain.from_iterable((os.path.join(root, file) for file in files) for root, dirs, files in os.walk(path))
+    range_results = {}
+    finished_tasks = queue.Queue()
+    run_task = functools.partial(Process.process_task, max_filesize, excl_paths, temppath_)
+    last_report_time = time.perf_counter()
+
+    def submit(task):
+        pool.apply_async(run_task, (task,), callback=finished_tasks.put,
+                         error_callback=lambda err: finished_tasks.put(('error', None, err, {}, {})))
 
     try:
         with open(output_name, 'a') as file:
             file.write('Pattern,Found addresses,Filename,Offset\n')
-            run_worker = pool.imap_unordered(functools.partial(Process.process_file, max_filesize, excl_paths, None, temppath_), file_generator)
-            for result in run_worker:
-                if result:
+
+            files_to_scan = []
+            for file_path, filesize, mtime in files:
+                cached_rows = scan_cache.lookup(file_path, filesize, mtime) if scan_cache else None
+                if cached_rows is None:
+                    files_to_scan.append((file_path, filesize, mtime))
+                else:
+                    stats_.cached_files_count += 1
+                    write_rows(cached_rows, file, stats_)
+
+            file_stats = {file_path: (filesize, mtime) for file_path, filesize, mtime in files_to_scan}
+            files_to_scan, duplicates = ContentHash.group_duplicates(files_to_scan, Process.scan_key)
+            tasks, range_counts = file_tasks(files_to_scan, max_filesize, excl_paths, disk_image)
+            open_tasks = collections.Counter(task[1] for task in tasks)
+            file_rows = collections.defaultdict(list)
+            failed_files = set()
+            for task in tasks:
+                submit(task)
+            pending_tasks = len(tasks)
+
+            while pending_tasks:
+                kind, file_path, result, task_prefilter_counts, task_scan_counts = finished_tasks.get()
+                pending_tasks -= 1
+                stats_.prefilter_counts.update(task_prefilter_counts)
+                stats_.scan_counts.update(task_scan_counts)
+                if time.perf_counter() - last_report_time > 60:
+                    last_report_time = time.perf_counter()
+                    print(f"Memory budget: {memory_budget.usage_printable()}")
+
+                rows = []
+                if kind == 'error':
+                    print(f'Error: {result}')
+                    continue
+                elif kind in ('archive', 'image'):
+                    for task in result:
+                        submit(task)
+                    pending_tasks += len(result)
+                    open_tasks[file_path] += len(result)
+                elif not result:
+                    failed_files.add(file_path)
+                elif kind in ('members', 'imagefiles', 'unallocated'):
+                    stats_.processed_files_count += len(result[0])
+                    stats_.total_bytes_processed += result[2]
+                    if result[0]:
+                        rows = process_result(result, lock, file, stats_)
+                elif len(result) == 4:  # One byte range of a split file
+                    results, file_path, range_size, range_start = result
+                    stats_.total_bytes_processed += range_size
+                    range_results.setdefault(file_path, {})[range_start] = results
+                    if len(range_results[file_path]) == range_counts[file_path]:
+                        stats_.processed_files_count += 1
+                        result = Process.merge_range_results(range_results.pop(file_path)), file_path
+                        if result[0] is not None and all(result[0]):
+                            rows = process_result(result, lock, file, stats_)
+                else:
                     stats_.processed_files_count += 1
                     stats_.total_bytes_processed += int(result[2])
-                    if all(result[0]):
-                        process_result(result, lock, file, stats_)
+                    if result[0] is not None and all(result[0]):
+                        rows = process_result(result, lock, file, stats_)
+
+                file_rows[file_path] += rows
+                open_tasks[file_path] -= 1
+                if open_tasks[file_path]:
+                    continue
+
+                completed_files = [(file_path, file_rows.pop(file_path))]
+                if file_path in failed_files:  # Scanned separately, the failure may not be about the content
+                    retry_tasks, retry_range_counts = file_tasks(duplicates.pop(file_path, []), max_filesize, excl_paths)
+                    range_counts.update(retry_range_counts)
+                    open_tasks.update(task[1] for task in retry_tasks)
+                    pending_tasks += len(retry_tasks)
+                    for task in retry_tasks:
+                        submit(task)
+                    continue
+
+                for duplicate_path, filesize, mtime in duplicates.pop(file_path, []):
+                    completed_files.append((duplicate_path, duplicate_rows(completed_files[0][1], file_path, duplicate_path)))
+                    stats_.duplicate_files_count += 1
+                    stats_.processed_files_count += 1
+                    stats_.total_bytes_processed += filesize
+                    with lock:
+                        write_rows(completed_files[-1][1], file, stats_)
+
+                if scan_cache:
+                    for completed_path, completed_rows in completed_files:
+                        scan_cache.store(completed_path, *file_stats[completed_path], completed_rows)
 
     except Exception as err:
         print(f'Error: {err}')
@@ -157,11 +291,15 @@ def process_directory(path, max_filesize, excl_paths, stats_, temppath_):
     pool.join()
 
 
-def startprocessing(search_path, max_filesize, excluded_paths, stats, temp_path):
+def process_directory(path, max_filesize, excl_paths, stats_, temppath_, memory_budget, scan_cache):
+    scan_files(DirectoryWalker.walk_files(path, excl_paths, max_filesize), max_filesize, excl_paths, stats_, temppath_, memory_budget, scan_cache)
+
+
+def startprocessing(search_path, max_filesize, excluded_paths, stats, temp_path, memory_budget, scan_cache, disk_image):
     if os.path.isfile(search_path):
-        process_single_file(search_path, max_filesize, excluded_paths, stats, temp_path)
+        process_single_file(search_path, max_filesize, excluded_paths, stats, temp_path, memory_budget, scan_cache, disk_image)
     elif os.path.isdir(search_path):
-        process_directory(search_path, max_filesize, excluded_paths, stats, temp_path)
+        process_directory(search_path, max_filesize, excluded_paths, stats, temp_path, memory_budget, scan_cache)
 
 
 def usage_and_arguments():
@@ -178,8 +316,26 @@ cryptocurrency addresses or seed strings. Additionally, it searches for common w
     parser.add_argument('--maxfilesize', type=convertsizestring_to_bytesint, default='20GB', help='Optional: Maximum file size to scan (e.g. 10B, 10KB, 10MB, 10GB). Default is 20GB.')
     parser.add_argument('--excludepaths', type=str, nargs='*', default=[], help='Optional: A list of directories to exclude from the search.')
     parser.add_argument('--temppath', type=str, help='Optional: Set a specific temporary directory path.')
+    parser.add_argument('--memorybudget', type=convertsizestring_to_bytesint, help='Optional: Memory the workers may use together for large files (e.g. 512MB, 8GB).\nDefault is 80%% of the memory available at start.')
+    parser.add_argument('--scancache', type=str, help='Optional: SQLite file to cache scan results in. Files that are unchanged\nsince the last run with the same cache are not scanned again.')
+    parser.add_argument('--cachehash', action='store_true', help='Optional: Also compare a sample hash of the file content, so files copied\nagain with a new modification time are found in the scan cache.')
+    parser.add_argument('--noprefilters', action='store_true', help='Optional: Validate every candidate, also the ones inside base64 data or\nwith only one character class.')
+    parser.add_argument('--profile', type=str, default=PatternProfiles.default_profile, help=f'Optional: Pattern profile to search with. Built-in profiles are\n{", ".join(PatternProfiles.profiles)}. Default is {PatternProfiles.default_profile}.')
+    parser.add_argument('--profilefile', type=str, help='Optional: JSON file with more profiles, e.g. {"profiles": {"btc_eth": ["BTC", "ETH"]}}.')
+    parser.add_argument('--coins', type=str, nargs='*', default=[], help=f'Optional: Coins to search for on top of the profile.\nCoins are {", ".join(PatternProfiles.coins)}.')
+    parser.add_argument('--nocoins', type=str, nargs='*', default=[], help='Optional: Coins of the profile not to search for.')
+    parser.add_argument('--rawscan', type=str, nargs='*', default=[], help=f'Optional: Document types to also scan as raw bytes, for hits outside the\nextracted text. Types are {", ".join(FileType.document_types())}. Default is {", ".join(FileType.raw_scan_types())}.')
+    parser.add_argument('--norawscan', type=str, nargs='*', default=[], help='Optional: Document types to only scan as extracted text.')
+    parser.add_argument('--mediascan', type=str, nargs='*', default=[], help=f'Optional: Scan policy per media type as type=policy, e.g. video=skip.\nTypes are {", ".join(FileType.media_types())} (random data like encrypted files),\npolicies are skip, metadata (first and last 256KB only) and full. Default is metadata.')
+    parser.add_argument('--image', action='store_true', help='Optional: Read path as a disk image (raw/dd, or E01 with pyewf) and scan the\nfiles of its file systems, then the unallocated space and file slack. Needs pytsk3.')
     parser.add_argument('--xlsx', action='store_true', help='Optional: Convert the CSV output to an Excel file.\n ')
 
+    parser.add_argument('--importtime', action='store_true', help='Optional: Show how long starting Cryptoscan and loading the libraries for\ndocuments, archives and validators takes, then exit. No path needed.')
+
+    if '--importtime' in sys.argv:
+        import_time_report()
+        sys.exit(0)
+
     if len(sys.argv) <= 1:
         print(tool_description)
         parser.print_help()
@@ -192,20 +348,80 @@ cryptocurrency addresses or seed strings. Additionally, it searches for common w
         parser.print_help()
         sys.exit(1)
 
+    if args.image and not os.path.isfile(args.path):
+        print(f"Error: --image needs a disk image file, '{args.path}' is not a file.")
+        sys.exit(1)
+
+    try:
+        selected_coins = PatternProfiles.select_coins(args.profile, args.coins, args.nocoins, args.profilefile)
+        raw_scan_types = FileType.select_raw_scan(args.rawscan, args.norawscan)
+        scan_policies = FileType.select_scan_policies(args.mediascan)
+    except ValueError as err:
+        print(f"Error: {err}")
+        sys.exit(1)
+    if not selected_coins:
+        print("Error: No coins selected, check --profile, --coins and --nocoins.")
+        sys.exit(1)
+
+    if args.memorybudget is None:
+        available_memory = int(psutil.virtual_memory().available * 0.8)
+        args.memorybudget = (available_memory, convertbytesint_to_sizestring(available_memory))
+
     print("Arguments received:")
     print(f"Path: {args.path}")
     print(f"Max file size: {args.maxfilesize[1]} ({args.maxfilesize[0]} bytes)")
+    print(f"Memory budget: {args.memorybudget[1]} ({args.memorybudget[0]} bytes)")
     if args.excludepaths:
         print(f"Excluded directories: {args.excludepaths}")
     if args.temppath:
         print(f"Set temporary directory: {args.temppath}")
+    if args.image:
+        print("Reading path as a disk image.")
+    if args.scancache:
+        print(f"Scan cache: {args.scancache}{' (with content hash)' if args.cachehash else ''}")
+    if args.noprefilters:
+        print("Pre-filters disabled, every candidate is validated.")
+    print(f"Profile: {args.profile} ({', '.join(selected_coins)})")
+    print(f"Raw scan of documents: {', '.join(raw_scan_types) or 'none'}")
+    print(f"Media scan: {', '.join(f'{name} {policy}' for name, policy in scan_policies.items())}")
     if args.xlsx:
         print("CSV output will be converted to Excel format.")
     print()
-    return args.path, args.maxfilesize[0], args.excludepaths, args.temppath, args.xlsx
+    Process.prefilters_enabled = not args.noprefilters
+    Process.select_patterns(PatternProfiles.coin_descriptions(selected_coins))
+    FileType.set_raw_scan(raw_scan_types)
+    FileType.set_scan_policies(scan_policies)
+    return args.path, args.maxfilesize[0], args.excludepaths, args.temppath, args.xlsx, args.memorybudget[0], args.scancache, args.cachehash, args.image
+
+
+def import_time(module_name):
+    # Cumulative import time of a module in a new interpreter in microseconds, like a spawned pool worker pays it.
+    # Read from the python -X importtime output, None if the module can't be imported
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module_name}'], capture_output=True,
+                            text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    if result.returncode != 0:
+        return None
+    for line in result.stderr.splitlines():
+        columns = line.split('|')
+        if len(columns) == 3 and columns[2].strip() == module_name and columns[1].strip().isdigit():
+            return int(columns[1])
+    return None
+
+
+def import_time_report():
+    print("Import times in a new interpreter:")
+    print(f"{'Startup (Cryptoscan)':<28}{import_time('Cryptoscan') / 1000:>10.1f} ms")
+    print(f"{'Pool worker (Process)':<28}{import_time('Process') / 1000:>10.1f} ms")
+    print("Loaded on first use:")
+    for module_name in lazy_modules:
+        module_time = import_time(module_name)
+        print(f"{module_name:<28}{'not installed' if module_time is None else f'{module_time / 1000:.1f} ms':>13}")
 
 
 def convert_csv_to_excel(csv_filename):
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
     wb = Workbook()
     ws = wb.active
 
@@ -235,17 +451,33 @@ if __name__ == '__main__':
 
     arguments = usage_and_arguments()
 
-    searchpath, maxfilesize, excludedpaths, temppath, xlsx_check = arguments
+    searchpath, maxfilesize, excludedpaths, temppath, xlsx_check, memorybudget, scancache, cachehash, diskimage = arguments
+
+    memory_budget = MemoryBudget(memorybudget)
+    scan_cache = ScanCache(scancache, Process.pattern_set_version(), cachehash) if scancache else None
 
     starttime = time.perf_counter()
 
-    startprocessing(searchpath, maxfilesize, excludedpaths, statistics, temppath)
+    startprocessing(searchpath, maxfilesize, excludedpaths, statistics, temppath, memory_budget, scan_cache, diskimage)
+    if scan_cache:
+        scan_cache.close()
 
     print()
     print(f"Processing took: {str(datetime.timedelta(seconds=int(time.perf_counter() - starttime)))} processing time")
     print(f"Addresses found: {statistics.count_addresses}")
     print(f"Seed strings found: {statistics.count_seedstrings}")
     print(f"Processed {statistics.processed_files_count} ({convertbytesint_to_sizestring(statistics.total_bytes_processed)}) non-excluded files.")
+    print(f"Peak memory budget use: {memory_budget.peak_printable()}")
+    print(f"Skipped {statistics.duplicate_files_count} files with the same content as a scanned file.")
+    if statistics.prefilter_counts['candidates']:
+        removed_counts = ', '.join(f"{name}: {count}" for name, count in statistics.prefilter_counts.items() if name != 'candidates')
+        print(f"Pre-filters removed {sum(statistics.prefilter_counts.values()) - statistics.prefilter_counts['candidates']} "
+              f"of {statistics.prefilter_counts['candidates']} candidates ({removed_counts}).")
+    if statistics.scan_counts['skip'] or statistics.scan_counts['metadata']:
+        print(f"Media and random data files: {statistics.scan_counts['skip']} skipped, {statistics.scan_counts['metadata']} "
+              f"scanned at start and end only ({convertbytesint_to_sizestring(statistics.scan_counts['unscanned bytes'])} not scanned).")
+    if scan_cache:
+        print(f"Replayed {statistics.cached_files_count} unchanged files from the scan cache.")
     print()
     print(f"Saved output to: {output_name}")
 
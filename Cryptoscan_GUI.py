@@ -8,6 +8,8 @@ from PyQt5.QtGui import QFont, QIntValidator
 from PyQt5.QtWidgets import QApplication, QCheckBox, QComboBox, QFileDialog, QGroupBox, QHBoxLayout, QInputDialog, \
     QLabel, QLineEdit, QListWidget, QPushButton, QSpacerItem, QTextBrowser, QVBoxLayout, QWidget
 
+import PatternProfiles
+
 
 class CryptoscanThread(QThread):
     output_received = pyqtSignal(str)
@@ -124,6 +126,11 @@ class CryptoscanGUI(QWidget):
         self.xlsx_label.setFixedWidth(162)
         self.xlsx_checkbox = QCheckBox()
 
+        self.image_label = QLabel('Read as Disk Image:')
+        self.image_label.setFont(self.label_font)
+        self.image_label.setFixedWidth(162)
+        self.image_checkbox = QCheckBox()
+
         self.max_size_label = QLabel('Max File Size:')
         self.max_size_label.setFont(self.label_font)
         self.max_size_label.setFixedWidth(162)
@@ -145,6 +152,26 @@ class CryptoscanGUI(QWidget):
         self.remove_path_button.setFont(self.button_font)
         self.remove_path_button.setMaximumWidth(190)
 
+        self.profile_label = QLabel('Pattern Profile:')
+        self.profile_label.setFont(self.label_font)
+        self.profile_label.setFixedWidth(162)
+        self.profile_combobox = QComboBox()
+        self.profile_combobox.setMinimumWidth(140)
+        self.profile_combobox.currentTextChanged.connect(self.update_coin_checkboxes)
+        self.profile_file_edit = QLineEdit()
+        self.profile_file_edit.setPlaceholderText("Select profile file (optional)")
+        self.profile_file_edit.setReadOnly(True)
+        self.profile_browse_button = QPushButton('Browse Profile File', clicked=self.browse_profile_file)
+        self.profile_browse_button.setFont(self.button_font)
+        self.profile_browse_button.setMaximumWidth(180)
+
+        self.coins_label = QLabel('Coins:')
+        self.coins_label.setFont(self.label_font)
+        self.coins_label.setFixedWidth(162)
+        self.coin_checkboxes = {coin: QCheckBox(coin) for coin in PatternProfiles.coins}
+        self.profiles = PatternProfiles.profiles
+        self.load_profiles()
+
         self.run_button = QPushButton('Run Cryptoscan', clicked=self.run_stop_cryptoscan)
         self.run_button.setFont(self.button_font)
         self.run_button.setObjectName('runButton')
@@ -161,7 +188,7 @@ class CryptoscanGUI(QWidget):
         layout = QVBoxLayout(self)
 
         self.add_widgets_to_layout(layout)
-        self.setGeometry(100, 100, 1000, 950)
+        self.setGeometry(100, 100, 1000, 1020)
         self.setWindowTitle('Cryptoscan GUI')
         self.show()
 
@@ -185,12 +212,29 @@ class CryptoscanGUI(QWidget):
         xlsx_checkbox_layout.addWidget(self.xlsx_checkbox)
         xlsx_checkbox_layout.addStretch()
 
+        image_checkbox_layout = QHBoxLayout()
+        image_checkbox_layout.addWidget(self.image_label)
+        image_checkbox_layout.addWidget(self.image_checkbox)
+        image_checkbox_layout.addStretch()
+
         max_size_layout = QHBoxLayout()
         max_size_layout.addWidget(self.max_size_label)
         max_size_layout.addWidget(self.max_size_edit)
         max_size_layout.addWidget(self.size_unit_combobox)
         max_size_layout.addStretch()
 
+        profile_layout = QHBoxLayout()
+        profile_layout.addWidget(self.profile_label)
+        profile_layout.addWidget(self.profile_combobox)
+        profile_layout.addWidget(self.profile_file_edit)
+        profile_layout.addWidget(self.profile_browse_button)
+
+        coins_layout = QHBoxLayout()
+        coins_layout.addWidget(self.coins_label)
+        for coin_checkbox in self.coin_checkboxes.values():
+            coins_layout.addWidget(coin_checkbox)
+        coins_layout.addStretch()
+
         exclude_layout = QHBoxLayout()
         exclude_layout.addWidget(self.exclude_label)
         exclude_layout.addWidget(self.exclude_list)
@@ -222,13 +266,16 @@ class CryptoscanGUI(QWidget):
         optional_group_box = QGroupBox()
         optional_group_layout = QVBoxLayout()
         optional_group_layout.addLayout(xlsx_checkbox_layout)
+        optional_group_layout.addLayout(image_checkbox_layout)
         optional_group_layout.addLayout(max_size_layout)
+        optional_group_layout.addLayout(profile_layout)
+        optional_group_layout.addLayout(coins_layout)
         optional_group_layout.addLayout(exclude_layout)
         optional_group_layout.addLayout(exclude_layout_buttons)
         optional_group_layout.addLayout(temp_path_layout)
         optional_group_layout.addLayout(temp_path_layout_button)
         optional_group_box.setLayout(optional_group_layout)
-        optional_group_box.setFixedHeight(300)
+        optional_group_box.setFixedHeight(370)
         optional_group_box.setStyleSheet("""
             QGroupBox {
                 font-weight: bold;
@@ -259,6 +306,32 @@ class CryptoscanGUI(QWidget):
         if folder_path:
             self.temp_path_edit.setText(folder_path)
 
+    def browse_profile_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Profile File", filter="JSON files (*.json)", options=QFileDialog.DontUseNativeDialog)
+        if file_path:
+            self.profile_file_edit.setText(file_path)
+            self.load_profiles()
+
+    def load_profiles(self):
+        try:
+            self.profiles = PatternProfiles.load_profiles(self.profile_file_edit.text())
+        except ValueError as err:
+            self.output_browser.append(f"Error: {err}")
+            self.profile_file_edit.clear()
+            self.profiles = PatternProfiles.profiles
+
+        current_profile = self.profile_combobox.currentText() or PatternProfiles.default_profile
+        self.profile_combobox.blockSignals(True)
+        self.profile_combobox.clear()
+        self.profile_combobox.addItems(list(self.profiles))
+        self.profile_combobox.setCurrentText(current_profile)
+        self.profile_combobox.blockSignals(False)
+        self.update_coin_checkboxes(self.profile_combobox.currentText())
+
+    def update_coin_checkboxes(self, profile_name):
+        for coin, coin_checkbox in self.coin_checkboxes.items():
+            coin_checkbox.setChecked(coin in self.profiles.get(profile_name, []))
+
     def browse_and_add_path(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Directory", options=QFileDialog.DontUseNativeDialog)
         if folder_path:
@@ -281,6 +354,13 @@ class CryptoscanGUI(QWidget):
             temp_path = self.temp_path_edit.text()
 
             convert_to_xlsx = self.xlsx_checkbox.isChecked()
+            disk_image = self.image_checkbox.isChecked()
+
+            profile_name = self.profile_combobox.currentText()
+            profile_file = self.profile_file_edit.text()
+            checked_coins = [coin for coin, coin_checkbox in self.coin_checkboxes.items() if coin_checkbox.isChecked()]
+            enabled_coins = [coin for coin in checked_coins if coin not in self.profiles[profile_name]]
+            disabled_coins = [coin for coin in self.profiles[profile_name] if coin not in checked_coins]
 
             command = [sys.executable, 'Cryptoscan.py', search_path]
             if use_max_size:
@@ -289,8 +369,17 @@ class CryptoscanGUI(QWidget):
                 command.extend(['--excludepaths'] + excluded_paths)
             if convert_to_xlsx:
                 command.extend(['--xlsx'])
+            if disk_image:
+                command.extend(['--image'])
             if temp_path:
                 command.extend(['--temppath', temp_path])
+            command.extend(['--profile', profile_name])
+            if profile_file:
+                command.extend(['--profilefile', profile_file])
+            if enabled_coins:
+                command.extend(['--coins'] + enabled_coins)
+            if disabled_coins:
+                command.extend(['--nocoins'] + disabled_coins)
 
             self.thread.set_command(command)
             self.thread.start()
@@ -0,0 +1,63 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from FileHandler import FileHandler
+
+walker_threads = 8  # Directories are listed in parallel, which mostly pays off on network shares
+
+
+def excluded_directory(directory_path, excluded_paths):
+    # Every file below a directory contains the directory path, so a matching exclusion rule excludes all of them
+    for path in excluded_paths:
+        if path in directory_path:
+            print(f"{directory_path.replace(chr(92), '/')} is excluded due to exclusion path rule: {path}")
+            return True
+    return False
+
+
+def scan_directory(directory_path, excluded_paths, max_filesize):
+    subdirectories = []
+    files = []
+    try:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink() and not excluded_directory(entry.path, excluded_paths):
+                            subdirectories.append(entry.path)
+                        continue
+
+                    file_instance = FileHandler(entry.path)
+                    if file_instance.check_if_excluded(excluded_paths):
+                        continue
+                    file_stat = entry.stat()
+                    if file_instance.sizecheck(file_stat.st_size, max_filesize):
+                        continue
+                    files.append((entry.path, file_stat.st_size, file_stat.st_mtime))
+
+                except OSError as err:
+                    print(f"Error reading {entry.path}: {err}")
+
+    except OSError as err:
+        print(f"Error reading directory {directory_path}: {err}")
+
+    return subdirectories, files
+
+
+def walk_files(path, excluded_paths, max_filesize):
+    # Returns (path, size, mtime) for every file below path that isn't excluded and fits the size limits
+    files = []
+    if excluded_directory(path, excluded_paths):
+        return files
+
+    with ThreadPoolExecutor(walker_threads) as executor:
+        pending = {executor.submit(scan_directory, path, excluded_paths, max_filesize)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                subdirectories, directory_files = future.result()
+                files.extend(directory_files)
+                for subdirectory in subdirectories:
+                    pending.add(executor.submit(scan_directory, subdirectory, excluded_paths, max_filesize))
+
+    return files
@@ -1,31 +1,41 @@
 import os
+from contextlib import contextmanager
+from io import BytesIO
 from mmap import ACCESS_READ, mmap
 
-import fitz  # install openpyxl
-import pandas  # install PyMuPDF
-from bs4 import BeautifulSoup
-from docx2python import docx2python
-from striprtf.striprtf import rtf_to_text
+import FileType
+import HTMLReader
+import OOXMLReader
 
 excluded_filenames = 'ChromeExtMalware.store'  # Excluded because of false positives
 
+# The document readers import their libraries on first use, these take seconds to import and every pool worker would
+# pay for them at start even if it never reads a document
+
 
 class FileHandler:
     """
     FileHandler takes a file as input and deals with all file related parts.
+    file_data holds the content of files that are only in memory, like archive members.
     """
-    def __init__(self, file_path):
+    def __init__(self, file_path, file_data=None):
         self.file_path = file_path
         self.file_path_printable = file_path.replace("\\", "/")
+        self.file_data = file_data
+        self.offset_map = None  # Set by readers that can map the extracted text back to offsets in the file
+        self.file_type = None
 
     def getfilesize(self):
+        if self.file_data is not None:
+            return len(self.file_data)
         try:
             return os.path.getsize(self.file_path)
         except:
             return 0
 
-    def getfilesize_printable(self):
-        file_size = self.getfilesize()
+    def getfilesize_printable(self, file_size=None):
+        if file_size is None:
+            file_size = self.getfilesize()
         for unit in ['B', 'KB', 'MB', 'GB']:
             if file_size < 1024.0:
                 break
@@ -44,17 +54,19 @@ class FileHandler:
         return False
 
     def filecheck(self, inputfilesize):
-        if not os.path.exists(self.file_path):
+        if self.file_data is None and not os.path.exists(self.file_path):
             print(self.file_path_printable + " doesn't exist.")
             return True
 
-        file_size = self.getfilesize()
+        return self.sizecheck(self.getfilesize(), inputfilesize)
+
+    def sizecheck(self, file_size, inputfilesize):
         if file_size < 15:
             print(self.file_path_printable + " is too small. Size: " + str(file_size) + "B")
             return True
 
         if file_size >= inputfilesize:
-            print(self.file_path_printable + " is too large. Size: " + self.getfilesize_printable())
+            print(self.file_path_printable + " is too large. Size: " + self.getfilesize_printable(file_size))
             return True
 
         return False
@@ -62,65 +74,106 @@ class FileHandler:
     def getfileextension(self):
         return os.path.splitext(self.file_path)[1]
 
-    def getspecialfiledata(self):
-        if self.getfileextension() == '.docx':
-            return self.docxtobytes()
-
-        if self.getfileextension() == '.html':
-            return self.htmltobytes()
-
-        if self.getfileextension() == '.pdf':
-            return self.pdftobytes()
+    def getfiletype(self):
+        # Found from the first bytes of the file, which are only read once
+        if self.file_type is None:
+            if self.file_data is not None:
+                header = self.file_data[:FileType.sniff_size]
+            else:
+                try:
+                    with open(self.file_path, 'rb') as file:
+                        header = file.read(FileType.sniff_size)
+                except OSError:
+                    header = b''
+            self.file_type = FileType.detect_type(header, self.file_path)
+            if self.file_type.kind == 'raw' and self.getfilesize() >= FileType.entropy_file_size:
+                if FileType.is_high_entropy(self.getsamples(FileType.entropy_sample_count, FileType.entropy_sample_size)):
+                    self.file_type = FileType.file_types['entropy']
+        return self.file_type
+
+    def getsamples(self, count, size):
+        # count blocks of size bytes spread evenly over the file
+        file_size = self.getfilesize()
+        offsets = [file_size * index // count for index in range(count)]
+        if self.file_data is not None:
+            return [self.file_data[offset:offset + size] for offset in offsets]
+        samples = []
+        try:
+            with open(self.file_path, 'rb') as file:
+                for offset in offsets:
+                    file.seek(offset)
+                    samples.append(file.read(size))
+        except OSError:
+            return []
+        return samples
+
+    def getfilesource(self):
+        # Path or file object for the libraries reading special files
+        if self.file_data is not None:
+            return BytesIO(self.file_data)
+        return self.file_path
 
-        if self.getfileextension() == '.rtf':
-            return self.rtftobytes()
+    @contextmanager
+    def rawdata(self):
+        if self.file_data is not None:
+            yield self.file_data
+        else:
+            with open(self.file_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mmapfile:
+                yield mmapfile
 
-        if self.getfileextension() == '.xlsx':
-            return self.xlsxtobytes()
+    def getspecialfiledata(self):
+        # Text of a document type, see FileType.register for the extractors
+        file_type = self.getfiletype()
+        if file_type.kind == 'text':
+            return file_type.extractor(self)
 
     def docxtobytes(self):
         try:
-            return bytes(docx2python(self.file_path).text, 'utf-8')
+            return bytes(''.join(OOXMLReader.docx_text(self.getfilesource())), 'utf-8')
         except Exception as err:
             print(f"DOCX error - {self.file_path_printable}: {err}")
             return False
 
     def htmltobytes(self):
         try:
-            with open(self.file_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mmapfile:
-                soup = BeautifulSoup(mmapfile.read().decode('utf8', 'ignore'), 'html.parser')
-                return bytes(soup.get_text(strip=True), 'utf8')
+            with self.rawdata() as rawdata:
+                text, self.offset_map = HTMLReader.html_text(rawdata)
+                return text
         except Exception as err:
             print(f"HTML error - {self.file_path_printable}: {err}")
             return False
 
-    def pdftobytes(self):
+    def openpdf(self):
         try:
-            pdf = fitz.open(self.file_path)
-            pdftext = ""
-            for page in pdf:
-                pdftext += page.get_text()
-            return bytes(pdftext, 'utf-8')
+            import fitz  # install PyMuPDF
+            if self.file_data is not None:
+                return fitz.open(stream=self.file_data, filetype='pdf')
+            return fitz.open(self.file_path)
         except Exception as err:
             print(f"PDF error - {self.file_path_printable}: {err}")
             return False
 
+    def pdfpages(self, pdf, first_page=0, last_page=None):
+        # Yields the page number and text of the pages from first_page up to last_page, unreadable pages are skipped
+        last_page = pdf.page_count if last_page is None else min(last_page, pdf.page_count)
+        for page_index in range(first_page, last_page):
+            try:
+                yield page_index + 1, bytes(pdf[page_index].get_text(), 'utf-8')
+            except Exception as err:
+                print(f"PDF error - {self.file_path_printable} page {page_index + 1}: {err}")
+
     def rtftobytes(self):
         try:
-            with open(self.file_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mmapfile:
-                return bytes(rtf_to_text(mmapfile.read().decode('utf8'), errors='ignore'), 'utf-8')
+            from striprtf.striprtf import rtf_to_text
+            with self.rawdata() as rawdata:
+                return bytes(rtf_to_text(rawdata[:].decode('utf8'), errors='ignore'), 'utf-8')
         except Exception as err:
             print(f"RTF error - {self.file_path_printable}: {err}")
             return False
 
     def xlsxtobytes(self):
         try:
-            xls = pandas.ExcelFile(self.file_path)
-            text = ""
-            for sheet in xls.sheet_names:
-                text += pandas.DataFrame.to_string(
-                    pandas.read_excel(self.file_path, sheet_name=sheet, engine="openpyxl"))
-            return bytes(text, 'utf8')
+            return bytes(''.join(OOXMLReader.xlsx_text(self.getfilesource())), 'utf8')
         except Exception as err:
             print(f"XLSX error - {self.file_path_printable}: {err}")
             return False
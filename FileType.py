@@ -0,0 +1,176 @@
+import os
+import re
+import zlib
+from operator import methodcaller
+
+import ArchiveReader
+
+# Tells the type of a file from its first bytes, so renamed documents and archives are still read the right way.
+# New formats are added with register, the type decides how a file is read instead of its extension
+
+sniff_size = 8 * 1024  # Bytes read from the start of a file to find its signature
+entropy_file_size = 1024 * 1024  # Larger files without a signature are checked for random content, like encrypted data
+entropy_sample_count = 8
+entropy_sample_size = 4 * 1024
+entropy_ratio = 0.98  # Samples zlib can't shrink below this share of their size are taken as random
+scan_policies = ['skip', 'metadata', 'full']
+html_signature = re.compile(rb'(\xef\xbb\xbf)?\s*(<!--.*?-->\s*)*<(!doctype\s+html|html|head|body)[\s>]', re.IGNORECASE | re.DOTALL)
+
+
+class FileType:
+    """
+    FileType is a file format and the way Cryptoscan reads it.
+    kind is 'text' for documents extractor turns into text, 'pages' for documents extractor opens for a page by page
+    scan, 'archive' for archives, 'media' for media and random data scanned as scan_policy says and 'raw' for files
+    scanned as they are.
+    container is the type the format is stored in, a file of that type with one of the extensions is read as this type.
+    scan_raw also scans the bytes of a document as they are, for hits the extracted text doesn't have.
+    """
+    def __init__(self, name, kind, extensions, signature=None, extractor=None, container=None, scan_raw=False,
+                 scan_policy='full'):
+        self.name = name
+        self.kind = kind
+        self.extensions = extensions
+        self.signature = signature
+        self.extractor = extractor
+        self.container = container
+        self.scan_raw = scan_raw
+        self.scan_policy = scan_policy
+
+
+file_types = {}  # Signatures are checked in this order
+
+
+def register(file_type, before=None):
+    # A type stored in another type, like the Office formats in zip files, has to be registered before it
+    registered = [registered_type for registered_type in file_types.values() if registered_type.name != file_type.name]
+    position = next((index for index, registered_type in enumerate(registered) if registered_type.name == before), len(registered))
+    registered.insert(position, file_type)
+    file_types.clear()
+    file_types.update((registered_type.name, registered_type) for registered_type in registered)
+
+
+def is_zip_package(header, folder):
+    # Office files are zip packages, the names of the first parts are in the local file headers at the start
+    return header.startswith(b'PK\x03\x04') and folder in header
+
+
+def media_brand(header):
+    # MP4, QuickTime and HEIF files start with an ftyp box holding the brand of the format
+    return header[8:12] if header[4:8] == b'ftyp' else None
+
+
+def riff_format(header):
+    return header[8:12] if header.startswith(b'RIFF') else None
+
+
+def is_image(header):
+    return (header.startswith((b'\xff\xd8\xff', b'\x89PNG\r\n\x1a\n', b'GIF87a', b'GIF89a')) or riff_format(header) == b'WEBP'
+            or media_brand(header) in (b'heic', b'heix', b'mif1', b'msf1', b'avif'))
+
+
+def is_audio(header):
+    return (header.startswith((b'ID3', b'\xff\xfb', b'\xff\xf3', b'\xff\xf2', b'OggS', b'fLaC', b'#!AMR'))
+            or riff_format(header) == b'WAVE' or media_brand(header) in (b'M4A ', b'M4B '))
+
+
+def is_video(header):
+    # Checked after is_image, so every other ftyp brand is a video
+    return (header.startswith((b'\x1a\x45\xdf\xa3', b'FLV\x01')) or riff_format(header) == b'AVI '
+            or media_brand(header) is not None and not is_audio(header))
+
+
+def is_tar(header):
+    # Tar files have the ustar magic in their first header, for a .tar.gz it's at the start of the decompressed data
+    if header.startswith(b'\x1f\x8b'):
+        try:
+            header = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress(header, 512)
+        except zlib.error:
+            return False
+    return header[257:262] == b'ustar'
+
+
+def is_high_entropy(samples):
+    return bool(samples) and all(len(zlib.compress(sample, 1)) >= len(sample) * entropy_ratio for sample in samples)
+
+
+register(FileType('docx', 'text', ['.docx'], lambda header: is_zip_package(header, b'word/'), methodcaller('docxtobytes'), 'zip'))
+register(FileType('xlsx', 'text', ['.xlsx'], lambda header: is_zip_package(header, b'xl/'), methodcaller('xlsxtobytes'), 'zip'))
+register(FileType('pdf', 'pages', ['.pdf'], lambda header: b'%PDF-' in header[:1024], methodcaller('openpdf')))
+register(FileType('rtf', 'text', ['.rtf'], lambda header: header.startswith(b'{\\rtf'), methodcaller('rtftobytes')))
+register(FileType('html', 'text', ['.html', '.htm'], lambda header: html_signature.match(header) is not None,
+                  methodcaller('htmltobytes'), 'raw', True))
+register(FileType('zip', 'archive', [], lambda header: header.startswith((b'PK\x03\x04', b'PK\x05\x06'))))
+register(FileType('tar', 'archive', [], is_tar))
+register(FileType('gzip', 'archive', [], lambda header: header.startswith(b'\x1f\x8b')))
+register(FileType('rar', 'archive', [], lambda header: header.startswith(b'Rar!\x1a\x07')))
+register(FileType('7z', 'archive', [], lambda header: header.startswith(b'7z\xbc\xaf\x27\x1c')))
+register(FileType('image', 'media', [], is_image, scan_policy='metadata'))
+register(FileType('video', 'media', [], is_video, scan_policy='metadata'))
+register(FileType('audio', 'media', [], is_audio, scan_policy='metadata'))
+register(FileType('entropy', 'media', [], scan_policy='metadata'))  # Set by FileHandler.getfiletype from samples
+register(FileType('raw', 'raw', []))
+
+for archive_extension, archive_format in ArchiveReader.archive_formats.items():
+    file_types[archive_format].extensions.append(archive_extension)
+
+
+def extension_type(file_path):
+    extension = os.path.splitext(file_path)[1].lower()
+    return next((file_type for file_type in file_types.values() if extension in file_type.extensions), file_types['raw'])
+
+
+def detect_type(header, file_path):
+    # The type of the first signature found in header. A file of the container of its extension's type, like a zip
+    # file named .docx, is read as the type of the extension
+    found_type = next((file_type for file_type in file_types.values() if file_type.signature and file_type.signature(header)),
+                      file_types['raw'])
+    named_type = extension_type(file_path)
+    if named_type.container == found_type.name:
+        return named_type
+    return found_type
+
+
+def document_types():
+    return [file_type.name for file_type in file_types.values() if file_type.kind in ('text', 'pages')]
+
+
+def raw_scan_types():
+    return [file_type.name for file_type in file_types.values() if file_type.scan_raw]
+
+
+def select_raw_scan(enabled_types=(), disabled_types=()):
+    # The document types to scan as raw bytes too, the defaults with enabled_types added and disabled_types removed
+    enabled_types = [name.lower() for name in enabled_types]
+    disabled_types = [name.lower() for name in disabled_types]
+    unknown_types = [name for name in enabled_types + disabled_types if name not in document_types()]
+    if unknown_types:
+        raise ValueError(f"Unknown document types {unknown_types}, known types are {document_types()}")
+    return [name for name in document_types() if (name in raw_scan_types() or name in enabled_types) and name not in disabled_types]
+
+
+def media_types():
+    return [file_type.name for file_type in file_types.values() if file_type.kind == 'media']
+
+
+def select_scan_policies(settings=()):
+    # Scan policy per media type from settings like 'video=skip', on top of the defaults
+    selected = {name: file_types[name].scan_policy for name in media_types()}
+    for setting in settings:
+        name, separator, policy = setting.lower().partition('=')
+        if name not in selected or policy not in scan_policies:
+            raise ValueError(f"Invalid media scan setting '{setting}', use type=policy with a type of {media_types()} "
+                             f"and a policy of {scan_policies}")
+        selected[name] = policy
+    return selected
+
+
+def set_scan_policies(policies):
+    for name, policy in policies.items():
+        file_types[name].scan_policy = policy
+
+
+def set_raw_scan(type_names):
+    # Set in the pool workers too, see Cryptoscan.init_worker
+    for file_type in file_types.values():
+        file_type.scan_raw = file_type.name in type_names
@@ -0,0 +1,63 @@
+import html
+import re
+
+from OffsetMap import OffsetMap
+
+# Comments, script and style blocks, doctypes and processing instructions are dropped with their content. Tags are
+# dropped, the name is kept to tell inline tags from the ones that separate words
+token_pattern = re.compile(rb'<!--.*?(?:-->|$)|<(script|style)\b[^>]*>.*?(?:</\1\s*>|$)|<[!?][^>]*>|</?([a-zA-Z][a-zA-Z0-9]*)\b[^>]*>',
+                           re.DOTALL | re.IGNORECASE)
+# Whitespace that isn't a single space and character references, the only parts of the text that change length
+rewrite_pattern = re.compile(rb'\s{2,}|[\t\n\r\f\v]|&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[a-zA-Z][a-zA-Z0-9]{1,31});?')
+inline_tags = {b'a', b'abbr', b'b', b'bdi', b'bdo', b'cite', b'code', b'data', b'dfn', b'em', b'font', b'i', b'kbd',
+               b'mark', b'q', b's', b'samp', b'small', b'span', b'strong', b'sub', b'sup', b'time', b'u', b'var', b'wbr'}
+
+
+def add_text(text_parts, text_length, offset_map, rawdata, start, end):
+    # Adds rawdata[start:end] with whitespace runs collapsed to one space and character references decoded. The offset
+    # map gets an entry wherever the text and the source stop lining up. Returns the new text length
+    offset_map.add(text_length, start)
+    position = start
+    for rewrite in rewrite_pattern.finditer(rawdata, start, end):
+        if rewrite.start() > position:
+            text_parts.append(rawdata[position:rewrite.start()])
+            text_length += rewrite.start() - position
+        replacement = rewrite.group()
+        if replacement.startswith(b'&'):
+            replacement = html.unescape(replacement.decode('ascii')).replace('\xa0', ' ').encode('utf-8')
+        else:
+            replacement = b' '
+        text_parts.append(replacement)
+        text_length += len(replacement)
+        position = rewrite.end()
+        offset_map.add(text_length, position)
+
+    if end > position:
+        text_parts.append(rawdata[position:end])
+        text_length += end - position
+    return text_length
+
+
+def html_text(rawdata):
+    # Returns the text of an HTML document as bytes and an OffsetMap back to rawdata. Text around a tag that isn't
+    # an inline tag is separated by a line break, so words in different cells or paragraphs don't run together
+    text_parts = []
+    text_length = 0
+    offset_map = OffsetMap()
+    position = 0
+    separated = True
+
+    for token in token_pattern.finditer(rawdata):
+        if token.start() > position:
+            text_length = add_text(text_parts, text_length, offset_map, rawdata, position, token.start())
+            separated = False
+        tag_name = token.group(2)
+        if not separated and (tag_name is None or tag_name.lower() not in inline_tags):
+            text_parts.append(b'\n')
+            text_length += 1
+            separated = True
+        position = token.end()
+
+    if len(rawdata) > position:
+        add_text(text_parts, text_length, offset_map, rawdata, position, len(rawdata))
+    return b''.join(text_parts), offset_map
@@ -0,0 +1,188 @@
+import os
+import posixpath
+from bisect import bisect_right
+from functools import lru_cache
+from io import BufferedReader, RawIOBase
+
+# Reads disk images with The Sleuth Kit, which knows the DOS and GPT partition tables and the FAT, exFAT, NTFS, HFS+
+# and ext file systems. pytsk3 is imported on first use, pyewf is only needed for EWF (.E01) images
+
+ewf_extensions = ['.e01', '.ex01']
+
+
+class ImageFile:
+    """
+    ImageFile is a file in a file system of a disk image.
+    runs are the (file offset, image offset, length) of the file data on the image, empty for files stored in the
+    records of the file system itself, like resident NTFS files.
+    """
+    def __init__(self, path, inode, size, runs):
+        self.path = path
+        self.inode = inode
+        self.size = size
+        self.runs = runs
+
+    def image_offset(self, file_offset):
+        index = bisect_right([run[0] for run in self.runs], file_offset) - 1
+        if index < 0 or file_offset >= self.runs[index][0] + self.runs[index][2]:
+            return None
+        return self.runs[index][1] + file_offset - self.runs[index][0]
+
+    def data_ranges(self):
+        # Image ranges holding the file data. The rest of the last block is file slack, which still holds what was
+        # there before, so it's scanned with the unused space
+        return [(image_offset, image_offset + min(length, self.size - file_offset)) for file_offset, image_offset, length in self.runs
+                if file_offset < self.size]
+
+
+class ImageFileReader(RawIOBase):
+    """
+    ImageFileReader reads a file of a disk image like a file on disk, so it can be read whole or spilled to a temp file
+    like an archive member.
+    """
+    def __init__(self, file_object, size):
+        self.file_object = file_object
+        self.size = size
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        length = min(len(buffer), self.size - self.position)
+        if length <= 0:
+            return 0
+        data = self.file_object.read_random(self.position, length)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+    def readall(self):
+        data = self.file_object.read_random(self.position, self.size - self.position) if self.position < self.size else b''
+        self.position += len(data)
+        return data
+
+
+def open_image(image_path):
+    import pytsk3
+    if os.path.splitext(image_path)[1].lower() not in ewf_extensions:
+        return pytsk3.Img_Info(image_path)
+
+    import pyewf
+
+    class EWFImage(pytsk3.Img_Info):
+        def __init__(self, ewf_handle):
+            self.ewf_handle = ewf_handle
+            super().__init__(url='', type=pytsk3.TSK_IMG_TYPE_EXTERNAL)
+
+        def close(self):
+            self.ewf_handle.close()
+
+        def read(self, offset, size):
+            self.ewf_handle.seek(offset)
+            return self.ewf_handle.read(size)
+
+        def get_size(self):
+            return self.ewf_handle.get_media_size()
+
+    ewf_handle = pyewf.handle()
+    ewf_handle.open(pyewf.glob(image_path))  # All segments, .E01, .E02 and so on
+    return EWFImage(ewf_handle)
+
+
+@lru_cache(maxsize=2)
+def cached_image(image_path):
+    # Workers keep the images they read from open, like ArchiveReader.cached_zipfile
+    return open_image(image_path)
+
+
+@lru_cache(maxsize=8)
+def cached_filesystem(image_path, partition_offset):
+    import pytsk3
+    return pytsk3.FS_Info(cached_image(image_path), offset=partition_offset)
+
+
+def image_size(image_path):
+    return cached_image(image_path).get_size()
+
+
+def read_image(image_path, offset, length):
+    return cached_image(image_path).read(offset, min(length, image_size(image_path) - offset))
+
+
+def partitions(image_path):
+    # (number, image offset, length) of the partitions, or of the whole image when it has no partition table
+    import pytsk3
+    image = cached_image(image_path)
+    try:
+        volume = pytsk3.Volume_Info(image)
+    except IOError:
+        return [(1, 0, image.get_size())]
+
+    block_size = volume.info.block_size
+    allocated = [part for part in volume if part.flags & pytsk3.TSK_VS_PART_FLAG_ALLOC]
+    return [(number, part.start * block_size, part.len * block_size) for number, part in enumerate(allocated, 1)]
+
+
+def data_runs(entry, partition_offset, block_size):
+    import pytsk3
+    runs = []
+    try:
+        for attribute in entry:
+            if (attribute.info.type in (pytsk3.TSK_FS_ATTR_TYPE_DEFAULT, pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA)
+                    and attribute.info.name in (None, b'', b'$Data')):
+                if attribute.info.flags & pytsk3.TSK_FS_ATTR_NONRES:
+                    for run in attribute:
+                        if not run.flags & (pytsk3.TSK_FS_ATTR_RUN_FLAG_SPARSE | pytsk3.TSK_FS_ATTR_RUN_FLAG_FILLER):
+                            runs.append((run.offset * block_size, partition_offset + run.addr * block_size, run.len * block_size))
+                break
+    except IOError:
+        return []
+    return sorted(runs)
+
+
+def image_files(image_path, partition_offset):
+    # Yields the allocated regular files of the file system at partition_offset. Deleted files are left to the scan of
+    # the unused space, their data is only there as long as it isn't overwritten
+    import pytsk3
+    filesystem = cached_filesystem(image_path, partition_offset)
+    block_size = filesystem.info.block_size
+    visited = set()
+    directories = [('', filesystem.open_dir(path='/'))]
+    while directories:
+        directory_path, directory = directories.pop()
+        for entry in directory:
+            name = entry.info.name.name.decode('utf-8', 'replace')
+            meta = entry.info.meta
+            if name in ('.', '..', '$OrphanFiles') or meta is None:
+                continue
+            if not entry.info.name.flags & pytsk3.TSK_FS_NAME_FLAG_ALLOC or not meta.flags & pytsk3.TSK_FS_META_FLAG_ALLOC:
+                continue
+
+            path = posixpath.join(directory_path, name)
+            if meta.type == pytsk3.TSK_FS_META_TYPE_DIR and meta.addr not in visited:
+                visited.add(meta.addr)
+                try:
+                    directories.append((path, entry.as_directory()))
+                except IOError as err:
+                    print(f"Error reading directory {path}: {err}")
+            elif meta.type == pytsk3.TSK_FS_META_TYPE_REG:
+                yield ImageFile(path, meta.addr, meta.size, data_runs(entry, partition_offset, block_size))
+
+
+def open_file(image_path, partition_offset, inode, size):
+    file_object = cached_filesystem(image_path, partition_offset).open_meta(inode=inode)
+    return BufferedReader(ImageFileReader(file_object, size), 1024 * 1024)
+
+
+def unused_ranges(used_ranges, size):
+    # Parts of the image from 0 to size that aren't in used_ranges
+    ranges = []
+    position = 0
+    for start, end in sorted(used_ranges):
+        if start > position:
+            ranges.append((position, min(start, size)))
+        position = max(position, end)
+    if position < size:
+        ranges.append((position, size))
+    return [(start, end) for start, end in ranges if end > start]
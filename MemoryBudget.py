@@ -0,0 +1,44 @@
+import multiprocessing
+from contextlib import contextmanager
+
+
+def convertbytesint_to_sizestring(size_int):
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size_int < 1024.0:
+            break
+        size_int /= 1024.0
+    return f"{size_int:.{0}f}{unit}"
+
+
+class MemoryBudget:
+    """
+    MemoryBudget is a memory limit shared by all pool workers. Scans that need a lot of memory lease their share
+    before they start and wait while the rest of the budget is leased by other workers.
+    """
+    def __init__(self, budget):
+        self.budget = budget
+        self.in_use = multiprocessing.Value('q', 0)
+        self.peak = multiprocessing.Value('q', 0)
+        self.condition = multiprocessing.Condition(self.in_use.get_lock())
+
+    @contextmanager
+    def lease(self, size, name):
+        size = min(size, self.budget)  # A single scan larger than the budget still gets to run on its own
+        with self.condition:
+            if self.in_use.value and self.in_use.value + size > self.budget:
+                print(f"Waiting for memory budget for {name} ({self.usage_printable()})")
+                self.condition.wait_for(lambda: not self.in_use.value or self.in_use.value + size <= self.budget)
+            self.in_use.value += size
+            self.peak.value = max(self.peak.value, self.in_use.value)
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.in_use.value -= size
+                self.condition.notify_all()
+
+    def usage_printable(self):
+        return f"{convertbytesint_to_sizestring(self.in_use.value)} of {convertbytesint_to_sizestring(self.budget)} in use"
+
+    def peak_printable(self):
+        return f"{convertbytesint_to_sizestring(self.peak.value)} of {convertbytesint_to_sizestring(self.budget)}"
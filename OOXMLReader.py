@@ -0,0 +1,149 @@
+import posixpath
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+
+# Reads the text of Office Open XML files straight from the XML parts of the zip package. The parts are parsed as a
+# stream and every element is dropped once it's read, so memory doesn't grow with the size of a sheet or document
+
+# Parts of a Word document with text, the document itself first
+docx_part_pattern = re.compile(r'word/(document|header[0-9]*|footer[0-9]*|footnotes|endnotes|comments)\.xml')
+docx_text_tags = {'t', 'delText'}  # delText is text removed with track changes on, it's still in the file
+docx_break_tags = {'tab': '\t', 'br': '\n', 'cr': '\n'}
+docx_paragraph_tags = {'p'}
+
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def relationship_targets(package, rels_path):
+    # Maps relationship ids to the part paths they point to, relative to the folder of the part the rels belong to
+    part_folder = posixpath.dirname(posixpath.dirname(rels_path))
+    targets = {}
+    if rels_path not in package.namelist():
+        return targets
+    with package.open(rels_path) as rels_file:
+        for event, element in iterparse(rels_file):
+            if local_name(element.tag) == 'Relationship':
+                target = element.get('Target', '')
+                if target.startswith('/'):
+                    targets[element.get('Id')] = target.lstrip('/')
+                else:
+                    targets[element.get('Id')] = posixpath.normpath(posixpath.join(part_folder, target))
+    return targets
+
+
+def xlsx_shared_strings(package):
+    shared_strings = []
+    if 'xl/sharedStrings.xml' not in package.namelist():
+        return shared_strings
+
+    with package.open('xl/sharedStrings.xml') as strings_file:
+        string_parts = []
+        in_phonetic = False  # Phonetic hints of East Asian text have their own t elements, they aren't in the string
+        parts = iterparse(strings_file, ('start', 'end'))
+        event, root = next(parts)
+        for event, element in parts:
+            tag = local_name(element.tag)
+            if tag == 'rPh':
+                in_phonetic = event == 'start'
+            elif event == 'start':
+                continue
+            elif tag == 't' and not in_phonetic:
+                string_parts.append(element.text or '')
+            elif tag == 'si':
+                shared_strings.append(''.join(string_parts))
+                string_parts.clear()
+                root.clear()
+    return shared_strings
+
+
+def xlsx_sheet_paths(package):
+    # Worksheets in the order of the workbook
+    relationships = relationship_targets(package, 'xl/_rels/workbook.xml.rels')
+    sheet_paths = []
+    with package.open('xl/workbook.xml') as workbook_file:
+        for event, element in iterparse(workbook_file):
+            if local_name(element.tag) == 'sheet':
+                relationship_id = next((value for key, value in element.attrib.items() if local_name(key) == 'id'), None)
+                if relationship_id in relationships:
+                    sheet_paths.append(relationships[relationship_id])
+    return [sheet_path for sheet_path in sheet_paths if sheet_path in package.namelist()]
+
+
+def xlsx_rows(package, sheet_path, shared_strings):
+    # Yields the cell values of every row of a sheet
+    row = []
+    sheet_data = None
+    cell_type = None
+    cell_value = None
+    inline_parts = []
+
+    with package.open(sheet_path) as sheet_file:
+        for event, element in iterparse(sheet_file, ('start', 'end')):
+            tag = local_name(element.tag)
+            if event == 'start':
+                if tag == 'c':
+                    cell_type = element.get('t')
+                    cell_value = None
+                    inline_parts.clear()
+                elif tag == 'sheetData':
+                    sheet_data = element
+                continue
+
+            if tag == 'v':
+                cell_value = element.text
+            elif tag == 't':
+                inline_parts.append(element.text or '')
+            elif tag == 'c':
+                if cell_type == 's' and cell_value is not None:
+                    cell_value = shared_strings[int(cell_value)]
+                elif cell_type == 'inlineStr':
+                    cell_value = ''.join(inline_parts)
+                if cell_value:
+                    row.append(cell_value)
+            elif tag == 'row':
+                if row:
+                    yield row
+                row = []
+                if sheet_data is not None:
+                    sheet_data.clear()
+
+
+def xlsx_text(source):
+    # Yields the text of a workbook row by row, cells separated by a tab
+    with zipfile.ZipFile(source, 'r') as package:
+        shared_strings = xlsx_shared_strings(package)
+        for sheet_path in xlsx_sheet_paths(package):
+            for row in xlsx_rows(package, sheet_path, shared_strings):
+                yield '\t'.join(row) + '\n'
+
+
+def part_text(package, part_path, text_tags, break_tags, paragraph_tags):
+    # Yields the text of an XML part paragraph by paragraph. text_tags hold text, break_tags stand for a tab or line
+    # break, paragraph_tags end a paragraph
+    paragraph = []
+    with package.open(part_path) as part_file:
+        for event, element in iterparse(part_file):
+            tag = local_name(element.tag)
+            if tag in text_tags:
+                paragraph.append(element.text or '')
+            elif tag in break_tags:
+                paragraph.append(break_tags[tag])
+            elif tag in paragraph_tags:
+                if paragraph:
+                    yield ''.join(paragraph) + '\n'
+                paragraph = []
+                element.clear()
+    if paragraph:
+        yield ''.join(paragraph) + '\n'
+
+
+def docx_text(source):
+    # Yields the text of a Word document and its headers, footers, notes and comments, one line per paragraph
+    with zipfile.ZipFile(source, 'r') as package:
+        part_paths = sorted((part_path for part_path in package.namelist() if docx_part_pattern.fullmatch(part_path)),
+                            key=lambda part_path: part_path != 'word/document.xml')
+        for part_path in part_paths:
+            yield from part_text(package, part_path, docx_text_tags, docx_break_tags, docx_paragraph_tags)
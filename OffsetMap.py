@@ -0,0 +1,24 @@
+from bisect import bisect_right
+
+
+class OffsetMap:
+    """
+    OffsetMap maps offsets in text extracted from a file back to offsets in the file. Each piece of text is added
+    with the file offset it starts at, offsets inside a piece are counted on from there.
+    """
+    def __init__(self):
+        self.text_starts = []
+        self.source_starts = []
+
+    def add(self, text_start, source_start):
+        if self.text_starts and self.text_starts[-1] == text_start:
+            self.source_starts[-1] = source_start
+        else:
+            self.text_starts.append(text_start)
+            self.source_starts.append(source_start)
+
+    def source_offset(self, text_offset):
+        piece = bisect_right(self.text_starts, text_offset) - 1
+        if piece < 0:
+            return text_offset
+        return self.source_starts[piece] + text_offset - self.text_starts[piece]
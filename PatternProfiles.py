@@ -0,0 +1,61 @@
+import json
+
+# Pattern descriptions per coin, see Process.all_patterns. SEED also enables the seed word sequence search
+coins = {
+    'BTC': ['Bitcoin Address', 'Bitcoin Address P2SH', 'Bitcoin Address Bech32', 'BIP32 HD wallet private node',
+            'BIP32 HD wallet public node', 'BIP38 Encrypted Private Key', 'WIF Private key compressed public key',
+            'WIF Private key uncompressed public key'],
+    'BCH': ['Bitcoin Cash Address'],
+    'ETH': ['Ethereum Address'],
+    'XMR': ['Monero Address'],
+    'DASH': ['DASH Address'],
+    'DOGE': ['DOGE Address'],
+    'NEO': ['NEO Address'],
+    'XRP': ['Ripple Address'],
+    'SEED': ['BIP-39 Seed String'],
+}
+
+profiles = {
+    'all': list(coins),
+    'addresses': [coin for coin in coins if coin != 'SEED'],
+    'bitcoin': ['BTC', 'BCH', 'SEED'],
+    'seeds': ['SEED'],
+}
+default_profile = 'all'
+
+
+def check_coins(coin_list):
+    unknown_coins = [coin for coin in coin_list if coin not in coins]
+    if unknown_coins:
+        raise ValueError(f"Unknown coins {unknown_coins}, known coins are {list(coins)}")
+    return coin_list
+
+
+def load_profiles(config_path=None):
+    # Profiles from a JSON file like {"profiles": {"btc_eth": ["BTC", "ETH"]}} are added to the built-in ones
+    loaded_profiles = dict(profiles)
+    if config_path:
+        try:
+            with open(config_path, 'r', encoding='utf-8') as config_file:
+                config = json.load(config_file)
+        except (OSError, ValueError) as err:
+            raise ValueError(f"Can't read profile file {config_path}: {err}")
+
+        for name, coin_list in config.get('profiles', {}).items():
+            loaded_profiles[name] = check_coins([coin.upper() for coin in coin_list])
+    return loaded_profiles
+
+
+def select_coins(profile_name=default_profile, enabled_coins=(), disabled_coins=(), config_path=None):
+    loaded_profiles = load_profiles(config_path)
+    if profile_name not in loaded_profiles:
+        raise ValueError(f"Unknown profile '{profile_name}', known profiles are {list(loaded_profiles)}")
+
+    enabled_coins = check_coins([coin.upper() for coin in enabled_coins])
+    disabled_coins = check_coins([coin.upper() for coin in disabled_coins])
+    selected = [coin for coin in coins if coin in loaded_profiles[profile_name] or coin in enabled_coins]
+    return [coin for coin in selected if coin not in disabled_coins]
+
+
+def coin_descriptions(coin_list):
+    return [description for coin in coin_list for description in coins[coin]]
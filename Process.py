@@ -1,519 +1,619 @@
 import datetime
 import gc
-import multiprocessing
+import hashlib
 import os
 import re
-import tarfile
-import tempfile
 import time
-import zipfile
-from mmap import ACCESS_READ, mmap
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from functools import partial
+from io import BytesIO
+from itertools import compress, tee
+from mmap import ACCESS_READ, PAGESIZE, mmap
 
-import psutil
-import py7zr
-import rarfile
+try:
+    from mmap import MADV_DONTNEED
+except ImportError:  # Not available on Windows
+    MADV_DONTNEED = None
 
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+import ArchiveReader
+import FileType
+import ImageReader
 import Validator
 import WalletFinder
+import Wordlist
 from FileHandler import FileHandler
 
-patterns = [
-    (re.compile(rb'xprv[a-km-zA-HJ-NP-Z1-9]{107,108}'), 'BIP32 HD wallet private node'),
-    (re.compile(rb'x\x00p\x00r\x00v\x00([a-km-zA-HJ-NP-Z1-9]\x00){107,108}'), 'BIP32 HD wallet private node'),  # (escape characters)
-    (re.compile(rb'xpub[a-km-zA-HJ-NP-Z1-9]{107,108}'), 'BIP32 HD wallet public node'),
-    (re.compile(rb'x\x00p\x00u\x00b\x00([a-km-zA-HJ-NP-Z1-9]\x00){107,108}'), 'BIP32 HD wallet public node'),  # (escape characters)
-    (re.compile(rb'4[0-9AB][1-9A-HJ-NP-Za-km-z]{93}'), 'Monero Address'),
-    (re.compile(rb'bc0[ac-hj-np-z02-9]{59}'), 'Bitcoin Address Bech32'),
-    (re.compile(rb'6P[a-km-zA-HJ-NP-Z1-9]{56}'), 'BIP38 Encrypted Private Key'),
-    (re.compile(rb'6\x00P\x00([a-km-zA-HJ-NP-Z1-9]\x00){56}'), 'BIP38 Encrypted Private Key'),  # (escape characters)
-    (re.compile(rb'[KL][a-km-zA-HJ-NP-Z1-9]{51}'), 'WIF Private key compressed public key'),
-    (re.compile(rb'[KL]\x00([a-km-zA-HJ-NP-Z1-9]\x00){51}'), 'WIF Private key compressed public key'),  # (escape characters)
-    (re.compile(rb'5[a-km-zA-HJ-NP-Z1-9]{50}'), 'WIF Private key uncompressed public key'),
-    (re.compile(rb'5\x00([a-km-zA-HJ-NP-Z1-9]\x00){50}'), 'WIF Private key uncompressed public key'),  # (escape characters)
-    (re.compile(rb'bitcoincash:\s?[qp]([0-9a-zA-Z]{41})'), 'Bitcoin Cash Address'),
-    (re.compile(rb'0x[0-9a-fA-F]{40}'), 'Ethereum Address'),
-    (re.compile(rb'bc0[ac-hj-np-z02-9]{39}'), 'Bitcoin Address Bech32'),
-    (re.compile(rb'X[1-9A-HJ-NP-Za-km-z]{33}'), 'DASH Address'),
-    (re.compile(rb'A[a-km-zA-HJ-NP-Z1-9]{33}'), 'NEO Address'),
-    (re.compile(rb'D{1}[5-9A-HJ-NP-U]{1}[1-9A-HJ-NP-Za-km-z]{32}'), 'DOGE Address'),
-    (re.compile(rb'r[1-9A-HJ-NP-Za-km-z]{27,35}'), 'Ripple Address'),
-    (re.compile(rb'1[a-km-zA-HJ-NP-Z1-9]{25,34}'), 'Bitcoin Address'),
-    (re.compile(rb'1\x00([a-km-zA-HJ-NP-Z1-9]\x00){25,34}'), 'Bitcoin Address'),  # (escape characters)
-    (re.compile(rb'3[a-km-zA-HJ-NP-Z1-9]{25,34}'), 'Bitcoin Address P2SH'),
-    (re.compile(rb'3\x00([a-km-zA-HJ-NP-Z1-9]\x00){25,34}'), 'Bitcoin Address P2SH'),  # (escape characters)
-    (re.compile(rb'bc1[ac-hj-np-z02-9]{8,87}'), 'Bitcoin Address Bech32'),
-    (re.compile(rb'([a-zA-Z]{3,12}\s){11}[a-zA-Z]{3,12}'), 'BIP-39 Seed String')
+all_patterns = [
+    (rb'xprv[a-km-zA-HJ-NP-Z1-9]{107,108}', 'BIP32 HD wallet private node'),
+    (rb'xpub[a-km-zA-HJ-NP-Z1-9]{107,108}', 'BIP32 HD wallet public node'),
+    (rb'4[0-9AB][1-9A-HJ-NP-Za-km-z]{93}', 'Monero Address'),
+    (rb'bc0[ac-hj-np-z02-9]{59}', 'Bitcoin Address Bech32'),
+    (rb'6P[a-km-zA-HJ-NP-Z1-9]{56}', 'BIP38 Encrypted Private Key'),
+    (rb'[KL][a-km-zA-HJ-NP-Z1-9]{51}', 'WIF Private key compressed public key'),
+    (rb'5[a-km-zA-HJ-NP-Z1-9]{50}', 'WIF Private key uncompressed public key'),
+    (rb'bitcoincash:\s?[qp]([0-9a-zA-Z]{41})', 'Bitcoin Cash Address'),
+    (rb'0x[0-9a-fA-F]{40}', 'Ethereum Address'),
+    (rb'bc0[ac-hj-np-z02-9]{39}', 'Bitcoin Address Bech32'),
+    (rb'X[1-9A-HJ-NP-Za-km-z]{33}', 'DASH Address'),
+    (rb'A[a-km-zA-HJ-NP-Z1-9]{33}', 'NEO Address'),
+    (rb'D{1}[5-9A-HJ-NP-U]{1}[1-9A-HJ-NP-Za-km-z]{32}', 'DOGE Address'),
+    (rb'r[1-9A-HJ-NP-Za-km-z]{27,35}', 'Ripple Address'),
+    (rb'1[a-km-zA-HJ-NP-Z1-9]{25,34}', 'Bitcoin Address'),
+    (rb'3[a-km-zA-HJ-NP-Z1-9]{25,34}', 'Bitcoin Address P2SH'),
+    (rb'bc1[ac-hj-np-z02-9]{8,87}', 'Bitcoin Address Bech32'),
+    (rb'([a-zA-Z]{3,12}\s){11}[a-zA-Z]{3,12}', 'BIP-39 Seed String')
 ]
 
-wordlist = {'abandon','ability','able','about','above','absent','absorb','abstract','absurd','abuse','access','accident',
-               'account','accuse','achieve','acid','acoustic','acquire','across','act','action','actor','actress','actual',
-               'adapt','add','addict','address','adjust','admit','adult','advance','advice','aerobic','affair','afford',
-               'afraid','again','age','agent','agree','ahead','aim','air','airport','aisle','alarm','album','alcohol',
-               'alert', 'alien', 'all', 'alley', 'allow', 'almost', 'alone', 'alpha', 'already', 'also', 'alter', 'always',
-               'amateur', 'amazing', 'among', 'amount', 'amused', 'analyst', 'anchor', 'ancient', 'anger', 'angle', 'angry',
-               'animal', 'ankle', 'announce', 'annual', 'another', 'answer', 'antenna', 'antique', 'anxiety', 'any',
-               'apart', 'apology', 'appear', 'apple', 'approve', 'april', 'arch', 'arctic', 'area', 'arena', 'argue', 'arm',
-               'armed', 'armor', 'army', 'around', 'arrange', 'arrest', 'arrive', 'arrow', 'art', 'artefact', 'artist',
-               'artwork', 'ask', 'aspect', 'assault', 'asset', 'assist', 'assume', 'asthma', 'athlete', 'atom', 'attack',
-               'attend', 'attitude', 'attract', 'auction', 'audit', 'august', 'aunt', 'author', 'auto', 'autumn', 'average',
-               'avocado', 'avoid', 'awake', 'aware', 'away', 'awesome', 'awful', 'awkward', 'axis', 'baby', 'bachelor',
-               'bacon', 'badge', 'bag', 'balance', 'balcony', 'ball', 'bamboo', 'banana', 'banner', 'bar', 'barely',
-               'bargain', 'barrel', 'base', 'basic', 'basket', 'battle', 'beach', 'bean', 'beauty', 'because', 'become',
-               'beef', 'before', 'begin', 'behave', 'behind', 'believe', 'below', 'belt', 'bench', 'benefit', 'best',
-               'betray', 'better', 'between', 'beyond', 'bicycle', 'bid', 'bike', 'bind', 'biology', 'bird', 'birth',
-               'bitter', 'black', 'blade', 'blame', 'blanket', 'blast', 'bleak', 'bless', 'blind', 'blood', 'blossom',
-               'blouse', 'blue', 'blur', 'blush', 'board', 'boat', 'body', 'boil', 'bomb', 'bone', 'bonus', 'book', 'boost',
-               'border', 'boring', 'borrow', 'boss', 'bottom', 'bounce', 'box', 'boy', 'bracket', 'brain', 'brand', 'brass',
-               'brave', 'bread', 'breeze', 'brick', 'bridge', 'brief', 'bright', 'bring', 'brisk', 'broccoli', 'broken',
-               'bronze', 'broom', 'brother', 'brown', 'brush', 'bubble', 'buddy', 'budget', 'buffalo', 'build', 'bulb',
-               'bulk', 'bullet', 'bundle', 'bunker', 'burden', 'burger', 'burst', 'bus', 'business', 'busy', 'butter',
-               'buyer', 'buzz', 'cabbage', 'cabin', 'cable', 'cactus', 'cage', 'cake', 'call', 'calm', 'camera', 'camp',
-               'can', 'canal', 'cancel', 'candy', 'cannon', 'canoe', 'canvas', 'canyon', 'capable', 'capital', 'captain',
-               'car', 'carbon', 'card', 'cargo', 'carpet', 'carry', 'cart', 'case', 'cash', 'casino', 'castle', 'casual',
-               'cat', 'catalog', 'catch', 'category', 'cattle', 'caught', 'cause', 'caution', 'cave', 'ceiling', 'celery',
-               'cement', 'census', 'century', 'cereal', 'certain', 'chair', 'chalk', 'champion', 'change', 'chaos',
-               'chapter', 'charge', 'chase', 'chat', 'cheap', 'check', 'cheese', 'chef', 'cherry', 'chest', 'chicken',
-               'chief', 'child', 'chimney', 'choice', 'choose', 'chronic', 'chuckle', 'chunk', 'churn', 'cigar', 'cinnamon',
-               'circle', 'citizen', 'city', 'civil', 'claim', 'clap', 'clarify', 'claw', 'clay', 'clean', 'clerk', 'clever',
-               'click', 'client', 'cliff', 'climb', 'clinic', 'clip', 'clock', 'clog', 'close', 'cloth', 'cloud', 'clown',
-               'club', 'clump', 'cluster', 'clutch', 'coach', 'coast', 'coconut', 'code', 'coffee', 'coil', 'coin',
-               'collect', 'color', 'column', 'combine', 'come', 'comfort', 'comic', 'common', 'company', 'concert',
-               'conduct', 'confirm', 'congress', 'connect', 'consider', 'control', 'convince', 'cook', 'cool', 'copper',
-               'copy', 'coral', 'core', 'corn', 'correct', 'cost', 'cotton', 'couch', 'country', 'couple', 'course',
-               'cousin', 'cover', 'coyote', 'crack', 'cradle', 'craft', 'cram', 'crane', 'crash', 'crater', 'crawl',
-               'crazy', 'cream', 'credit', 'creek', 'crew', 'cricket', 'crime', 'crisp', 'critic', 'crop', 'cross',
-               'crouch', 'crowd', 'crucial', 'cruel', 'cruise', 'crumble', 'crunch', 'crush', 'cry', 'crystal', 'cube',
-               'culture', 'cup', 'cupboard', 'curious', 'current', 'curtain', 'curve', 'cushion', 'custom', 'cute', 'cycle',
-               'dad', 'damage', 'damp', 'dance', 'danger', 'daring', 'dash', 'daughter', 'dawn', 'day', 'deal', 'debate',
-               'debris', 'decade', 'december', 'decide', 'decline', 'decorate', 'decrease', 'deer', 'defense', 'define',
-               'defy', 'degree', 'delay', 'deliver', 'demand', 'demise', 'denial', 'dentist', 'deny', 'depart', 'depend',
-               'deposit', 'depth', 'deputy', 'derive', 'describe', 'desert', 'design', 'desk', 'despair', 'destroy',
-               'detail', 'detect', 'develop', 'device', 'devote', 'diagram', 'dial', 'diamond', 'diary', 'dice', 'diesel',
-               'diet', 'differ', 'digital', 'dignity', 'dilemma', 'dinner', 'dinosaur', 'direct', 'dirt', 'disagree',
-               'discover', 'disease', 'dish', 'dismiss', 'disorder', 'display', 'distance', 'divert', 'divide', 'divorce',
-               'dizzy', 'doctor', 'document', 'dog', 'doll', 'dolphin', 'domain', 'donate', 'donkey', 'donor', 'door',
-               'dose', 'double', 'dove', 'draft', 'dragon', 'drama', 'drastic', 'draw', 'dream', 'dress', 'drift', 'drill',
-               'drink', 'drip', 'drive', 'drop', 'drum', 'dry', 'duck', 'dumb', 'dune', 'during', 'dust', 'dutch', 'duty',
-               'dwarf', 'dynamic', 'eager', 'eagle', 'early', 'earn', 'earth', 'easily', 'east', 'easy', 'echo', 'ecology',
-               'economy', 'edge', 'edit', 'educate', 'effort', 'egg', 'eight', 'either', 'elbow', 'elder', 'electric',
-               'elegant', 'element', 'elephant', 'elevator', 'elite', 'else', 'embark', 'embody', 'embrace', 'emerge',
-               'emotion', 'employ', 'empower', 'empty', 'enable', 'enact', 'end', 'endless', 'endorse', 'enemy', 'energy',
-               'enforce', 'engage', 'engine', 'enhance', 'enjoy', 'enlist', 'enough', 'enrich', 'enroll', 'ensure', 'enter',
-               'entire', 'entry', 'envelope', 'episode', 'equal', 'equip', 'era', 'erase', 'erode', 'erosion', 'error',
-               'erupt', 'escape', 'essay', 'essence', 'estate', 'eternal', 'ethics', 'evidence', 'evil', 'evoke', 'evolve',
-               'exact', 'example', 'excess', 'exchange', 'excite', 'exclude', 'excuse', 'execute', 'exercise', 'exhaust',
-               'exhibit', 'exile', 'exist', 'exit', 'exotic', 'expand', 'expect', 'expire', 'explain', 'expose', 'express',
-               'extend', 'extra', 'eye', 'eyebrow', 'fabric', 'face', 'faculty', 'fade', 'faint', 'faith', 'fall', 'false',
-               'fame', 'family', 'famous', 'fan', 'fancy', 'fantasy', 'farm', 'fashion', 'fat', 'fatal', 'father',
-               'fatigue', 'fault', 'favorite', 'feature', 'february', 'federal', 'fee', 'feed', 'feel', 'female', 'fence',
-               'festival', 'fetch', 'fever', 'few', 'fiber', 'fiction', 'field', 'figure', 'file', 'film', 'filter',
-               'final', 'find', 'fine', 'finger', 'finish', 'fire', 'firm', 'first', 'fiscal', 'fish', 'fit', 'fitness',
-               'fix', 'flag', 'flame', 'flash', 'flat', 'flavor', 'flee', 'flight', 'flip', 'float', 'flock', 'floor',
-               'flower', 'fluid', 'flush', 'fly', 'foam', 'focus', 'fog', 'foil', 'fold', 'follow', 'food', 'foot', 'force',
-               'forest', 'forget', 'fork', 'fortune', 'forum', 'forward', 'fossil', 'foster', 'found', 'fox', 'fragile',
-               'frame', 'frequent', 'fresh', 'friend', 'fringe', 'frog', 'front', 'frost', 'frown', 'frozen', 'fruit',
-               'fuel', 'fun', 'funny', 'furnace', 'fury', 'future', 'gadget', 'gain', 'galaxy', 'gallery', 'game', 'gap',
-               'garage', 'garbage', 'garden', 'garlic', 'garment', 'gas', 'gasp', 'gate', 'gather', 'gauge', 'gaze',
-               'general', 'genius', 'genre', 'gentle', 'genuine', 'gesture', 'ghost', 'giant', 'gift', 'giggle', 'ginger',
-               'giraffe', 'girl', 'give', 'glad', 'glance', 'glare', 'glass', 'glide', 'glimpse', 'globe', 'gloom', 'glory',
-               'glove', 'glow', 'glue', 'goat', 'goddess', 'gold', 'good', 'goose', 'gorilla', 'gospel', 'gossip', 'govern',
-               'gown', 'grab', 'grace', 'grain', 'grant', 'grape', 'grass', 'gravity', 'great', 'green', 'grid', 'grief',
-               'grit', 'grocery', 'group', 'grow', 'grunt', 'guard', 'guess', 'guide', 'guilt', 'guitar', 'gun', 'gym',
-               'habit', 'hair', 'half', 'hammer', 'hamster', 'hand', 'happy', 'harbor', 'hard', 'harsh', 'harvest', 'hat',
-               'have', 'hawk', 'hazard', 'head', 'health', 'heart', 'heavy', 'hedgehog', 'height', 'hello', 'helmet',
-               'help', 'hen', 'hero', 'hidden', 'high', 'hill', 'hint', 'hip', 'hire', 'history', 'hobby', 'hockey', 'hold',
-               'hole', 'holiday', 'hollow', 'home', 'honey', 'hood', 'hope', 'horn', 'horror', 'horse', 'hospital', 'host',
-               'hotel', 'hour', 'hover', 'hub', 'huge', 'human', 'humble', 'humor', 'hundred', 'hungry', 'hunt', 'hurdle',
-               'hurry', 'hurt', 'husband', 'hybrid', 'ice', 'icon', 'idea', 'identify', 'idle', 'ignore', 'ill', 'illegal',
-               'illness', 'image', 'imitate', 'immense', 'immune', 'impact', 'impose', 'improve', 'impulse', 'inch',
-               'include', 'income', 'increase', 'index', 'indicate', 'indoor', 'industry', 'infant', 'inflict', 'inform',
-               'inhale', 'inherit', 'initial', 'inject', 'injury', 'inmate', 'inner', 'innocent', 'input', 'inquiry',
-               'insane', 'insect', 'inside', 'inspire', 'install', 'intact', 'interest', 'into', 'invest', 'invite',
-               'involve', 'iron', 'island', 'isolate', 'issue', 'item', 'ivory', 'jacket', 'jaguar', 'jar', 'jazz',
-               'jealous', 'jeans', 'jelly', 'jewel', 'job', 'join', 'joke', 'journey', 'joy', 'judge', 'juice', 'jump',
-               'jungle', 'junior', 'junk', 'just', 'kangaroo', 'keen', 'keep', 'ketchup', 'key', 'kick', 'kid', 'kidney',
-               'kind', 'kingdom', 'kiss', 'kit', 'kitchen', 'kite', 'kitten', 'kiwi', 'knee', 'knife', 'knock', 'know',
-               'lab', 'label', 'labor', 'ladder', 'lady', 'lake', 'lamp', 'language', 'laptop', 'large', 'later', 'latin',
-               'laugh', 'laundry', 'lava', 'law', 'lawn', 'lawsuit', 'layer', 'lazy', 'leader', 'leaf', 'learn', 'leave',
-               'lecture', 'left', 'leg', 'legal', 'legend', 'leisure', 'lemon', 'lend', 'length', 'lens', 'leopard',
-               'lesson', 'letter', 'level', 'liar', 'liberty', 'library', 'license', 'life', 'lift', 'light', 'like',
-               'limb', 'limit', 'link', 'lion', 'liquid', 'list', 'little', 'live', 'lizard', 'load', 'loan', 'lobster',
-               'local', 'lock', 'logic', 'lonely', 'long', 'loop', 'lottery', 'loud', 'lounge', 'love', 'loyal', 'lucky',
-               'luggage', 'lumber', 'lunar', 'lunch', 'luxury', 'lyrics', 'machine', 'mad', 'magic', 'magnet', 'maid',
-               'mail', 'main', 'major', 'make', 'mammal', 'man', 'manage', 'mandate', 'mango', 'mansion', 'manual', 'maple',
-               'marble', 'march', 'margin', 'marine', 'market', 'marriage', 'mask', 'mass', 'master', 'match', 'material',
-               'math', 'matrix', 'matter', 'maximum', 'maze', 'meadow', 'mean', 'measure', 'meat', 'mechanic', 'medal',
-               'media', 'melody', 'melt', 'member', 'memory', 'mention', 'menu', 'mercy', 'merge', 'merit', 'merry', 'mesh',
-               'message', 'metal', 'method', 'middle', 'midnight', 'milk', 'million', 'mimic', 'mind', 'minimum', 'minor',
-               'minute', 'miracle', 'mirror', 'misery', 'miss', 'mistake', 'mix', 'mixed', 'mixture', 'mobile', 'model',
-               'modify', 'mom', 'moment', 'monitor', 'monkey', 'monster', 'month', 'moon', 'moral', 'more', 'morning',
-               'mosquito', 'mother', 'motion', 'motor', 'mountain', 'mouse', 'move', 'movie', 'much', 'muffin', 'mule',
-               'multiply', 'muscle', 'museum', 'mushroom', 'music', 'must', 'mutual', 'myself', 'mystery', 'myth', 'naive',
-               'name', 'napkin', 'narrow', 'nasty', 'nation', 'nature', 'near', 'neck', 'need', 'negative', 'neglect',
-               'neither', 'nephew', 'nerve', 'nest', 'net', 'network', 'neutral', 'never', 'news', 'next', 'nice', 'night',
-               'noble', 'noise', 'nominee', 'noodle', 'normal', 'north', 'nose', 'notable', 'note', 'nothing', 'notice',
-               'novel', 'now', 'nuclear', 'number', 'nurse', 'nut', 'oak', 'obey', 'object', 'oblige', 'obscure', 'observe',
-               'obtain', 'obvious', 'occur', 'ocean', 'october', 'odor', 'off', 'offer', 'office', 'often', 'oil', 'okay',
-               'old', 'olive', 'olympic', 'omit', 'once', 'one', 'onion', 'online', 'only', 'open', 'opera', 'opinion',
-               'oppose', 'option', 'orange', 'orbit', 'orchard', 'order', 'ordinary', 'organ', 'orient', 'original',
-               'orphan', 'ostrich', 'other', 'outdoor', 'outer', 'output', 'outside', 'oval', 'oven', 'over', 'own',
-               'owner', 'oxygen', 'oyster', 'ozone', 'pact', 'paddle', 'page', 'pair', 'palace', 'palm', 'panda', 'panel',
-               'panic', 'panther', 'paper', 'parade', 'parent', 'park', 'parrot', 'party', 'pass', 'patch', 'path',
-               'patient', 'patrol', 'pattern', 'pause', 'pave', 'payment', 'peace', 'peanut', 'pear', 'peasant', 'pelican',
-               'pen', 'penalty', 'pencil', 'people', 'pepper', 'perfect', 'permit', 'person', 'pet', 'phone', 'photo',
-               'phrase', 'physical', 'piano', 'picnic', 'picture', 'piece', 'pig', 'pigeon', 'pill', 'pilot', 'pink',
-               'pioneer', 'pipe', 'pistol', 'pitch', 'pizza', 'place', 'planet', 'plastic', 'plate', 'play', 'please',
-               'pledge', 'pluck', 'plug', 'plunge', 'poem', 'poet', 'point', 'polar', 'pole', 'police', 'pond', 'pony',
-               'pool', 'popular', 'portion', 'position', 'possible', 'post', 'potato', 'pottery', 'poverty', 'powder',
-               'power', 'practice', 'praise', 'predict', 'prefer', 'prepare', 'present', 'pretty', 'prevent', 'price',
-               'pride', 'primary', 'print', 'priority', 'prison', 'private', 'prize', 'problem', 'process', 'produce',
-               'profit', 'program', 'project', 'promote', 'proof', 'property', 'prosper', 'protect', 'proud', 'provide',
-               'public', 'pudding', 'pull', 'pulp', 'pulse', 'pumpkin', 'punch', 'pupil', 'puppy', 'purchase', 'purity',
-               'purpose', 'purse', 'push', 'put', 'puzzle', 'pyramid', 'quality', 'quantum', 'quarter', 'question', 'quick',
-               'quit', 'quiz', 'quote', 'rabbit', 'raccoon', 'race', 'rack', 'radar', 'radio', 'rail', 'rain', 'raise',
-               'rally', 'ramp', 'ranch', 'random', 'range', 'rapid', 'rare', 'rate', 'rather', 'raven', 'raw', 'razor',
-               'ready', 'real', 'reason', 'rebel', 'rebuild', 'recall', 'receive', 'recipe', 'record', 'recycle', 'reduce',
-               'reflect', 'reform', 'refuse', 'region', 'regret', 'regular', 'reject', 'relax', 'release', 'relief', 'rely',
-               'remain', 'remember', 'remind', 'remove', 'render', 'renew', 'rent', 'reopen', 'repair', 'repeat', 'replace',
-               'report', 'require', 'rescue', 'resemble', 'resist', 'resource', 'response', 'result', 'retire', 'retreat',
-               'return', 'reunion', 'reveal', 'review', 'reward', 'rhythm', 'rib', 'ribbon', 'rice', 'rich', 'ride',
-               'ridge', 'rifle', 'right', 'rigid', 'ring', 'riot', 'ripple', 'risk', 'ritual', 'rival', 'river', 'road',
-               'roast', 'robot', 'robust', 'rocket', 'romance', 'roof', 'rookie', 'room', 'rose', 'rotate', 'rough',
-               'round', 'route', 'royal', 'rubber', 'rude', 'rug', 'rule', 'run', 'runway', 'rural', 'sad', 'saddle',
-               'sadness', 'safe', 'sail', 'salad', 'salmon', 'salon', 'salt', 'salute', 'same', 'sample', 'sand', 'satisfy',
-               'satoshi', 'sauce', 'sausage', 'save', 'say', 'scale', 'scan', 'scare', 'scatter', 'scene', 'scheme',
-               'school', 'science', 'scissors', 'scorpion', 'scout', 'scrap', 'screen', 'script', 'scrub', 'sea', 'search',
-               'season', 'seat', 'second', 'secret', 'section', 'security', 'seed', 'seek', 'segment', 'select', 'sell',
-               'seminar', 'senior', 'sense', 'sentence', 'series', 'service', 'session', 'settle', 'setup', 'seven',
-               'shadow', 'shaft', 'shallow', 'share', 'shed', 'shell', 'sheriff', 'shield', 'shift', 'shine', 'ship',
-               'shiver', 'shock', 'shoe', 'shoot', 'shop', 'short', 'shoulder', 'shove', 'shrimp', 'shrug', 'shuffle',
-               'shy', 'sibling', 'sick', 'side', 'siege', 'sight', 'sign', 'silent', 'silk', 'silly', 'silver', 'similar',
-               'simple', 'since', 'sing', 'siren', 'sister', 'situate', 'six', 'size', 'skate', 'sketch', 'ski', 'skill',
-               'skin', 'skirt', 'skull', 'slab', 'slam', 'sleep', 'slender', 'slice', 'slide', 'slight', 'slim', 'slogan',
-               'slot', 'slow', 'slush', 'small', 'smart', 'smile', 'smoke', 'smooth', 'snack', 'snake', 'snap', 'sniff',
-               'snow', 'soap', 'soccer', 'social', 'sock', 'soda', 'soft', 'solar', 'soldier', 'solid', 'solution', 'solve',
-               'someone', 'song', 'soon', 'sorry', 'sort', 'soul', 'sound', 'soup', 'source', 'south', 'space', 'spare',
-               'spatial', 'spawn', 'speak', 'special', 'speed', 'spell', 'spend', 'sphere', 'spice', 'spider', 'spike',
-               'spin', 'spirit', 'split', 'spoil', 'sponsor', 'spoon', 'sport', 'spot', 'spray', 'spread', 'spring', 'spy',
-               'square', 'squeeze', 'squirrel', 'stable', 'stadium', 'staff', 'stage', 'stairs', 'stamp', 'stand', 'start',
-               'state', 'stay', 'steak', 'steel', 'stem', 'step', 'stereo', 'stick', 'still', 'sting', 'stock', 'stomach',
-               'stone', 'stool', 'story', 'stove', 'strategy', 'street', 'strike', 'strong', 'struggle', 'student', 'stuff',
-               'stumble', 'style', 'subject', 'submit', 'subway', 'success', 'such', 'sudden', 'suffer', 'sugar', 'suggest',
-               'suit', 'summer', 'sun', 'sunny', 'sunset', 'super', 'supply', 'supreme', 'sure', 'surface', 'surge',
-               'surprise', 'surround', 'survey', 'suspect', 'sustain', 'swallow', 'swamp', 'swap', 'swarm', 'swear',
-               'sweet', 'swift', 'swim', 'swing', 'switch', 'sword', 'symbol', 'symptom', 'syrup', 'system', 'table',
-               'tackle', 'tag', 'tail', 'talent', 'talk', 'tank', 'tape', 'target', 'task', 'taste', 'tattoo', 'taxi',
-               'teach', 'team', 'tell', 'ten', 'tenant', 'tennis', 'tent', 'term', 'test', 'text', 'thank', 'that', 'theme',
-               'then', 'theory', 'there', 'they', 'thing', 'this', 'thought', 'three', 'thrive', 'throw', 'thumb',
-               'thunder', 'ticket', 'tide', 'tiger', 'tilt', 'timber', 'time', 'tiny', 'tip', 'tired', 'tissue', 'title',
-               'toast', 'tobacco', 'today', 'toddler', 'toe', 'together', 'toilet', 'token', 'tomato', 'tomorrow', 'tone',
-               'tongue', 'tonight', 'tool', 'tooth', 'top', 'topic', 'topple', 'torch', 'tornado', 'tortoise', 'toss',
-               'total', 'tourist', 'toward', 'tower', 'town', 'toy', 'track', 'trade', 'traffic', 'tragic', 'train',
-               'transfer', 'trap', 'trash', 'travel', 'tray', 'treat', 'tree', 'trend', 'trial', 'tribe', 'trick',
-               'trigger', 'trim', 'trip', 'trophy', 'trouble', 'truck', 'true', 'truly', 'trumpet', 'trust', 'truth', 'try',
-               'tube', 'tuition', 'tumble', 'tuna', 'tunnel', 'turkey', 'turn', 'turtle', 'twelve', 'twenty', 'twice',
-               'twin', 'twist', 'two', 'type', 'typical', 'ugly', 'umbrella', 'unable', 'unaware', 'uncle', 'uncover',
-               'under', 'undo', 'unfair', 'unfold', 'unhappy', 'uniform', 'unique', 'unit', 'universe', 'unknown', 'unlock',
-               'until', 'unusual', 'unveil', 'update', 'upgrade', 'uphold', 'upon', 'upper', 'upset', 'urban', 'urge',
-               'usage', 'use', 'used', 'useful', 'useless', 'usual', 'utility', 'vacant', 'vacuum', 'vague', 'valid',
-               'valley', 'valve', 'van', 'vanish', 'vapor', 'various', 'vast', 'vault', 'vehicle', 'velvet', 'vendor',
-               'venture', 'venue', 'verb', 'verify', 'version', 'very', 'vessel', 'veteran', 'viable', 'vibrant', 'vicious',
-               'victory', 'video', 'view', 'village', 'vintage', 'violin', 'virtual', 'virus', 'visa', 'visit', 'visual',
-               'vital', 'vivid', 'vocal', 'voice', 'void', 'volcano', 'volume', 'vote', 'voyage', 'wage', 'wagon', 'wait',
-               'walk', 'wall', 'walnut', 'want', 'warfare', 'warm', 'warrior', 'wash', 'wasp', 'waste', 'water', 'wave',
-               'way', 'wealth', 'weapon', 'wear', 'weasel', 'weather', 'web', 'wedding', 'weekend', 'weird', 'welcome',
-               'west', 'wet', 'whale', 'what', 'wheat', 'wheel', 'when', 'where', 'whip', 'whisper', 'wide', 'width',
-               'wife', 'wild', 'will', 'win', 'window', 'wine', 'wing', 'wink', 'winner', 'winter', 'wire', 'wisdom',
-               'wise', 'wish', 'witness', 'wolf', 'woman', 'wonder', 'wood', 'wool', 'word', 'work', 'world', 'worry',
-               'worth', 'wrap', 'wreck', 'wrestle', 'wrist', 'write', 'wrong', 'yard', 'year', 'yellow', 'you', 'young',
-               'youth', 'zebra', 'zero', 'zone', 'zoo'}
-
-monero_wordlist = {'abbey', 'abducts', 'ability', 'ablaze', 'abnormal', 'abort', 'abrasive', 'absorb', 'abyss',
-                   'academy', 'aces', 'aching', 'acidic', 'acoustic', 'acquire', 'across', 'actress', 'acumen', 'adapt',
-                   'addicted', 'adept', 'adhesive', 'adjust', 'adopt', 'adrenalin', 'adult', 'adventure', 'aerial',
-                   'afar', 'affair', 'afield', 'afloat', 'afoot', 'afraid', 'after', 'against', 'agenda', 'aggravate',
-                   'agile', 'aglow', 'agnostic', 'agony', 'agreed', 'ahead', 'aided', 'ailments', 'aimless', 'airport',
-                   'aisle', 'ajar', 'akin', 'alarms', 'album', 'alchemy', 'alerts', 'algebra', 'alkaline', 'alley',
-                   'almost', 'aloof', 'alpine', 'already', 'also', 'altitude', 'alumni', 'always', 'amaze', 'ambush',
-                   'amended', 'amidst', 'ammo', 'amnesty', 'among', 'amply', 'amused', 'anchor', 'android', 'anecdote',
-                   'angled', 'ankle', 'annoyed', 'answers', 'antics', 'anvil', 'anxiety', 'anybody', 'apart', 'apex',
-                   'aphid', 'aplomb', 'apology', 'apply', 'apricot', 'aptitude', 'aquarium', 'arbitrary', 'archer',
-                   'ardent', 'arena', 'argue', 'arises', 'army', 'around', 'arrow', 'arsenic', 'artistic', 'ascend',
-                   'ashtray', 'aside', 'asked', 'asleep', 'aspire', 'assorted', 'asylum', 'athlete', 'atlas', 'atom',
-                   'atrium', 'attire', 'auburn', 'auctions', 'audio', 'august', 'aunt', 'austere', 'autumn', 'avatar',
-                   'avidly', 'avoid', 'awakened', 'awesome', 'awful', 'awkward', 'awning', 'awoken', 'axes', 'axis',
-                   'axle', 'aztec', 'azure', 'baby', 'bacon', 'badge', 'baffles', 'bagpipe', 'bailed', 'bakery',
-                   'balding', 'bamboo', 'banjo', 'baptism', 'basin', 'batch', 'bawled', 'bays', 'because', 'beer',
-                   'befit', 'begun', 'behind', 'being', 'below', 'bemused', 'benches', 'berries', 'bested', 'betting',
-                   'bevel', 'beware', 'beyond', 'bias', 'bicycle', 'bids', 'bifocals', 'biggest', 'bikini', 'bimonthly',
-                   'binocular', 'biology', 'biplane', 'birth', 'biscuit', 'bite', 'biweekly', 'blender', 'blip',
-                   'bluntly', 'boat', 'bobsled', 'bodies', 'bogeys', 'boil', 'boldly', 'bomb', 'border', 'boss', 'both',
-                   'bounced', 'bovine', 'bowling', 'boxes', 'boyfriend', 'broken', 'brunt', 'bubble', 'buckets',
-                   'budget', 'buffet', 'bugs', 'building', 'bulb', 'bumper', 'bunch', 'business', 'butter', 'buying',
-                   'buzzer', 'bygones', 'byline', 'bypass', 'cabin', 'cactus', 'cadets', 'cafe', 'cage', 'cajun',
-                   'cake', 'calamity', 'camp', 'candy', 'casket', 'catch', 'cause', 'cavernous', 'cease', 'cedar',
-                   'ceiling', 'cell', 'cement', 'cent', 'certain', 'chlorine', 'chrome', 'cider', 'cigar', 'cinema',
-                   'circle', 'cistern', 'citadel', 'civilian', 'claim', 'click', 'clue', 'coal', 'cobra', 'cocoa',
-                   'code', 'coexist', 'coffee', 'cogs', 'cohesive', 'coils', 'colony', 'comb', 'cool', 'copy',
-                   'corrode', 'costume', 'cottage', 'cousin', 'cowl', 'criminal', 'cube', 'cucumber', 'cuddled',
-                   'cuffs', 'cuisine', 'cunning', 'cupcake', 'custom', 'cycling', 'cylinder', 'cynical', 'dabbing',
-                   'dads', 'daft', 'dagger', 'daily', 'damp', 'dangerous', 'dapper', 'darted', 'dash', 'dating',
-                   'dauntless', 'dawn', 'daytime', 'dazed', 'debut', 'decay', 'dedicated', 'deepest', 'deftly',
-                   'degrees', 'dehydrate', 'deity', 'dejected', 'delayed', 'demonstrate', 'dented', 'deodorant',
-                   'depth', 'desk', 'devoid', 'dewdrop', 'dexterity', 'dialect', 'dice', 'diet', 'different', 'digit',
-                   'dilute', 'dime', 'dinner', 'diode', 'diplomat', 'directed', 'distance', 'ditch', 'divers', 'dizzy',
-                   'doctor', 'dodge', 'does', 'dogs', 'doing', 'dolphin', 'domestic', 'donuts', 'doorway', 'dormant',
-                   'dosage', 'dotted', 'double', 'dove', 'down', 'dozen', 'dreams', 'drinks', 'drowning', 'drunk',
-                   'drying', 'dual', 'dubbed', 'duckling', 'dude', 'duets', 'duke', 'dullness', 'dummy', 'dunes',
-                   'duplex', 'duration', 'dusted', 'duties', 'dwarf', 'dwelt', 'dwindling', 'dying', 'dynamite',
-                   'dyslexic', 'each', 'eagle', 'earth', 'easy', 'eating', 'eavesdrop', 'eccentric', 'echo', 'eclipse',
-                   'economics', 'ecstatic', 'eden', 'edgy', 'edited', 'educated', 'eels', 'efficient', 'eggs',
-                   'egotistic', 'eight', 'either', 'eject', 'elapse', 'elbow', 'eldest', 'eleven', 'elite', 'elope',
-                   'else', 'eluded', 'emails', 'ember', 'emerge', 'emit', 'emotion', 'empty', 'emulate', 'energy',
-                   'enforce', 'enhanced', 'enigma', 'enjoy', 'enlist', 'enmity', 'enough', 'enraged', 'ensign',
-                   'entrance', 'envy', 'epoxy', 'equip', 'erase', 'erected', 'erosion', 'error', 'eskimos', 'espionage',
-                   'essential', 'estate', 'etched', 'eternal', 'ethics', 'etiquette', 'evaluate', 'evenings', 'evicted',
-                   'evolved', 'examine', 'excess', 'exhale', 'exit', 'exotic', 'exquisite', 'extra', 'exult', 'fabrics',
-                   'factual', 'fading', 'fainted', 'faked', 'fall', 'family', 'fancy', 'farming', 'fatal', 'faulty',
-                   'fawns', 'faxed', 'fazed', 'feast', 'february', 'federal', 'feel', 'feline', 'females', 'fences',
-                   'ferry', 'festival', 'fetches', 'fever', 'fewest', 'fiat', 'fibula', 'fictional', 'fidget', 'fierce',
-                   'fifteen', 'fight', 'films', 'firm', 'fishing', 'fitting', 'five', 'fixate', 'fizzle', 'fleet',
-                   'flippant', 'flying', 'foamy', 'focus', 'foes', 'foggy', 'foiled', 'folding', 'fonts', 'foolish',
-                   'fossil', 'fountain', 'fowls', 'foxes', 'foyer', 'framed', 'friendly', 'frown', 'fruit', 'frying',
-                   'fudge', 'fuel', 'fugitive', 'fully', 'fuming', 'fungal', 'furnished', 'fuselage', 'future', 'fuzzy',
-                   'gables', 'gadget', 'gags', 'gained', 'galaxy', 'gambit', 'gang', 'gasp', 'gather', 'gauze', 'gave',
-                   'gawk', 'gaze', 'gearbox', 'gecko', 'geek', 'gels', 'gemstone', 'general', 'geometry', 'germs',
-                   'gesture', 'getting', 'geyser', 'ghetto', 'ghost', 'giant', 'giddy', 'gifts', 'gigantic', 'gills',
-                   'gimmick', 'ginger', 'girth', 'giving', 'glass', 'gleeful', 'glide', 'gnaw', 'gnome', 'goat',
-                   'goblet', 'godfather', 'goes', 'goggles', 'going', 'goldfish', 'gone', 'goodbye', 'gopher',
-                   'gorilla', 'gossip', 'gotten', 'gourmet', 'governing', 'gown', 'greater', 'grunt', 'guarded',
-                   'guest', 'guide', 'gulp', 'gumball', 'guru', 'gusts', 'gutter', 'guys', 'gymnast', 'gypsy', 'gyrate',
-                   'habitat', 'hacksaw', 'haggled', 'hairy', 'hamburger', 'happens', 'hashing', 'hatchet', 'haunted',
-                   'having', 'hawk', 'haystack', 'hazard', 'hectare', 'hedgehog', 'heels', 'hefty', 'height', 'hemlock',
-                   'hence', 'heron', 'hesitate', 'hexagon', 'hickory', 'hiding', 'highway', 'hijack', 'hiker', 'hills',
-                   'himself', 'hinder', 'hippo', 'hire', 'history', 'hitched', 'hive', 'hoax', 'hobby', 'hockey',
-                   'hoisting', 'hold', 'honked', 'hookup', 'hope', 'hornet', 'hospital', 'hotel', 'hounded', 'hover',
-                   'howls', 'hubcaps', 'huddle', 'huge', 'hull', 'humid', 'hunter', 'hurried', 'husband', 'huts',
-                   'hybrid', 'hydrogen', 'hyper', 'iceberg', 'icing', 'icon', 'identity', 'idiom', 'idled', 'idols',
-                   'igloo', 'ignore', 'iguana', 'illness', 'imagine', 'imbalance', 'imitate', 'impel', 'inactive',
-                   'inbound', 'incur', 'industrial', 'inexact', 'inflamed', 'ingested', 'initiate', 'injury', 'inkling',
-                   'inline', 'inmate', 'innocent', 'inorganic', 'input', 'inquest', 'inroads', 'insult', 'intended',
-                   'inundate', 'invoke', 'inwardly', 'ionic', 'irate', 'iris', 'irony', 'irritate', 'island',
-                   'isolated', 'issued', 'italics', 'itches', 'items', 'itinerary', 'itself', 'ivory', 'jabbed',
-                   'jackets', 'jaded', 'jagged', 'jailed', 'jamming', 'january', 'jargon', 'jaunt', 'javelin', 'jaws',
-                   'jazz', 'jeans', 'jeers', 'jellyfish', 'jeopardy', 'jerseys', 'jester', 'jetting', 'jewels',
-                   'jigsaw', 'jingle', 'jittery', 'jive', 'jobs', 'jockey', 'jogger', 'joining', 'joking', 'jolted',
-                   'jostle', 'journal', 'joyous', 'jubilee', 'judge', 'juggled', 'juicy', 'jukebox', 'july', 'jump',
-                   'junk', 'jury', 'justice', 'juvenile', 'kangaroo', 'karate', 'keep', 'kennel', 'kept', 'kernels',
-                   'kettle', 'keyboard', 'kickoff', 'kidneys', 'king', 'kiosk', 'kisses', 'kitchens', 'kiwi',
-                   'knapsack', 'knee', 'knife', 'knowledge', 'knuckle', 'koala', 'laboratory', 'ladder', 'lagoon',
-                   'lair', 'lakes', 'lamb', 'language', 'laptop', 'large', 'last', 'later', 'launching', 'lava',
-                   'lawsuit', 'layout', 'lazy', 'lectures', 'ledge', 'leech', 'left', 'legion', 'leisure', 'lemon',
-                   'lending', 'leopard', 'lesson', 'lettuce', 'lexicon', 'liar', 'library', 'licks', 'lids', 'lied',
-                   'lifestyle', 'light', 'likewise', 'lilac', 'limits', 'linen', 'lion', 'lipstick', 'liquid', 'listen',
-                   'lively', 'loaded', 'lobster', 'locker', 'lodge', 'lofty', 'logic', 'loincloth', 'long', 'looking',
-                   'lopped', 'lordship', 'losing', 'lottery', 'loudly', 'love', 'lower', 'loyal', 'lucky', 'luggage',
-                   'lukewarm', 'lullaby', 'lumber', 'lunar', 'lurk', 'lush', 'luxury', 'lymph', 'lynx', 'lyrics',
-                   'macro', 'madness', 'magically', 'mailed', 'major', 'makeup', 'malady', 'mammal', 'maps',
-                   'masterful', 'match', 'maul', 'maverick', 'maximum', 'mayor', 'maze', 'meant', 'mechanic',
-                   'medicate', 'meeting', 'megabyte', 'melting', 'memoir', 'menu', 'merger', 'mesh', 'metro', 'mews',
-                   'mice', 'midst', 'mighty', 'mime', 'mirror', 'misery', 'mittens', 'mixture', 'moat', 'mobile',
-                   'mocked', 'mohawk', 'moisture', 'molten', 'moment', 'money', 'moon', 'mops', 'morsel', 'mostly',
-                   'motherly', 'mouth', 'movement', 'mowing', 'much', 'muddy', 'muffin', 'mugged', 'mullet', 'mumble',
-                   'mundane', 'muppet', 'mural', 'musical', 'muzzle', 'myriad', 'mystery', 'myth', 'nabbing', 'nagged',
-                   'nail', 'names', 'nanny', 'napkin', 'narrate', 'nasty', 'natural', 'nautical', 'navy', 'nearby',
-                   'necklace', 'needed', 'negative', 'neither', 'neon', 'nephew', 'nerves', 'nestle', 'network',
-                   'neutral', 'never', 'newt', 'nexus', 'nibs', 'niche', 'niece', 'nifty', 'nightly', 'nimbly',
-                   'nineteen', 'nirvana', 'nitrogen', 'nobody', 'nocturnal', 'nodes', 'noises', 'nomad', 'noodles',
-                   'northern', 'nostril', 'noted', 'nouns', 'novelty', 'nowhere', 'nozzle', 'nuance', 'nucleus',
-                   'nudged', 'nugget', 'nuisance', 'null', 'number', 'nuns', 'nurse', 'nutshell', 'nylon', 'oaks',
-                   'oars', 'oasis', 'oatmeal', 'obedient', 'object', 'obliged', 'obnoxious', 'observant', 'obtains',
-                   'obvious', 'occur', 'ocean', 'october', 'odds', 'odometer', 'offend', 'often', 'oilfield',
-                   'ointment', 'okay', 'older', 'olive', 'olympics', 'omega', 'omission', 'omnibus', 'onboard',
-                   'oncoming', 'oneself', 'ongoing', 'onion', 'online', 'onslaught', 'onto', 'onward', 'oozed',
-                   'opacity', 'opened', 'opposite', 'optical', 'opus', 'orange', 'orbit', 'orchid', 'orders', 'organs',
-                   'origin', 'ornament', 'orphans', 'oscar', 'ostrich', 'otherwise', 'otter', 'ouch', 'ought', 'ounce',
-                   'ourselves', 'oust', 'outbreak', 'oval', 'oven', 'owed', 'owls', 'owner', 'oxidant', 'oxygen',
-                   'oyster', 'ozone', 'pact', 'paddles', 'pager', 'pairing', 'palace', 'pamphlet', 'pancakes', 'paper',
-                   'paradise', 'pastry', 'patio', 'pause', 'pavements', 'pawnshop', 'payment', 'peaches', 'pebbles',
-                   'peculiar', 'pedantic', 'peeled', 'pegs', 'pelican', 'pencil', 'people', 'pepper', 'perfect',
-                   'pests', 'petals', 'phase', 'pheasants', 'phone', 'phrases', 'physics', 'piano', 'picked', 'pierce',
-                   'pigment', 'piloted', 'pimple', 'pinched', 'pioneer', 'pipeline', 'pirate', 'pistons', 'pitched',
-                   'pivot', 'pixels', 'pizza', 'playful', 'pledge', 'pliers', 'plotting', 'plus', 'plywood', 'poaching',
-                   'pockets', 'podcast', 'poetry', 'point', 'poker', 'polar', 'ponies', 'pool', 'popular', 'portents',
-                   'possible', 'potato', 'pouch', 'poverty', 'powder', 'pram', 'present', 'pride', 'problems', 'pruned',
-                   'prying', 'psychic', 'public', 'puck', 'puddle', 'puffin', 'pulp', 'pumpkins', 'punch', 'puppy',
-                   'purged', 'push', 'putty', 'puzzled', 'pylons', 'pyramid', 'python', 'queen', 'quick', 'quote',
-                   'rabbits', 'racetrack', 'radar', 'rafts', 'rage', 'railway', 'raking', 'rally', 'ramped', 'randomly',
-                   'rapid', 'rarest', 'rash', 'rated', 'ravine', 'rays', 'razor', 'react', 'rebel', 'recipe', 'reduce',
-                   'reef', 'refer', 'regular', 'reheat', 'reinvest', 'rejoices', 'rekindle', 'relic', 'remedy',
-                   'renting', 'reorder', 'repent', 'request', 'reruns', 'rest', 'return', 'reunion', 'revamp', 'rewind',
-                   'rhino', 'rhythm', 'ribbon', 'richly', 'ridges', 'rift', 'rigid', 'rims', 'ringing', 'riots',
-                   'ripped', 'rising', 'ritual', 'river', 'roared', 'robot', 'rockets', 'rodent', 'rogue', 'roles',
-                   'romance', 'roomy', 'roped', 'roster', 'rotate', 'rounded', 'rover', 'rowboat', 'royal', 'ruby',
-                   'rudely', 'ruffled', 'rugged', 'ruined', 'ruling', 'rumble', 'runway', 'rural', 'rustled',
-                   'ruthless', 'sabotage', 'sack', 'sadness', 'safety', 'saga', 'sailor', 'sake', 'salads', 'sample',
-                   'sanity', 'sapling', 'sarcasm', 'sash', 'satin', 'saucepan', 'saved', 'sawmill', 'saxophone',
-                   'sayings', 'scamper', 'scenic', 'school', 'science', 'scoop', 'scrub', 'scuba', 'seasons', 'second',
-                   'sedan', 'seeded', 'segments', 'seismic', 'selfish', 'semifinal', 'sensible', 'september',
-                   'sequence', 'serving', 'session', 'setup', 'seventh', 'sewage', 'shackles', 'shelter', 'shipped',
-                   'shocking', 'shrugged', 'shuffled', 'shyness', 'siblings', 'sickness', 'sidekick', 'sieve',
-                   'sifting', 'sighting', 'silk', 'simplest', 'sincerely', 'sipped', 'siren', 'situated', 'sixteen',
-                   'sizes', 'skater', 'skew', 'skirting', 'skulls', 'skydive', 'slackens', 'sleepless', 'slid',
-                   'slower', 'slug', 'smash', 'smelting', 'smidgen', 'smog', 'smuggled', 'snake', 'sneeze', 'sniff',
-                   'snout', 'snug', 'soapy', 'sober', 'soccer', 'soda', 'software', 'soggy', 'soil', 'solved',
-                   'somewhere', 'sonic', 'soothe', 'soprano', 'sorry', 'southern', 'sovereign', 'sowed', 'soya',
-                   'space', 'speedy', 'sphere', 'spiders', 'splendid', 'spout', 'sprig', 'spud', 'spying', 'square',
-                   'stacking', 'stellar', 'stick', 'stockpile', 'strained', 'stunning', 'stylishly', 'subtly',
-                   'succeed', 'suddenly', 'suede', 'suffice', 'sugar', 'suitcase', 'sulking', 'summon', 'sunken',
-                   'superior', 'surfer', 'sushi', 'suture', 'swagger', 'swept', 'swiftly', 'sword', 'swung', 'syllabus',
-                   'symptoms', 'syndrome', 'syringe', 'system', 'taboo', 'tacit', 'tadpoles', 'tagged', 'tail', 'taken',
-                   'talent', 'tamper', 'tanks', 'tapestry', 'tarnished', 'tasked', 'tattoo', 'taunts', 'tavern',
-                   'tawny', 'taxi', 'teardrop', 'technical', 'tedious', 'teeming', 'tell', 'template', 'tender',
-                   'tepid', 'tequila', 'terminal', 'testing', 'tether', 'textbook', 'thaw', 'theatrics', 'thirsty',
-                   'thorn', 'threaten', 'thumbs', 'thwart', 'ticket', 'tidy', 'tiers', 'tiger', 'tilt', 'timber',
-                   'tinted', 'tipsy', 'tirade', 'tissue', 'titans', 'toaster', 'tobacco', 'today', 'toenail', 'toffee',
-                   'together', 'toilet', 'token', 'tolerant', 'tomorrow', 'tonic', 'toolbox', 'topic', 'torch',
-                   'tossed', 'total', 'touchy', 'towel', 'toxic', 'toyed', 'trash', 'trendy', 'tribal', 'trolling',
-                   'truth', 'trying', 'tsunami', 'tubes', 'tucks', 'tudor', 'tuesday', 'tufts', 'tugs', 'tuition',
-                   'tulips', 'tumbling', 'tunnel', 'turnip', 'tusks', 'tutor', 'tuxedo', 'twang', 'tweezers', 'twice',
-                   'twofold', 'tycoon', 'typist', 'tyrant', 'ugly', 'ulcers', 'ultimate', 'umbrella', 'umpire',
-                   'unafraid', 'unbending', 'uncle', 'under', 'uneven', 'unfit', 'ungainly', 'unhappy', 'union',
-                   'unjustly', 'unknown', 'unlikely', 'unmask', 'unnoticed', 'unopened', 'unplugs', 'unquoted',
-                   'unrest', 'unsafe', 'until', 'unusual', 'unveil', 'unwind', 'unzip', 'upbeat', 'upcoming', 'update',
-                   'upgrade', 'uphill', 'upkeep', 'upload', 'upon', 'upper', 'upright', 'upstairs', 'uptight',
-                   'upwards', 'urban', 'urchins', 'urgent', 'usage', 'useful', 'usher', 'using', 'usual', 'utensils',
-                   'utility', 'utmost', 'utopia', 'uttered', 'vacation', 'vague', 'vain', 'value', 'vampire', 'vane',
-                   'vapidly', 'vary', 'vastness', 'vats', 'vaults', 'vector', 'veered', 'vegan', 'vehicle', 'vein',
-                   'velvet', 'venomous', 'verification', 'vessel', 'veteran', 'vexed', 'vials', 'vibrate', 'victim',
-                   'video', 'viewpoint', 'vigilant', 'viking', 'village', 'vinegar', 'violin', 'vipers', 'virtual',
-                   'visited', 'vitals', 'vivid', 'vixen', 'vocal', 'vogue', 'voice', 'volcano', 'vortex', 'voted',
-                   'voucher', 'vowels', 'voyage', 'vulture', 'wade', 'waffle', 'wagtail', 'waist', 'waking', 'wallets',
-                   'wanted', 'warped', 'washing', 'water', 'waveform', 'waxing', 'wayside', 'weavers', 'website',
-                   'wedge', 'weekday', 'weird', 'welders', 'went', 'wept', 'were', 'western', 'wetsuit', 'whale',
-                   'when', 'whipped', 'whole', 'wickets', 'width', 'wield', 'wife', 'wiggle', 'wildly', 'winter',
-                   'wipeout', 'wiring', 'wise', 'withdrawn', 'wives', 'wizard', 'wobbly', 'woes', 'woken', 'wolf',
-                   'womanly', 'wonders', 'woozy', 'worry', 'wounded', 'woven', 'wrap', 'wrist', 'wrong', 'yacht',
-                   'yahoo', 'yanks', 'yard', 'yawning', 'yearbook', 'yellow', 'yesterday', 'yeti', 'yields', 'yodel',
-                   'yoga', 'younger', 'yoyo', 'zapped', 'zeal', 'zebra', 'zero', 'zesty', 'zigzags', 'zinger',
-                   'zippers', 'zodiac', 'zombie', 'zones', 'zoom'}
-
-
-def overlapping_offset(start, end, existing_offsets):
-    for existing_start, existing_end in existing_offsets:
-        if existing_start <= start <= existing_end or existing_start <= end <= existing_end:
-            return True
-    return False
-
-
-def find_bip39_word_sequences(filedata, used_patterns, found_addresses, match_offset):
-    matchcount = 0
-    last_match_end = 0
-    sequence_start = 0
-    unique_words = []
-    current_wordlist = None
 
-    try:
-        for match in re.finditer(b'[A-Za-z]{3,8}', filedata):
-            matchtext = match.group().decode('utf8').lower()
-
-            if current_wordlist is None:
-                if matchtext in wordlist:
-                    current_wordlist = wordlist
-                elif matchtext in monero_wordlist:
-                    current_wordlist = monero_wordlist
-
-            if current_wordlist and matchtext in current_wordlist:
-                current_start = match.start()
-                if matchtext not in unique_words:
-                    if (current_start - last_match_end) < 15 or matchcount == 0:
-                        if matchcount == 0:
-                            sequence_start = current_start
-
-                        matchcount += 1
-                        unique_words.append(matchtext)
-                        if matchcount == 12:
-                            used_patterns.append('BIP-39 Seed String - Interesting file')
-                            found_addresses.append(' '.join(unique_words))
-                            match_offset.append(sequence_start)
-                        last_match_end = match.end()
-                    else:
-                        matchcount = 0
-                        unique_words.clear()
-                        current_wordlist = None
-
-    except UnicodeDecodeError as err:
-        print(f"Unicode decode error in longseed processing: {err}")
-    except Exception as err:
-        print(f"Unexpected error in longseed processing: {err}")
+def pattern_set_version():
+    # Changes whenever a pattern is added, removed or edited, which invalidates cached scan results. The raw scan and
+    # media scan settings change the results too
+    scan_settings = FileType.raw_scan_types(), FileType.select_scan_policies()
+    return hashlib.sha1(repr([(pattern.pattern, pattern.flags, description) for pattern, description in patterns] + [scan_settings]).encode()).hexdigest()
+
+
+def split_leading_byte(pattern_source):
+    # Splits a pattern into the byte class of its first element and the remaining pattern
+    if pattern_source.startswith(b'['):
+        leading_end = pattern_source.find(b']') + 1
+    elif pattern_source[:1].isalnum():
+        leading_end = 1
+    else:
+        return None
+
+    if pattern_source[leading_end:leading_end + 3] == b'{1}':
+        leading_end += 3
+
+    leading_pattern = re.compile(pattern_source[:leading_end])
+    leading_bytes = [byte for byte in range(256) if leading_pattern.fullmatch(bytes([byte]))]
+    return leading_bytes, pattern_source[leading_end:]
+
+
+def build_combined_pattern(pattern_list):
+    # One alternation branch per leading byte, with a lookahead for the rest of every pattern starting with that byte
+    dispatch = {}
+    pattern_rests = {}
+    separate_indexes = []
+
+    for index, (pattern, description) in enumerate(pattern_list):
+        split_pattern = split_leading_byte(pattern.pattern)
+        if split_pattern is None:
+            separate_indexes.append(index)
+            continue
+        leading_bytes, pattern_rests[index] = split_pattern
+        for byte in leading_bytes:
+            dispatch.setdefault(byte, []).append(index)
+
+    branches = []
+    for byte, indexes in sorted(dispatch.items()):
+        lookahead = b'|'.join(b'(?:' + pattern_rests[index] + b')' for index in indexes)
+        branches.append(re.escape(bytes([byte])) + b'(?=' + lookahead + b')')
+
+    if not branches:
+        return None, dispatch, separate_indexes
+    return re.compile(b'|'.join(branches)), dispatch, separate_indexes
+
+
+scan_window_size = 64 * 1024 * 1024
+
+split_file_size = 1024 * 1024 * 1024  # Raw files larger than this are scanned as several byte ranges in parallel
+member_batch_size = 64 * 1024 * 1024  # Small archive members are handed to the workers in batches of this size
+member_batch_count = 256
+image_range_size = 1024 * 1024 * 1024  # Unused space of a disk image is scanned in tasks of up to this many bytes
+
+pdf_scan_size = 4 * 1024 * 1024  # PDF page text is scanned in chunks of about this size while it's extracted
+pdf_split_size = 4 * 1024 * 1024  # PDF files larger than this are scanned as several page ranges in parallel
+pdf_task_pages = 250
+media_scan_size = 256 * 1024  # The metadata scan policy scans this much at the start and end of media files
+task_sniff_size = 4 * 1024 * 1024  # Larger files are typed from their content before they are queued, to pick the task
+
+memory_budget = None  # Set in the pool workers, see Cryptoscan.init_worker
+
+
+def find_pattern_matches(filedata, window_start, window_end, search_end, next_start):
+    # Returns the (start, end) spans pattern.finditer() would give for every pattern, limited to matches starting in
+    # the window. All patterns with a fixed leading byte are found in a single pass, patterns starting with a group
+    # (the seed string) get their own pass. next_start holds where each pattern may match next and is updated, so
+    # consecutive windows give the same matches as one search over the whole buffer.
+    matches = [[] for _ in patterns]
+
+    for trigger in (combined_pattern.finditer(filedata, window_start, search_end) if combined_pattern else ()):
+        start = trigger.start()
+        if start >= window_end:
+            break
+        for index in leading_byte_dispatch[filedata[start]]:
+            if start >= next_start[index]:
+                match = patterns[index][0].match(filedata, start, search_end)
+                if match:
+                    matches[index].append(match.span())
+                    next_start[index] = match.end()
+
+    for index in separate_pattern_indexes:
+        for match in patterns[index][0].finditer(filedata, max(window_start, next_start[index]), search_end):
+            if match.start() >= window_end:
+                break
+            matches[index].append(match.span())
+            next_start[index] = match.end()
+
+    return matches
+
+
+class OffsetIndex:
+    """
+    OffsetIndex keeps the claimed (start, end) regions of a file sorted by start, so overlap checks and inserts
+    are done with bisect instead of scanning every claimed region.
+    Like the overlapping_offset check it replaced, a match overlaps when its start or end is inside a claimed region,
+    a match containing claimed regions doesn't. Only the outermost regions are kept, so they never overlap each other.
+    """
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def holds(self, offset):
+        # The last region starting at or before offset is the only one that can hold it
+        position = bisect_right(self.starts, offset)
+        return position > 0 and self.ends[position - 1] >= offset
+
+    def overlaps(self, start, end):
+        return self.holds(start) or self.holds(end)
+
+    def add(self, start, end):
+        # Regions inside the new one are replaced by it, a new region inside a claimed one isn't added
+        if self.holds(start):
+            return
+        first = bisect_left(self.starts, start)
+        last = bisect_right(self.starts, end)
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def claim(self, start, end):
+        if self.overlaps(start, end):
+            return False
+        self.add(start, end)
+        return True
+
+
+base64_characters = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+base64_blob_length = 256
+prefilter_descriptions = ['BIP32 HD wallet private node', 'BIP32 HD wallet public node', 'Monero Address',
+                          'BIP38 Encrypted Private Key', 'WIF Private key compressed public key',
+                          'WIF Private key uncompressed public key', 'DASH Address', 'NEO Address', 'DOGE Address',
+                          'Ripple Address', 'Bitcoin Address', 'Bitcoin Address P2SH']
+utf16_characters = bytes([9, 10, 13]) + bytes(range(0x20, 0x7f))  # ASCII text in UTF-16 has a 0x00 byte next to these
+utf16_region_length = 1024 * 1024  # Characters, longer UTF-16 text is split in regions of this length
+prefilters_enabled = True  # Set in the pool workers, see Cryptoscan.init_worker
+prefilter_counts = Counter()  # Candidates seen and removed per filter, collected by the parent after every task
+scan_counts = Counter()  # Media files per scan policy and their bytes left unscanned, collected like prefilter_counts
+
+
+def select_patterns(descriptions):
+    # Compiles only the patterns with one of the given descriptions and rebuilds everything derived from them. Called
+    # at import with all patterns, and again in the parent and the pool workers when a profile is selected
+    global patterns, combined_pattern, leading_byte_dispatch, separate_pattern_indexes, max_pattern_length
+    global prefilter_indexes, seeds_enabled, utf16_region_pattern
+
+    patterns = [(re.compile(pattern_source), description) for pattern_source, description in all_patterns
+                if description in descriptions]
+    combined_pattern, leading_byte_dispatch, separate_pattern_indexes = build_combined_pattern(patterns)
+    max_pattern_length = max((sre_parse.parse(pattern.pattern).getwidth()[1] for pattern, description in patterns), default=0)
+    # Base58 patterns, the UTF-16 variants excluded
+    prefilter_indexes = {index for index, (pattern, description) in enumerate(patterns)
+                         if description in prefilter_descriptions and b'\x00' not in pattern.pattern}
+    seeds_enabled = 'BIP-39 Seed String' in descriptions
+    min_pattern_length = min((sre_parse.parse(pattern.pattern).getwidth()[0] for pattern, description in patterns), default=0)
+    character_class = b'[' + re.escape(utf16_characters) + b']'
+    utf16_region_pattern = re.compile(rb'\x00%s(?:\x00%s){%d,%d}' % (character_class, character_class, max(min_pattern_length - 2, 0), utf16_region_length - 1))
+
+
+select_patterns([description for pattern_source, description in all_patterns])
+
+
+def in_base64_blob(filedata, match_start, match_end):
+    # True for a candidate inside a run of at least base64_blob_length base64 characters containing + or /, which
+    # aren't in any base58 alphabet. Those are pieces of encoded data and not addresses written out on their own
+    if match_start == 0 or filedata[match_start - 1] not in base64_characters:
+        return False
+    if match_end == len(filedata) or filedata[match_end] not in base64_characters:
+        return False
+
+    before = filedata[max(0, match_start - base64_blob_length):match_start]
+    after = filedata[match_end:match_end + base64_blob_length]
+    run = before[len(before.rstrip(base64_characters)):] + filedata[match_start:match_end] + after[:len(after) - len(after.lstrip(base64_characters))]
+    return len(run) >= base64_blob_length and (b'+' in run or b'/' in run)
+
+
+def prefilter_matches(filedata, matches):
+    # Removes candidates that can't be an address before they're validated. Random base58 strings have digits,
+    # lower and upper case letters, with only one of those it's a word, a number or padding
+    kept = []
+    prefilter_counts['candidates'] += len(matches)
+    for match_start, match_end in matches:
+        if in_base64_blob(filedata, match_start, match_end):
+            prefilter_counts['base64 blob'] += 1
+            continue
+
+        body = filedata[match_start + 1:match_end]
+        if body.isdigit() or (body.isalpha() and (body.islower() or body.isupper())):
+            prefilter_counts['single character class'] += 1
+            continue
+        kept.append((match_start, match_end))
+    return kept
+
+
+class UTF16Text:
+    """
+    UTF16Text holds the ASCII characters of the UTF-16 text regions found in a buffer and maps offsets in the text back
+    to the offset of the character in the buffer. Regions are separated by a 0x00 byte, which no pattern matches, so a
+    match never joins the text of two regions.
+    """
+    def __init__(self):
+        self.parts = []
+        self.length = 0
+        self.text_starts = []
+        self.buffer_starts = []
+
+    def add(self, characters, buffer_start):
+        # Characters of a region are 2 bytes apart in the buffer, starting at buffer_start
+        self.text_starts.append(self.length)
+        self.buffer_starts.append(buffer_start)
+        self.parts.append(characters)
+        self.length += len(characters) + 1
+
+    def text(self):
+        return b'\x00'.join(self.parts)
+
+    def buffer_offset(self, text_offset):
+        region = bisect_right(self.text_starts, text_offset) - 1
+        return self.buffer_starts[region] + 2 * (text_offset - self.text_starts[region])
+
+
+def find_utf16_text(filedata, window_start, window_end, next_start):
+    # Collects the UTF-16 regions starting in the window. Regions are found from their first 0x00 byte, which both
+    # UTF-16LE and UTF-16BE text has between its characters, so the search runs at memchr speed on data without any.
+    # LE text also has a character before that byte, it's added when the region ends on the 0x00 of its last character.
+    # Returns the text and where the next window continues, regions cut at utf16_region_length overlap the next one
+    utf16_text = UTF16Text()
+    search_end = min(window_end + 2 * utf16_region_length + 1, len(filedata))
+    next_start = max(window_start, next_start)
+
+    while True:
+        region = utf16_region_pattern.search(filedata, next_start, search_end)
+        if not region or region.start() >= window_end:
+            break
 
+        region_start, region_end = region.span()
 
-def file_data_search(filedata, filepath, printablesize):
+        next_start = region_end
+        if region_end - region_start >= 2 * utf16_region_length:
+            next_start = max(region_end - 2 * max_pattern_length, region_start + 2)
+
+        characters = filedata[region_start + 1:region_end:2]
+        if region_start > 0 and region_end < len(filedata) and filedata[region_end] == 0 and \
+                filedata[region_start - 1] in utf16_characters:
+            characters = filedata[region_start - 1:region_start] + characters
+            region_start -= 2
+        utf16_text.add(characters, region_start + 1)
+
+    return utf16_text, next_start
+
+
+bip39_token_pattern = re.compile(rb'[A-Za-z]{3,8}')
+non_letter_pattern = re.compile(rb'[^A-Za-z]')
+
+
+def bip39_word_tokens(filedata, start, end):
+    # Tokens are lowercased and looked up in batches through map/compress, so only the tokens found in one of the
+    # wordlists get to the Python loop in SeedSequenceFinder
+    matches, lookup_matches = tee(bip39_token_pattern.finditer(filedata, start, end))
+    word_ids, selectors = tee(map(Wordlist.index.get, map(bytes.lower, map(re.Match.group, lookup_matches))))
+    return compress(zip(word_ids, matches), selectors)
+
+
+class SeedSequenceFinder:
+    """
+    SeedSequenceFinder looks for 12 distinct words of one seed wordlist, each less than 15 bytes after the previous
+    one. The state is kept between calls to search(), so a buffer can be searched window by window.
+    """
+    def __init__(self, start=0):
+        self.token_start = start
+        self.matchcount = 0
+        self.last_match_end = 0
+        self.sequence_start = 0
+        self.sequence_ids = []
+        self.unique_ids = set()
+        self.current_ids = None
+
+        self.used_patterns = []
+        self.found_addresses = []
+        self.match_offset = []
+
+    def search(self, filedata, window_end):
+        # Tokens never cross a non-letter, so the search stops at the first one at or after the window end
+        boundary = non_letter_pattern.search(filedata, window_end)
+        token_end = boundary.start() if boundary else len(filedata)
+        if token_end <= self.token_start:
+            return
+
+        try:
+            for word_id, match in bip39_word_tokens(filedata, self.token_start, token_end):
+                self.add_word(word_id, match.start(), match.end())
+
+        except Exception as err:
+            print(f"Unexpected error in longseed processing: {err}")
+
+        self.token_start = token_end
+
+    def add_word(self, word_id, current_start, current_end):
+        if self.current_ids is None:
+            if word_id in Wordlist.index.english_ids:
+                self.current_ids = Wordlist.index.english_ids
+            elif word_id in Wordlist.index.monero_ids:
+                self.current_ids = Wordlist.index.monero_ids
+
+        if self.current_ids is not None and word_id in self.current_ids and word_id not in self.unique_ids:
+            if (current_start - self.last_match_end) < 15 or self.matchcount == 0:
+                if self.matchcount == 0:
+                    self.sequence_start = current_start
+
+                self.matchcount += 1
+                self.sequence_ids.append(word_id)
+                self.unique_ids.add(word_id)
+                if self.matchcount == 12:
+                    self.used_patterns.append('BIP-39 Seed String - Interesting file')
+                    self.found_addresses.append(b' '.join(map(Wordlist.index.word, self.sequence_ids)).decode())
+                    self.match_offset.append(self.sequence_start)
+                self.last_match_end = current_end
+            else:
+                self.matchcount = 0
+                self.sequence_ids.clear()
+                self.unique_ids.clear()
+                self.current_ids = None
+
+
+def release_window(filedata, start, end):
+    # Drops the pages of a scanned window from a memory map, so the resident memory of a worker stays at about one
+    # window no matter how large the file is. Plain bytes buffers, and platforms without madvise, are left as is.
+    if isinstance(filedata, mmap) and MADV_DONTNEED is not None:
+        start -= start % PAGESIZE
+        end -= end % PAGESIZE
+        if end > start:
+            filedata.madvise(MADV_DONTNEED, start, end - start)
+
+
+def scan_memory_estimate(file_instance):
+    # Extracted documents are held in memory as text, a memory map only keeps the current window resident
+    if file_instance.getfiletype().kind == 'pages':
+        return file_instance.getfilesize() + pdf_scan_size
+    if file_instance.getfiletype().kind == 'text':
+        return file_instance.getfilesize() * 4
+    if MADV_DONTNEED is not None:
+        return min(file_instance.getfilesize(), scan_window_size + max_pattern_length)
+    return file_instance.getfilesize()
+
+
+def memory_lease(file_instance, file_path_printable):
+    memory_estimate = scan_memory_estimate(file_instance)
+    if memory_budget is None or memory_estimate < scan_window_size:
+        return nullcontext()
+    return memory_budget.lease(memory_estimate, file_path_printable)
+
+
+def add_pattern_hits(filedata, pattern_matches, used_offsets, results, buffer_offset=None):
+    # Validates the matches of every pattern and adds the hits to results. Matches in the UTF-16 text are claimed and
+    # reported at their offset in the scanned buffer, given by buffer_offset. Returns the number of seed strings found
+    used_patterns, found_addresses, match_offset = results
+    found_seedstrings_count = 0
+
+    for index, ((pattern, description), matches) in enumerate(zip(patterns, pattern_matches)):
+        if description == 'BIP-39 Seed String':
+            for match_start, match_end in matches:
+                words = filedata[match_start:match_end].lower().split()
+                if len(set(words)) == 12 and Wordlist.index.in_one_wordlist(words):
+                    seed_string = b' '.join(words).decode()
+                    used_patterns.append('BIP-39 Seed String')
+                    found_addresses.append(seed_string)
+                    match_offset.append(buffer_offset(match_start) if buffer_offset else match_start)
+                    found_seedstrings_count += 1
+            continue
+
+        if prefilters_enabled and index in prefilter_indexes:
+            matches = prefilter_matches(filedata, matches)
+        matched_strings = [filedata[match_start:match_end].decode("utf-8") for match_start, match_end in matches]
+        verdicts = Validator.validate_addresses(matched_strings, description)
+        for (match_start, match_end), matched_string, verdict in zip(matches, matched_strings, verdicts):
+            if buffer_offset:
+                match_start, match_end = buffer_offset(match_start), buffer_offset(match_end - 1) + 1
+            if verdict and used_offsets.claim(match_start, match_end):
+                if description == 'Ethereum Address' and Validator.ethereum_check_if_unverifyable(matched_string):
+                    used_patterns.append('Ethereum Address (unverifyable)')
+                else:
+                    used_patterns.append(description)
+                found_addresses.append(matched_string)
+                match_offset.append(match_start)
+
+    return found_seedstrings_count
+
+
+def file_data_search(filedata, filepath, printablesize, used_offsets=None, start=0, end=None, next_start=None):
+    # Searches filedata[start:end] window by window. Matches starting in the range are reported with their absolute
+    # offset in filedata and may run up to max_pattern_length bytes past the end of the range.
+    # next_start is updated like in find_pattern_matches, a caller scanning a text in consecutive buffers passes it on
     found_addresses = []
     found_seedstrings_count = 0
-    start_time = time.time()
-    last_check_time = start_time
+    last_check_time = time.time()
+
+    if used_offsets is None:
+        used_offsets = OffsetIndex()
+    if end is None:
+        end = len(filedata)
 
-    used_offsets = []
     used_patterns = []
     match_offset = []
+    results = used_patterns, found_addresses, match_offset
+    if next_start is None:
+        next_start = [start] * len(patterns)
+    utf16_next_start = start
+    sequence_finder = SeedSequenceFinder(start)
+
+    for window_start in range(start, end, scan_window_size):
+        window_end = min(window_start + scan_window_size, end)
+        search_end = min(window_end + max_pattern_length, len(filedata))
 
-    for pattern, description in patterns:
         current_time = time.time()
         if current_time - last_check_time > 15:
             last_check_time = current_time
             printabletime = datetime.datetime.now().strftime("%H:%M:%S")
-            print(f"{printabletime}: Still processing {filepath} ({printablesize}). Currently searching for: {description}.")
-        for match in pattern.finditer(filedata):
-            start, end = match.start(), match.end()
-
-            if description == 'BIP-39 Seed String':
-                words = match.group().decode('utf8').lower().split()
-                if len(set(words)) == 12 and (all(word in wordlist for word in words) or all(word in monero_wordlist for word in words)):
-                    seed_string = ' '.join(words)
-                    used_patterns.append('BIP-39 Seed String')
-                    found_addresses.append(seed_string)
-                    match_offset.append(start)
-                    found_seedstrings_count += 1
+            print(f"{printabletime}: Still processing {filepath} ({printablesize}). {int((window_start - start) * 100 / (end - start))}% done.")
 
-            else:
-                matched_string = filedata[start:end].decode("utf-8")
-                if Validator.validate_address(matched_string, description):
-                    if not overlapping_offset(start, end, used_offsets):
-                        if description == 'Ethereum Address' and Validator.ethereum_check_if_unverifyable(matched_string):
-                            used_patterns.append('Ethereum Address (unverifyable)')
-                        else:
-                            used_patterns.append(description)
-                        found_addresses.append(matched_string)
-                        match_offset.append(start)
-                        used_offsets.append([start, end])
+        pattern_matches = find_pattern_matches(filedata, window_start, window_end, search_end, next_start)
+
+        found_seedstrings_count += add_pattern_hits(filedata, pattern_matches, used_offsets, results)
+
+        utf16_text, utf16_next_start = find_utf16_text(filedata, window_start, window_end, utf16_next_start)
+        if utf16_text.parts:
+            text = utf16_text.text()
+            text_matches = find_pattern_matches(text, 0, len(text), len(text), [0] * len(patterns))
+            found_seedstrings_count += add_pattern_hits(text, text_matches, used_offsets, results, utf16_text.buffer_offset)
+
+        if seeds_enabled and found_seedstrings_count == 0:
+            sequence_finder.search(filedata, window_end)
+
+        release_window(filedata, window_start, window_end)
 
     if found_seedstrings_count == 0:
-        find_bip39_word_sequences(filedata, used_patterns, found_addresses, match_offset)
+        used_patterns += sequence_finder.used_patterns
+        found_addresses += sequence_finder.found_addresses
+        match_offset += sequence_finder.match_offset
 
     return used_patterns, found_addresses, match_offset
 
 
-def read_in_chunks(file_instance, overlap_size=1024):
-    chunk_size = int((psutil.virtual_memory().available / int(multiprocessing.cpu_count() - 2)) * 0.90)
-    total_size = file_instance.getfilesize()
-    total_chunks = (total_size // chunk_size) + (1 if total_size % chunk_size > 0 else 0)
-    current_chunk = 1
+def pdf_data_search(pdf, file_instance, printablesize, first_page=0, last_page=None):
+    # Scans the page text while it's extracted, in chunks of about pdf_scan_size. The last max_pattern_length bytes of
+    # a chunk are scanned with the next one, and where each pattern may match next is carried over, so the chunks give
+    # the same matches as one scan of the whole text. A page range is scanned with the start of the text after it,
+    # like a byte range, so matches running over its last page are found whole.
+    # Offsets are reported as the offset in the page text together with the page number
+    chunk_results = {}
+    page_starts = []
+    page_numbers = []
+    chunk_parts = [b'']  # Starts with the unscanned end of the previous chunk
+    chunk_length = 0
+    chunk_start = 0  # Offset of the chunk in the text of all pages
+    next_start = [0] * len(patterns)  # In the current chunk
 
-    with open(file_instance.getfilepath(), 'rb') as file:
-        prev_chunk_end = b''
-        while True:
-            chunk = file.read(chunk_size)
-            if not chunk:
-                break
-            combined_chunk = prev_chunk_end + chunk
-            yield combined_chunk, current_chunk, total_chunks
-            prev_chunk_end = chunk[-overlap_size:]
-            current_chunk += 1
+    def scan_chunk(last_chunk, text_after=b''):
+        chunk = b''.join(chunk_parts)
+        scan_end = len(chunk) if last_chunk else max(len(chunk) - max_pattern_length, 0)
+        if scan_end:
+            used_patterns, found_addresses, match_offset = file_data_search(chunk + text_after, file_instance.getfilepath(), printablesize,
+                                                                            None, 0, scan_end, next_start)
+            chunk_results[chunk_start] = used_patterns, found_addresses, [chunk_start + offset for offset in match_offset]
+        next_start[:] = [max(position - scan_end, 0) for position in next_start]
+        chunk_parts[:] = [chunk[scan_end:]]
+        return scan_end
 
+    for page_number, page_text in file_instance.pdfpages(pdf, first_page, last_page):
+        page_starts.append(chunk_start + len(chunk_parts[0]) + chunk_length)
+        page_numbers.append(page_number)
+        chunk_parts.append(pdf_page_text(page_text))
+        chunk_length += len(chunk_parts[-1])
+        if chunk_length >= pdf_scan_size:
+            chunk_start += scan_chunk(False)
+            chunk_length = 0
+    scan_chunk(True, pdf_text_after(pdf, file_instance, last_page))
 
-def process_file(inputmaxsize, excluded_paths, archive_path, temppath, file_path):
-    file_instance = FileHandler(file_path)
+    used_patterns, found_addresses, match_offset = merge_range_results(chunk_results)
+    for index, offset in enumerate(match_offset):
+        page = bisect_right(page_starts, offset) - 1
+        match_offset[index] = f"{offset - page_starts[page]} (page {page_numbers[page]})"
+    return used_patterns, found_addresses, match_offset
+
+
+def pdf_page_text(page_text):
+    # Pages are scanned as one text, a page not ending in whitespace gets a line break so its last word isn't joined
+    # with the first word of the next page
+    if not page_text[-1:].isspace():
+        page_text += b'\n'
+    return page_text
+
+
+def pdf_text_after(pdf, file_instance, last_page):
+    # The first max_pattern_length bytes of the text after a page range, empty for the last pages
+    text_after = b''
+    if last_page is None:
+        return text_after
+    for page_number, page_text in file_instance.pdfpages(pdf, last_page):
+        text_after += pdf_page_text(page_text)
+        if len(text_after) >= max_pattern_length:
+            break
+    return text_after[:max_pattern_length]
+
+
+def raw_data_search(file_instance, scan_policy='full'):
+    # The metadata policy only scans the start and end of a file, where EXIF, ID3 and MP4 metadata is kept
+    if scan_policy == 'skip':
+        return [], [], []
+    with file_instance.rawdata() as rawdata:
+        filepath = file_instance.getfilepath()
+        printablesize = file_instance.getfilesize_printable()
+        if scan_policy == 'metadata' and len(rawdata) > 2 * media_scan_size:
+            tail_start = len(rawdata) - media_scan_size
+            return merge_range_results({0: file_data_search(rawdata, filepath, printablesize, None, 0, media_scan_size),
+                                        tail_start: file_data_search(rawdata, filepath, printablesize, None, tail_start)})
+        return file_data_search(rawdata, filepath, printablesize)
+
+
+def media_scan_policy(file_type, filesize, found_wallet):
+    # Files that look like wallets are always scanned whole
+    if file_type.kind != 'media' or found_wallet or file_type.scan_policy == 'full':
+        return 'full'
+    scan_counts[file_type.scan_policy] += 1
+    if file_type.scan_policy == 'skip':
+        scan_counts['unscanned bytes'] += filesize
+    else:
+        scan_counts['unscanned bytes'] += max(filesize - 2 * media_scan_size, 0)
+    return file_type.scan_policy
+
+
+def merge_raw_results(text_results, raw_results):
+    # Adds the hits in the raw bytes of a document that the extracted text doesn't have. Raw hits with the same address
+    # as a text hit, or overlapping one at its offset mapped back to the file, are dropped
+    used_patterns, found_addresses, match_offset = (list(column) for column in text_results)
+    text_hits = set(zip(used_patterns, found_addresses))
+    seed_found = any('BIP-39 Seed String' in pattern for pattern in used_patterns)
+    used_offsets = OffsetIndex()
+    for pattern, address, offset in zip(*text_results):
+        if 'BIP-39 Seed String' not in pattern and isinstance(offset, int):
+            used_offsets.claim(offset, offset + len(address))
+
+    for pattern, address, offset in zip(*raw_results):
+        if (pattern, address) in text_hits:
+            continue
+        if 'BIP-39 Seed String' in pattern:
+            if pattern == 'BIP-39 Seed String - Interesting file' and seed_found:
+                continue
+        elif used_offsets.overlaps(offset, offset + len(address)):
+            continue
+        used_patterns.append(pattern)
+        found_addresses.append(address)
+        match_offset.append(offset)
+    return used_patterns, found_addresses, match_offset
+
+
+def process_file(inputmaxsize, excluded_paths, archive_path, temppath, file_path, file_data=None, image_file=None):
+    # image_file is the ImageReader.ImageFile of a file read from a disk image, see image_offset_results
+    file_instance = FileHandler(file_path, file_data)
     filesize = file_instance.getfilesize()
 
     if file_instance.check_if_excluded(excluded_paths):
@@ -526,41 +626,43 @@ def process_file(inputmaxsize, excluded_paths, archive_path, temppath, file_path
         file_path_printable = file_path.replace("\\", "/")
 
     print(f"{printabletime}: Scanning: {file_path_printable} ({file_instance.getfilesize_printable()})")
-    found_wallet_file = WalletFinder.findwallets(file_path)
-    found_wallet_path = WalletFinder.findwalletpath(file_path)
+    # Archive members spilled to a temp file are checked by their path in the archive, not the path of the temp file
+    found_wallet_file = WalletFinder.findwallets(archive_path or file_path)
+    found_wallet_path = WalletFinder.findwalletpath(archive_path or file_path)
 
     if file_instance.filecheck(inputmaxsize):
         return False
 
     try:
         results = []
-        supported_archives = ['.zip', '.7z', '.tar', '.gz', '.tgz', '.rar']
+        file_type = file_instance.getfiletype()
 
-        if file_instance.getfileextension() in supported_archives:
-            print(f"{printabletime}: Extracting files from: {file_path_printable}")
-            results = process_archive_file(inputmaxsize, excluded_paths, temppath, file_path)
+        if file_type.kind == 'archive':
+            print(f"{printabletime}: Reading files from: {file_path_printable}")
+            results = process_archive_file(inputmaxsize, excluded_paths, temppath, file_path, archive_path, file_data, file_type.name)
         else:
-            file_data = file_instance.getspecialfiledata()
-
-            if file_data:
-                results = file_data_search(file_data, file_path, file_instance.getfilesize_printable())
-
-            elif file_instance.getfilesize() > 1024 * 1024 * 1024:
-                combined_results = [[], [], []]
-                for file_data, chunk_num, total_chunks in read_in_chunks(file_instance):
-                    chunk_size = len(file_data)
-                    for unit in ['B', 'KB', 'MB', 'GB']:
-                        if chunk_size < 1024.0:
-                            break
-                        chunk_size /= 1024.0
-                    print(f"{printabletime}: Processing {file_path}: Chunk {chunk_num} of {total_chunks}, approximately {chunk_size:.{0}f}{unit}.")
-                    chunk_results = file_data_search(file_data, file_path, file_instance.getfilesize_printable())
-                    combined_results = [combined + chunk for combined, chunk in zip(combined_results, chunk_results)]
-                results = combined_results
+            with memory_lease(file_instance, file_path_printable):
+                scan_raw = file_type.scan_raw
+                pdf = file_type.extractor(file_instance) if file_type.kind == 'pages' else None
+                special_file_data = None if pdf else file_instance.getspecialfiledata()
 
-            else:
-                with open(file_instance.getfilepath(), 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mmapfile:
-                    results = file_data_search(mmapfile.read(), file_path, file_instance.getfilesize_printable())
+                if pdf:
+                    with pdf:
+                        results = pdf_data_search(pdf, file_instance, file_instance.getfilesize_printable())
+
+                elif special_file_data:
+                    results = file_data_search(special_file_data, file_path, file_instance.getfilesize_printable())
+                    if file_instance.offset_map:
+                        results[2][:] = map(file_instance.offset_map.source_offset, results[2])
+
+                else:
+                    results = raw_data_search(file_instance, media_scan_policy(file_type, filesize, found_wallet_file or found_wallet_path))
+                    scan_raw = False  # Not a document or it couldn't be read, so the raw bytes are scanned already
+                    if image_file:
+                        results = image_offset_results(results, image_file)
+
+                if scan_raw:
+                    results = merge_raw_results(results, raw_data_search(file_instance))
 
         if found_wallet_file:
             results[0].append("Wallet File")
@@ -577,7 +679,7 @@ def process_file(inputmaxsize, excluded_paths, archive_path, temppath, file_path
 
         print(f"{printabletime}: Done with: {file_path_printable} ({file_instance.getfilesize_printable()})")
 
-        if archive_path or file_instance.getfileextension() in supported_archives:
+        if archive_path or file_type.kind == 'archive':
             return results, archive_path, filesize
         else:
             return results, file_path, filesize
@@ -587,64 +689,416 @@ def process_file(inputmaxsize, excluded_paths, archive_path, temppath, file_path
         return False
 
 
-def extract_archive(archive_file_path, extract_to):
-    extension = os.path.splitext(archive_file_path)[1].lower()
+def add_wallet_hits(results, file_path):
+    if WalletFinder.findwallets(file_path):
+        results[0].append("Wallet File")
+        results[1].append("N/A")
+        results[2].append(0)
+
+    if WalletFinder.findwalletpath(file_path):
+        results[0].append("Wallet Path")
+        results[1].append("N/A")
+        results[2].append(0)
+
+
+def scan_key(file_path):
+    # Files with the same content are scanned the same way if they have the same key. The extension can decide the
+    # type, like for HTML without a doctype or an Office file stored as zip, and wallet files are always scanned whole
+    found_wallet = bool(WalletFinder.findwallets(file_path) or WalletFinder.findwalletpath(file_path))
+    return FileType.extension_type(file_path).name, found_wallet
+
+
+def duplicate_results(file_results, file_path):
+    # Results of a file for another file with the same content. Wallet hits depend on the path, so they are redone
+    results, result_path, filesize = file_results
+    hits = [hit for hit in zip(*results) if hit[0] not in ('Wallet File', 'Wallet Path')]
+    results = tuple(map(list, zip(*hits))) if hits else ([], [], [])
+    add_wallet_hits(results, file_path)
+    return results, file_path, filesize
+
+
+def split_pdf_pages(file_path, filesize):
+    # Page ranges for a large PDF file, the page count is only read for files over pdf_split_size
+    if filesize <= pdf_split_size:
+        return []
+    pdf = FileHandler(file_path).openpdf()
+    if not pdf:
+        return []
+    with pdf:
+        page_count = pdf.page_count
+    if page_count <= pdf_task_pages:
+        return []
+    return [(file_path, first_page, min(first_page + pdf_task_pages, page_count), page_count)
+            for first_page in range(0, page_count, pdf_task_pages)]
+
+
+def process_pdf_pages(inputmaxsize, excluded_paths, page_range):
+    # Results of a page range are returned like the results of a byte range, as (results, file_path, range_size,
+    # first_page), with range_size the share of the file size for the pages
+    file_path, first_page, last_page, page_count = page_range
+    file_instance = FileHandler(file_path)
+    file_path_printable = file_path.replace("\\", "/")
+    range_printable = f"pages {first_page + 1}-{last_page} of {page_count}"
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Scanning: {file_path_printable} ({range_printable})")
+
+    results = [], [], []
+    try:
+        pdf = file_instance.openpdf()
+        if pdf:
+            with pdf:
+                results = pdf_data_search(pdf, file_instance, range_printable, first_page, last_page)
+
+        if first_page == 0 and file_instance.getfiletype().scan_raw:
+            results = merge_raw_results(results, raw_data_search(file_instance))
+        if first_page == 0:
+            add_wallet_hits(results, file_path)
+
+    except Exception as err:
+        print(f"An error occurred while processing the file: {err}")
+
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Done with: {file_path_printable} ({range_printable})")
+    return results, file_path, file_instance.getfilesize() * (last_page - first_page) // page_count, first_page
+
+
+def split_file_ranges(file_path, filesize, file_type):
+    # Byte ranges for a large raw file, or a single whole-file task marked by range_end None
+    if filesize <= split_file_size or file_type.kind not in ('raw', 'media') or file_type.scan_policy != 'full':
+        return [(file_path, 0, None)]
+    return [(file_path, range_start, min(range_start + split_file_size, filesize)) for range_start in range(0, filesize, split_file_size)]
+
+
+def process_file_range(inputmaxsize, excluded_paths, temppath, file_range):
+    # Results of a byte range are returned as (results, file_path, range_size, range_start) and put back together
+    # with merge_range_results once every range of the file is done
+    file_path, range_start, range_end = file_range
+    if range_end is None:
+        return process_file(inputmaxsize, excluded_paths, None, temppath, file_path)
+
+    file_instance = FileHandler(file_path)
+    file_path_printable = file_path.replace("\\", "/")
+    range_printable = f"bytes {range_start}-{range_end} of {file_instance.getfilesize_printable()}"
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Scanning: {file_path_printable} ({range_printable})")
+
+    results = [], [], []
     try:
-        if extension == '.zip':
-            with zipfile.ZipFile(archive_file_path, 'r') as archive_ref:
-                archive_ref.extractall(extract_to)
-        elif extension == '.7z':
-            with py7zr.SevenZipFile(archive_file_path, 'r') as archive_ref:
-                archive_ref.extractall(extract_to)
-        elif extension in ['.tar', '.gz', '.tgz']:
-            with tarfile.open(archive_file_path, 'r:*') as archive_ref:
-                archive_ref.extractall(extract_to)
-        elif extension in ['.rar', '.rar5']:
-            with rarfile.RarFile(archive_file_path, 'r') as archive_ref:
-                archive_ref.extractall(extract_to)
+        with memory_lease(file_instance, file_path_printable):
+            with open(file_path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mmapfile:
+                results = file_data_search(mmapfile, file_path, range_printable, None, range_start, range_end)
+
+        if range_start == 0:
+            add_wallet_hits(results, file_path)
+
     except Exception as err:
-        print(f"Error extracting archive {archive_file_path}: {err}")
+        print(f"An error occurred while processing the file: {err}")
+
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Done with: {file_path_printable} ({range_printable})")
+    return results, file_path, range_end - range_start, range_start
+
+
+def merge_range_results(range_results):
+    # range_results maps range start to results. Matches running over the end of a byte range can overlap a match
+    # found by the next range, those are dropped. Page ranges of a PDF file don't overlap, their offsets are text.
+    # The fallback seed search only counts if no range found a seed string.
+    used_patterns, found_addresses, match_offset = [], [], []
+    used_offsets = OffsetIndex()
+    seed_found = any('BIP-39 Seed String' in range_result[0] for range_result in range_results.values())
+
+    for range_start in sorted(range_results):
+        range_claims = []
+        for pattern, address, offset in zip(*range_results[range_start]):
+            if pattern == 'BIP-39 Seed String - Interesting file' and seed_found:
+                continue
+            if pattern not in ('Wallet File', 'Wallet Path') and 'BIP-39 Seed String' not in pattern and isinstance(offset, int):
+                if used_offsets.overlaps(offset, offset + len(address)):
+                    continue
+                range_claims.append((offset, offset + len(address)))
+            used_patterns.append(pattern)
+            found_addresses.append(address)
+            match_offset.append(offset)
+
+        for start, end in range_claims:
+            used_offsets.add(start, end)
+
+    return used_patterns, found_addresses, match_offset
+
+
+def process_archive_member(inputmaxsize, excluded_paths, temppath, member_path, member, image_file=None):
+    # Members are scanned straight from memory, only the ones above ArchiveReader.in_memory_size are spilled to disk
+    member_instance = FileHandler(member_path)
+    if member_instance.check_if_excluded(excluded_paths):
+        return False
+    if member_instance.sizecheck(member.size, inputmaxsize):
+        return False
 
+    if member.in_memory():
+        return process_file(inputmaxsize, excluded_paths, member_path, temppath, member_path, member.read(), image_file)
 
-def process_archive_file(inputmaxsize, excluded_paths, temppath_, archive_file_path):
+    with member.spill(temppath) as spill_path:
+        return process_file(inputmaxsize, excluded_paths, member_path, temppath, spill_path, None, image_file)
+
+
+def process_archive_file(inputmaxsize, excluded_paths, temppath_, archive_file_path, archive_path=None, archive_data=None,
+                         archive_format=None):
+    # archive_path is where results are attributed to when it differs from archive_file_path, like for nested archives
     results = []
+    archive_path = archive_path or archive_file_path
     try:
-        if temppath_:
-            temp_dir = tempfile.TemporaryDirectory(dir=temppath_)
-        else:
-            temp_dir = tempfile.TemporaryDirectory()
-        with temp_dir as temp_dir:
-            extract_archive(archive_file_path, temp_dir)
-
-            while True:
-                archives_extracted = False
-                for root, dirs, files in os.walk(temp_dir):
-                    for file_name in files:
-                        full_path = os.path.join(root, file_name)
-                        if os.path.splitext(full_path)[1].lower() in ['.zip', '.7z', '.gz', '.tar', '.tgz', '.rar',
-                                                                      '.rar5']:
-
-                            extract_archive(full_path, full_path + "_")
-                            os.remove(full_path)  # Remove the archive after extraction
-                            archives_extracted = True
-
-                if not archives_extracted:
-                    break
-
-            for root, dirs, files in os.walk(temp_dir):
-                for file_name in files:
-                    full_path = os.path.join(root, file_name)
-                    if os.path.isdir(full_path):
-                        continue
-
-                    relative_path = os.path.relpath(full_path, temp_dir)
-                    archive_file_path_printable = os.path.join(archive_file_path, relative_path).replace('/', "\\")
-
-                    file_results = process_file(inputmaxsize, excluded_paths, archive_file_path_printable, temppath_, full_path)
-                    if file_results:
-                        results.append(file_results)
+        with ArchiveReader.open_archive(archive_file_path, archive_data, temppath_, archive_format) as members:
+            for member in members:
+                member_path = os.path.join(archive_path, member.name).replace('/', "\\")
+                file_results = process_archive_member(inputmaxsize, excluded_paths, temppath_, member_path, member)
+                if not file_results:
+                    continue
+
+                if archive_results(file_results):
+                    results.extend(file_results[0])  # Members of nested archives are listed with the outer archive
+                else:
+                    results.append(file_results)
 
         return results
 
     except Exception as err:
         print(f"Error reading archive: {err}")
+        return []
+
+
+def archive_results(file_results):
+    # Archives return the results of their members as a list, also the ones only recognised by their content
+    return isinstance(file_results[0], list)
+
+
+def archive_chain_path(archive_path, member_chain):
+    return os.path.join(archive_path, *member_chain).replace('/', "\\")
+
+
+def file_tasks(file_path, filesize, disk_image=False):
+    # Zip files and disk images are listed by a worker first, large PDF files are scanned in page ranges, every other
+    # file is scanned whole or in byte ranges. Small files are typed by the worker, reading every header here would
+    # slow down queueing
+    if disk_image:
+        return [('image', file_path)]
+    if filesize > task_sniff_size:
+        file_type = FileHandler(file_path).getfiletype()
+    else:
+        file_type = FileType.extension_type(file_path)
+
+    if file_type.name == 'zip':
+        return [('archive', file_path, ())]
+    page_ranges = split_pdf_pages(file_path, filesize) if file_type.kind == 'pages' else []
+    if page_ranges:
+        return [('pages',) + page_range for page_range in page_ranges]
+    return [('file',) + file_range for file_range in split_file_ranges(file_path, filesize, file_type)]
+
+
+def list_archive_tasks(inputmaxsize, excluded_paths, archive_path, member_chain):
+    # Turns a zip file into tasks for its members. Nested zip files up to ArchiveReader.cached_zip_size are listed
+    # again by a worker, all other members are scanned in batches of about member_batch_size.
+    # Members with the same size, CRC and scan_key are only scanned once, the others are compared to it by the worker
+    tasks = []
+    scan_members = []
+    same_content = {}
+    duplicates = defaultdict(list)
+    try:
+        members = ArchiveReader.zip_chain_members(archive_path, member_chain)
+    except Exception as err:
+        print(f"Error reading archive {archive_chain_path(archive_path, member_chain)}: {err}")
+        return tasks
+
+    for member in sorted(members, key=lambda member: member.size, reverse=True):
+        if ArchiveReader.is_zip(member.name) and member.size <= ArchiveReader.cached_zip_size:
+            member_instance = FileHandler(archive_chain_path(archive_path, member_chain + (member.name,)))
+            if not member_instance.check_if_excluded(excluded_paths) and not member_instance.sizecheck(member.size, inputmaxsize):
+                tasks.append(('archive', archive_path, member_chain + (member.name,)))
+            continue
+
+        if member.in_memory() and not ArchiveReader.is_archive(member.name):
+            member_key = member.content_key, scan_key(archive_chain_path(archive_path, member_chain + (member.name,)))
+            first_member = same_content.setdefault(member_key, member.name)
+            if first_member != member.name:
+                duplicates[first_member].append(member.name)
+                continue
+        scan_members.append(member)
+
+    batch = []
+    batch_size = 0
+    for member in scan_members:
+        batch.append(member.name)
+        batch_size += member.size
+        if batch_size >= member_batch_size or len(batch) >= member_batch_count or member is scan_members[-1]:
+            tasks.append(('members', archive_path, member_chain, batch,
+                          {name: duplicates[name] for name in batch if name in duplicates}))
+            batch = []
+            batch_size = 0
+
+    return tasks
+
+
+def process_archive_members(inputmaxsize, excluded_paths, temppath_, archive_path, member_chain, member_names, duplicates):
+    # Returns the results of a batch of zip members as (member results, archive path, size of the members)
+    results = []
+    scanned_size = 0
+    chain_path = archive_chain_path(archive_path, member_chain)
+    for member in ArchiveReader.zip_chain_members(archive_path, member_chain, member_names):
+        member_path = os.path.join(chain_path, member.name).replace('/', "\\")
+        duplicate_names = duplicates.get(member.name)
+        if duplicate_names:
+            member_data = member.read()
+            member = ArchiveReader.ArchiveMember(member.name, member.size, partial(BytesIO, member_data))
+
+        scanned_size += member.size
+        file_results = process_archive_member(inputmaxsize, excluded_paths, temppath_, member_path, member)
+        if file_results and archive_results(file_results):
+            results.extend(file_results[0])
+        elif file_results:
+            results.append(file_results)
+
+        if not duplicate_names:
+            continue
+
+        for duplicate in ArchiveReader.zip_chain_members(archive_path, member_chain, duplicate_names):
+            duplicate_path = os.path.join(chain_path, duplicate.name).replace('/', "\\")
+            if FileHandler(duplicate_path).check_if_excluded(excluded_paths):
+                continue
+
+            scanned_size += duplicate.size
+            if file_results and not archive_results(file_results) and duplicate.read() == member_data:
+                results.append(duplicate_results(file_results, duplicate_path))
+            else:
+                duplicate_file_results = process_archive_member(inputmaxsize, excluded_paths, temppath_, duplicate_path, duplicate)
+                if duplicate_file_results:
+                    results.append(duplicate_file_results)
+
+    return results, chain_path, scanned_size
+
+
+def list_image_tasks(inputmaxsize, excluded_paths, image_path):
+    # Turns a disk image into tasks for the files of its file systems, batched like zip members, and tasks for the
+    # linear scan of the space no file data is in: unallocated space, file slack, file system records and the space
+    # outside the partitions
+    tasks = []
+    used_ranges = []
+    try:
+        for number, partition_offset, partition_length in ImageReader.partitions(image_path):
+            partition_path = os.path.join(image_path, f"Partition {number}")
+            try:
+                image_files = sorted(ImageReader.image_files(image_path, partition_offset), key=lambda image_file: image_file.size, reverse=True)
+            except IOError as err:
+                print(f"No file system read from {partition_path.replace(chr(92), '/')}, it's scanned as unused space: {err}")
+                continue
+
+            batch = []
+            batch_size = 0
+            for image_file in image_files:
+                used_ranges += image_file.data_ranges()
+                batch.append(image_file)
+                batch_size += image_file.size
+                if batch_size >= member_batch_size or len(batch) >= member_batch_count or image_file is image_files[-1]:
+                    tasks.append(('imagefiles', image_path, partition_offset, partition_path, batch))
+                    batch = []
+                    batch_size = 0
+
+        batch = []
+        batch_size = 0
+        unused_ranges = ImageReader.unused_ranges(used_ranges, ImageReader.image_size(image_path))
+        for start, end in unused_ranges:
+            for range_start in range(start, end, image_range_size):
+                range_end = min(range_start + image_range_size, end)
+                batch.append((range_start, range_end))
+                batch_size += range_end - range_start
+                if batch_size >= image_range_size or len(batch) >= member_batch_count:
+                    tasks.append(('unallocated', image_path, batch))
+                    batch = []
+                    batch_size = 0
+        if batch:
+            tasks.append(('unallocated', image_path, batch))
+
+    except Exception as err:
+        print(f"Error reading disk image {image_path}: {err}")
+
+    return tasks
+
+
+def image_offset_results(results, image_file):
+    # Offsets in a file of a disk image scanned as raw data are given in the file and in the image. Offsets in files
+    # stored in the file system records are only given in the file
+    used_patterns, found_addresses, match_offset = results
+    image_offsets = []
+    for offset in match_offset:
+        image_offset = image_file.image_offset(offset)
+        image_offsets.append(offset if image_offset is None else f"{offset} (image {image_offset})")
+    return used_patterns, found_addresses, image_offsets
+
+
+def process_image_files(inputmaxsize, excluded_paths, temppath_, image_path, partition_offset, partition_path, image_files):
+    # Returns the results of a batch of disk image files like process_archive_members
+    results = []
+    scanned_size = 0
+    for image_file in image_files:
+        member_path = os.path.join(partition_path, image_file.path).replace('/', "\\")
+        member = ArchiveReader.ArchiveMember(image_file.path, image_file.size,
+                                             partial(ImageReader.open_file, image_path, partition_offset, image_file.inode, image_file.size))
+        scanned_size += image_file.size
+        file_results = process_archive_member(inputmaxsize, excluded_paths, temppath_, member_path, member, image_file)
+        if file_results and archive_results(file_results):
+            results.extend(file_results[0])
+        elif file_results:
+            results.append(file_results)
+
+    return results, partition_path, scanned_size
+
+
+def process_image_ranges(image_path, ranges):
+    # Linear scan of parts of a disk image no file data is in, reported as one $Unallocated file with image offsets.
+    # Ranges are read in pieces of scan_window_size together with the next max_pattern_length bytes, so matches running
+    # over the end of a piece are found whole
+    region_path = os.path.join(image_path, '$Unallocated').replace('/', "\\")
+    scanned_size = sum(end - start for start, end in ranges)
+    range_printable = f"{len(ranges)} unused ranges, {FileHandler(image_path).getfilesize_printable(scanned_size)}"
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Scanning: {image_path.replace(chr(92), '/')} ({range_printable})")
+
+    range_results = {}
+    for start, end in ranges:
+        for piece_start in range(start, end, scan_window_size):
+            piece_end = min(piece_start + scan_window_size, end)
+            piece = ImageReader.read_image(image_path, piece_start, piece_end - piece_start + max_pattern_length)
+            used_patterns, found_addresses, match_offset = file_data_search(piece, region_path, range_printable, None, 0, piece_end - piece_start)
+            range_results[piece_start] = used_patterns, found_addresses, [piece_start + offset for offset in match_offset]
+
+    printabletime = datetime.datetime.now().strftime("%H:%M:%S")
+    print(f"{printabletime}: Done with: {image_path.replace(chr(92), '/')} ({range_printable})")
+    return [(merge_range_results(range_results), region_path, scanned_size)], image_path, scanned_size
+
+
+def process_task(inputmaxsize, excluded_paths, temppath, task):
+    # Runs one task of the scan work queue and returns its result together with the task kind, the scanned file and
+    # the pre-filter and media scan counts of the task
+    kind, file_path = task[:2]
+    result = False
+    try:
+        if kind == 'file':
+            result = process_file_range(inputmaxsize, excluded_paths, temppath, task[1:])
+        elif kind == 'pages':
+            result = process_pdf_pages(inputmaxsize, excluded_paths, task[1:])
+        elif kind == 'archive':
+            result = list_archive_tasks(inputmaxsize, excluded_paths, file_path, task[2])
+        elif kind == 'members':
+            result = process_archive_members(inputmaxsize, excluded_paths, temppath, *task[1:])
+        elif kind == 'image':
+            result = list_image_tasks(inputmaxsize, excluded_paths, file_path)
+        elif kind == 'imagefiles':
+            result = process_image_files(inputmaxsize, excluded_paths, temppath, *task[1:])
+        elif kind == 'unallocated':
+            result = process_image_ranges(*task[1:])
+    except Exception as err:
+        print(f"Error processing {file_path}: {err}")
+
+    task_prefilter_counts = dict(prefilter_counts)
+    task_scan_counts = dict(scan_counts)
+    prefilter_counts.clear()
+    scan_counts.clear()
+    return kind, file_path, result, task_prefilter_counts, task_scan_counts
@@ -0,0 +1,62 @@
+import sqlite3
+
+import ContentHash
+
+
+class ScanCache:
+    """
+    ScanCache keeps the hits of every scanned file in an SQLite database, so unchanged files are skipped on a re-run.
+    A file counts as unchanged when path, size and modification time match and the patterns didn't change since.
+    With content_hash a sample hash of the file is stored as well, which recognises files that were re-acquired
+    with a new modification time.
+    """
+    def __init__(self, database_path, pattern_version, content_hash=False):
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, size INTEGER, mtime REAL, content_hash TEXT,
+                                              pattern_version TEXT);
+            CREATE TABLE IF NOT EXISTS hits (path TEXT, pattern TEXT, address TEXT, filename TEXT, offset TEXT);
+            CREATE INDEX IF NOT EXISTS hits_path ON hits (path);
+        ''')
+        self.pattern_version = pattern_version
+        self.content_hash = content_hash
+        self.uncommitted = 0
+
+    def lookup(self, path, size, mtime):
+        # Returns the stored csv rows of path when it's unchanged, otherwise None
+        cached_file = self.connection.execute('SELECT size, mtime, content_hash, pattern_version FROM files WHERE path = ?',
+                                              (path,)).fetchone()
+        if cached_file is None or cached_file[0] != size or cached_file[3] != self.pattern_version:
+            return None
+
+        if cached_file[1] != mtime:
+            try:
+                if not self.content_hash or cached_file[2] != ContentHash.sample_hash(path, size):
+                    return None
+            except OSError:
+                return None
+
+        return self.connection.execute('SELECT pattern, address, filename, offset FROM hits WHERE path = ? ORDER BY rowid',
+                                       (path,)).fetchall()
+
+    def store(self, path, size, mtime, rows):
+        try:
+            content_hash = ContentHash.sample_hash(path, size) if self.content_hash else None
+        except OSError:
+            content_hash = None
+
+        self.connection.execute('DELETE FROM hits WHERE path = ?', (path,))
+        self.connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?)',
+                                (path, size, mtime, content_hash, self.pattern_version))
+        self.connection.executemany('INSERT INTO hits VALUES (?, ?, ?, ?, ?)', ((path,) + tuple(row) for row in rows))
+        self.uncommitted += 1
+        if self.uncommitted >= 1000:
+            self.commit()
+
+    def commit(self):
+        self.connection.commit()
+        self.uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.connection.close()
@@ -1,116 +1,74 @@
-import coinaddrvalidator
-import monero
-from base58 import b58decode_check
-from monero import address
-from web3 import Web3
+from functools import lru_cache, partial
+from hashlib import sha256
 
+base58_alphabet = '123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz'
+ripple_alphabet = 'rpshnaf39wBUDNEGHJKLM4PQRST7VWXYZ2bcdeCg65jkm8oFqi1tuvAxyz'
 
+
+def digit_table(alphabet):
+    # Digit value for every byte, None for bytes outside the alphabet
+    table = [None] * 256
+    for digit, character in enumerate(alphabet.encode()):
+        table[character] = digit
+    return table
+
+
+base58_digits = digit_table(base58_alphabet)
+ripple_digits = digit_table(ripple_alphabet)
+
+bech32_charset = 'qpzry9x8gf2tvdw0s3jn54khce6mua7l'
+bech32_digits = {character: digit for digit, character in enumerate(bech32_charset)}
+bech32_constant = 1
+bech32m_constant = 0x2bc830a3
+
+
+def bech32_table():
+    # XOR of the generator values for every combination of the 5 bits shifted out of the checksum in one step
+    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+    table = [0] * 32
+    for top in range(32):
+        for i in range(5):
+            if (top >> i) & 1:
+                table[top] ^= generator[i]
+    return table
+
+
+bech32_generator_table = bech32_table()
+
+
+def monero_address(inputaddress):
+    # monero and web3 are imported on first use, web3 alone takes seconds to import
+    from monero import address
+    return address.address(inputaddress)
+
+
+def ethereum_address(inputaddress):
+    from web3 import Web3
+    return Web3.is_address(inputaddress)
+
+
+def bitcoin_cash_address(inputaddress):
+    return True
+
+
+@lru_cache(maxsize=65536)
 def validate_address(inputaddress, pattern):
-    if 'Bitcoin Address' == pattern:
-        try:
-            return coinaddrvalidator.validate('btc', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    if 'Bitcoin Address P2SH' == pattern:
-        try:
-            return coinaddrvalidator.validate('btc', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'Monero Address' == pattern:
-        try:
-            return monero.address.address(inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'Ethereum Address' == pattern:
-        try:
-            return Web3.is_address(inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'DOGE Address' == pattern:
-        try:
-            return coinaddrvalidator.validate('doge', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'DASH Address' == pattern:
-        try:
-            return coinaddrvalidator.validate('dash', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'NEO Address' == pattern:
-        try:
-            return coinaddrvalidator.validate('neo', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'Ripple Address' == pattern:
-        try:
-            return coinaddrvalidator.validate('ripple', inputaddress)
-        except TypeError:
-            return False
-        except ValueError:
-            return False
-
-    elif 'Bitcoin Address Bech32' == pattern:
-        try:
-            return bech32_decode(inputaddress)
-        except:
-            return False
-
-    elif 'WIF Private key compressed public key' == pattern:
-        try:
-            return base58check(inputaddress)
-        except:
-            return False
-
-    elif 'WIF Private key uncompressed public key' == pattern:
-        try:
-            return base58check(inputaddress)
-        except:
-            return False
-
-    elif 'BIP32 HD wallet private node' == pattern:
-        try:
-            return base58check(inputaddress)
-        except:
-            return False
-
-    elif 'BIP32 HD wallet public node' == pattern:
-        try:
-            return base58check(inputaddress)
-        except:
-            return False
-
-    elif 'BIP38 Encrypted Private Key' == pattern:
-        try:
-            return base58check(inputaddress)
-        except:
-            return False
-
-    elif 'Bitcoin Cash Address' == pattern:
-        try:
-            return True
-        except:
-            return False
+    # The same address often shows up many times in one file, so verdicts are cached for the whole worker
+    validator = validators.get(pattern)
+    if validator is None:
+        return None
+    try:
+        return bool(validator(inputaddress))
+    except ImportError:
+        raise
+    except Exception:
+        return False
+
+
+def validate_addresses(inputaddresses, pattern):
+    # Verdicts for a list of candidates of one pattern, every distinct candidate is only looked up once
+    verdicts = {inputaddress: validate_address(inputaddress, pattern) for inputaddress in set(inputaddresses)}
+    return [verdicts[inputaddress] for inputaddress in inputaddresses]
 
 
 def ethereum_check_if_unverifyable(inputaddress):
@@ -119,31 +77,25 @@ def ethereum_check_if_unverifyable(inputaddress):
 
 
 def bech32_decode(bech):
-    charset = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
-    if ((any(ord(x) < 33 or ord(x) > 126 for x in bech)) or
-            (bech.lower() != bech and bech.upper() != bech)):
+    if not bech.isascii() or not bech.isprintable() or ' ' in bech:
+        return False
+    if bech.lower() != bech and bech.upper() != bech:
         return False
     bech = bech.lower()
     pos = bech.rfind('1')
     if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
         return False
-    if not all(x in charset for x in bech[pos+1:]):
+    try:
+        data = [bech32_digits[x] for x in bech[pos+1:]]
+    except KeyError:
         return False
-    hrp = bech[:pos]
-    data = [charset.find(x) for x in bech[pos+1:]]
-    if not bech32_verify_checksum(hrp, data):
-        return False
-    return True
+    return bech32_verify_checksum(bech[:pos], data)
 
 
 def bech32_polymod(values):
-    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
     chk = 1
     for value in values:
-        top = chk >> 25
-        chk = (chk & 0x1ffffff) << 5 ^ value
-        for i in range(5):
-            chk ^= generator[i] if ((top >> i) & 1) else 0
+        chk = (chk & 0x1ffffff) << 5 ^ value ^ bech32_generator_table[chk >> 25]
     return chk
 
 
@@ -152,14 +104,53 @@ def bech32_hrp_expand(hrp):
 
 
 def bech32_verify_checksum(hrp, data):
-    return bech32_polymod(bech32_hrp_expand(hrp) + data) == 1
+    # The first data value is the witness version, version 0 uses Bech32 and versions 1 and up use Bech32m (BIP350)
+    return bech32_polymod(bech32_hrp_expand(hrp) + data) == (bech32_constant if data[0] == 0 else bech32m_constant)
 
 
-def base58check(base58address):
-    arr = b58decode_check(base58address).hex().lower()
-    s = []
-    for i in range(0, len(arr) - 1, 2):
-        s.append("0x" + arr[i] + arr[i + 1])
-    return s
+def base58_decode_check(base58string, digits=base58_digits):
+    # Returns the payload without the checksum, or None if the string isn't valid Base58Check
+    value = 0
+    try:
+        for character in base58string.encode():
+            value = value * 58 + digits[character]
+    except TypeError:
+        return None
+
+    leading_zeros = 0
+    if base58string and digits[ord(base58string[0])] == 0:  # Leading zero digits stand for zero bytes
+        leading_zeros = len(base58string) - len(base58string.lstrip(base58string[0]))
+    decoded = b'\0' * leading_zeros + value.to_bytes((value.bit_length() + 7) // 8, 'big')
+    if len(decoded) < 5 or sha256(sha256(decoded[:-4]).digest()).digest()[:4] != decoded[-4:]:
+        return None
+    return decoded[:-4]
 
 
+def base58check(base58address):
+    return base58_decode_check(base58address) is not None
+
+
+def base58_address(base58address, versions, digits=base58_digits):
+    # Address with a one byte version followed by a 20 byte hash
+    payload = base58_decode_check(base58address, digits)
+    return payload is not None and len(payload) == 21 and payload[0] in versions
+
+
+# Validator for every pattern description, see validate_address
+validators = {
+    'Bitcoin Address': partial(base58_address, versions=(0x00, 0x05, 0x6f, 0xc4)),
+    'Bitcoin Address P2SH': partial(base58_address, versions=(0x00, 0x05, 0x6f, 0xc4)),
+    'Monero Address': monero_address,
+    'Ethereum Address': ethereum_address,
+    'DOGE Address': partial(base58_address, versions=(0x1e, 0x16, 0x71, 0xc4)),
+    'DASH Address': partial(base58_address, versions=(0x4c, 0x10, 0x8c, 0x13)),
+    'NEO Address': partial(base58_address, versions=(0x17,)),
+    'Ripple Address': partial(base58_address, versions=(0x00, 0x05), digits=ripple_digits),
+    'Bitcoin Address Bech32': bech32_decode,
+    'WIF Private key compressed public key': base58check,
+    'WIF Private key uncompressed public key': base58check,
+    'BIP32 HD wallet private node': base58check,
+    'BIP32 HD wallet public node': base58check,
+    'BIP38 Encrypted Private Key': base58check,
+    'Bitcoin Cash Address': bitcoin_cash_address,
+}
@@ -0,0 +1,128 @@
+import random
+import timeit
+from hashlib import sha256
+
+import Validator
+
+# Compares the Base58Check and Bech32 validators with the implementations they replaced.
+# Run with: python ValidatorBenchmark.py
+
+candidate_count = 20000
+valid_share = 0.01  # Most regex hits are false positives
+
+
+def old_b58decode_check(v):
+    # b58decode_check of the base58 package the validator used, so the benchmark doesn't need it installed
+    origlen = len(v)
+    v = v.lstrip(Validator.base58_alphabet[0])
+    acc = 0
+    for char in v:
+        acc = acc * 58 + Validator.base58_alphabet.index(char)  # ValueError for characters outside the alphabet
+    result = []
+    while acc > 0:
+        acc, mod = divmod(acc, 256)
+        result.append(mod)
+    decoded = b'\0' * (origlen - len(v)) + bytes(reversed(result))
+    result, check = decoded[:-4], decoded[-4:]
+    if sha256(sha256(result).digest()).digest()[:4] != check:
+        raise ValueError("Invalid checksum")
+    return result
+
+
+def old_base58check(base58address):
+    arr = old_b58decode_check(base58address).hex().lower()
+    s = []
+    for i in range(0, len(arr) - 1, 2):
+        s.append("0x" + arr[i] + arr[i + 1])
+    return s
+
+
+def old_bech32_polymod(values):
+    generator = [0x3b6a57b2, 0x26508e6d, 0x1ea119fa, 0x3d4233dd, 0x2a1462b3]
+    chk = 1
+    for value in values:
+        top = chk >> 25
+        chk = (chk & 0x1ffffff) << 5 ^ value
+        for i in range(5):
+            chk ^= generator[i] if ((top >> i) & 1) else 0
+    return chk
+
+
+def old_bech32_decode(bech):
+    charset = "qpzry9x8gf2tvdw0s3jn54khce6mua7l"
+    if ((any(ord(x) < 33 or ord(x) > 126 for x in bech)) or
+            (bech.lower() != bech and bech.upper() != bech)):
+        return False
+    bech = bech.lower()
+    pos = bech.rfind('1')
+    if pos < 1 or pos + 7 > len(bech) or len(bech) > 90:
+        return False
+    if not all(x in charset for x in bech[pos+1:]):
+        return False
+    hrp = bech[:pos]
+    data = [charset.find(x) for x in bech[pos+1:]]
+    return old_bech32_polymod(Validator.bech32_hrp_expand(hrp) + data) == 1
+
+
+def old_verdict(validator, candidate):
+    try:
+        return bool(validator(candidate))
+    except Exception:
+        return False
+
+
+def base58check_encode(payload):
+    data = payload + sha256(sha256(payload).digest()).digest()[:4]
+    value = int.from_bytes(data, 'big')
+    encoded = ''
+    while value:
+        value, digit = divmod(value, 58)
+        encoded = Validator.base58_alphabet[digit] + encoded
+    return '1' * (len(data) - len(data.lstrip(b'\0'))) + encoded
+
+
+def bech32_encode(hrp, data):
+    polymod = Validator.bech32_polymod(Validator.bech32_hrp_expand(hrp) + data + [0] * 6) ^ 1
+    checksum = [(polymod >> 5 * (5 - i)) & 31 for i in range(6)]
+    return hrp + '1' + ''.join(Validator.bech32_charset[digit] for digit in data + checksum)
+
+
+def base58_candidates(version, payload_size):
+    candidates = []
+    for _ in range(candidate_count):
+        candidate = base58check_encode(bytes([version]) + random.randbytes(payload_size))
+        if random.random() > valid_share:
+            position = random.randrange(1, len(candidate))
+            candidate = candidate[:position] + random.choice(Validator.base58_alphabet) + candidate[position + 1:]
+        candidates.append(candidate)
+    return candidates
+
+
+def bech32_candidates():
+    candidates = []
+    for _ in range(candidate_count):
+        candidate = bech32_encode('bc', [0] + [random.randrange(32) for _ in range(32)])
+        if random.random() > valid_share:
+            position = random.randrange(3, len(candidate))
+            candidate = candidate[:position] + random.choice(Validator.bech32_charset) + candidate[position + 1:]
+        candidates.append(candidate)
+    return candidates
+
+
+def benchmark(name, old_validator, new_validator, candidates):
+    old_verdicts = [old_verdict(old_validator, candidate) for candidate in candidates]
+    new_verdicts = [bool(new_validator(candidate)) for candidate in candidates]
+    old_time = timeit.timeit(lambda: [old_verdict(old_validator, candidate) for candidate in candidates], number=3) / 3
+    new_time = timeit.timeit(lambda: [new_validator(candidate) for candidate in candidates], number=3) / 3
+    print(f"{name}: old {old_time / len(candidates) * 1e6:.2f}us, new {new_time / len(candidates) * 1e6:.2f}us "
+          f"per candidate ({old_time / new_time:.1f}x), {sum(new_verdicts)} valid, "
+          f"verdicts {'match' if old_verdicts == new_verdicts else 'differ'}")
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    benchmark('WIF uncompressed', old_base58check, Validator.base58check, base58_candidates(0x80, 32))
+    benchmark('BIP38', old_base58check, Validator.base58check, base58_candidates(0x01, 38))
+    benchmark('BIP32', old_base58check, Validator.base58check, base58_candidates(0x04, 77))
+    benchmark('Bitcoin Address', old_base58check, Validator.validators['Bitcoin Address'], base58_candidates(0x00, 20))
+    benchmark('Bech32', old_bech32_decode, Validator.bech32_decode, bech32_candidates())
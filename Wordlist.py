@@ -0,0 +1,281 @@
+# English BIP-39 and Monero seed wordlists. Each list is a single bytes constant, which is loaded as is from the
+# compiled module instead of building thousands of str objects in every worker on import.
+
+english_words = (
+    b'abandon ability able about above absent absorb abstract absurd abuse access accident account accuse '
+    b'achieve acid acoustic acquire across act action actor actress actual adapt add addict address adjust '
+    b'admit adult advance advice aerobic affair afford afraid again age agent agree ahead aim air airport '
+    b'aisle alarm album alcohol alert alien all alley allow almost alone alpha already also alter always '
+    b'amateur amazing among amount amused analyst anchor ancient anger angle angry animal ankle announce '
+    b'annual another answer antenna antique anxiety any apart apology appear apple approve april arch arctic '
+    b'area arena argue arm armed armor army around arrange arrest arrive arrow art artefact artist artwork '
+    b'ask aspect assault asset assist assume asthma athlete atom attack attend attitude attract auction audit '
+    b'august aunt author auto autumn average avocado avoid awake aware away awesome awful awkward axis baby '
+    b'bachelor bacon badge bag balance balcony ball bamboo banana banner bar barely bargain barrel base basic '
+    b'basket battle beach bean beauty because become beef before begin behave behind believe below belt bench '
+    b'benefit best betray better between beyond bicycle bid bike bind biology bird birth bitter black blade '
+    b'blame blanket blast bleak bless blind blood blossom blouse blue blur blush board boat body boil bomb '
+    b'bone bonus book boost border boring borrow boss bottom bounce box boy bracket brain brand brass brave '
+    b'bread breeze brick bridge brief bright bring brisk broccoli broken bronze broom brother brown brush '
+    b'bubble buddy budget buffalo build bulb bulk bullet bundle bunker burden burger burst bus business busy '
+    b'butter buyer buzz cabbage cabin cable cactus cage cake call calm camera camp can canal cancel candy '
+    b'cannon canoe canvas canyon capable capital captain car carbon card cargo carpet carry cart case cash '
+    b'casino castle casual cat catalog catch category cattle caught cause caution cave ceiling celery cement '
+    b'census century cereal certain chair chalk champion change chaos chapter charge chase chat cheap check '
+    b'cheese chef cherry chest chicken chief child chimney choice choose chronic chuckle chunk churn cigar '
+    b'cinnamon circle citizen city civil claim clap clarify claw clay clean clerk clever click client cliff '
+    b'climb clinic clip clock clog close cloth cloud clown club clump cluster clutch coach coast coconut code '
+    b'coffee coil coin collect color column combine come comfort comic common company concert conduct confirm '
+    b'congress connect consider control convince cook cool copper copy coral core corn correct cost cotton '
+    b'couch country couple course cousin cover coyote crack cradle craft cram crane crash crater crawl crazy '
+    b'cream credit creek crew cricket crime crisp critic crop cross crouch crowd crucial cruel cruise crumble '
+    b'crunch crush cry crystal cube culture cup cupboard curious current curtain curve cushion custom cute '
+    b'cycle dad damage damp dance danger daring dash daughter dawn day deal debate debris decade december '
+    b'decide decline decorate decrease deer defense define defy degree delay deliver demand demise denial '
+    b'dentist deny depart depend deposit depth deputy derive describe desert design desk despair destroy '
+    b'detail detect develop device devote diagram dial diamond diary dice diesel diet differ digital dignity '
+    b'dilemma dinner dinosaur direct dirt disagree discover disease dish dismiss disorder display distance '
+    b'divert divide divorce dizzy doctor document dog doll dolphin domain donate donkey donor door dose '
+    b'double dove draft dragon drama drastic draw dream dress drift drill drink drip drive drop drum dry duck '
+    b'dumb dune during dust dutch duty dwarf dynamic eager eagle early earn earth easily east easy echo '
+    b'ecology economy edge edit educate effort egg eight either elbow elder electric elegant element elephant '
+    b'elevator elite else embark embody embrace emerge emotion employ empower empty enable enact end endless '
+    b'endorse enemy energy enforce engage engine enhance enjoy enlist enough enrich enroll ensure enter '
+    b'entire entry envelope episode equal equip era erase erode erosion error erupt escape essay essence '
+    b'estate eternal ethics evidence evil evoke evolve exact example excess exchange excite exclude excuse '
+    b'execute exercise exhaust exhibit exile exist exit exotic expand expect expire explain expose express '
+    b'extend extra eye eyebrow fabric face faculty fade faint faith fall false fame family famous fan fancy '
+    b'fantasy farm fashion fat fatal father fatigue fault favorite feature february federal fee feed feel '
+    b'female fence festival fetch fever few fiber fiction field figure file film filter final find fine '
+    b'finger finish fire firm first fiscal fish fit fitness fix flag flame flash flat flavor flee flight flip '
+    b'float flock floor flower fluid flush fly foam focus fog foil fold follow food foot force forest forget '
+    b'fork fortune forum forward fossil foster found fox fragile frame frequent fresh friend fringe frog '
+    b'front frost frown frozen fruit fuel fun funny furnace fury future gadget gain galaxy gallery game gap '
+    b'garage garbage garden garlic garment gas gasp gate gather gauge gaze general genius genre gentle '
+    b'genuine gesture ghost giant gift giggle ginger giraffe girl give glad glance glare glass glide glimpse '
+    b'globe gloom glory glove glow glue goat goddess gold good goose gorilla gospel gossip govern gown grab '
+    b'grace grain grant grape grass gravity great green grid grief grit grocery group grow grunt guard guess '
+    b'guide guilt guitar gun gym habit hair half hammer hamster hand happy harbor hard harsh harvest hat have '
+    b'hawk hazard head health heart heavy hedgehog height hello helmet help hen hero hidden high hill hint '
+    b'hip hire history hobby hockey hold hole holiday hollow home honey hood hope horn horror horse hospital '
+    b'host hotel hour hover hub huge human humble humor hundred hungry hunt hurdle hurry hurt husband hybrid '
+    b'ice icon idea identify idle ignore ill illegal illness image imitate immense immune impact impose '
+    b'improve impulse inch include income increase index indicate indoor industry infant inflict inform '
+    b'inhale inherit initial inject injury inmate inner innocent input inquiry insane insect inside inspire '
+    b'install intact interest into invest invite involve iron island isolate issue item ivory jacket jaguar '
+    b'jar jazz jealous jeans jelly jewel job join joke journey joy judge juice jump jungle junior junk just '
+    b'kangaroo keen keep ketchup key kick kid kidney kind kingdom kiss kit kitchen kite kitten kiwi knee '
+    b'knife knock know lab label labor ladder lady lake lamp language laptop large later latin laugh laundry '
+    b'lava law lawn lawsuit layer lazy leader leaf learn leave lecture left leg legal legend leisure lemon '
+    b'lend length lens leopard lesson letter level liar liberty library license life lift light like limb '
+    b'limit link lion liquid list little live lizard load loan lobster local lock logic lonely long loop '
+    b'lottery loud lounge love loyal lucky luggage lumber lunar lunch luxury lyrics machine mad magic magnet '
+    b'maid mail main major make mammal man manage mandate mango mansion manual maple marble march margin '
+    b'marine market marriage mask mass master match material math matrix matter maximum maze meadow mean '
+    b'measure meat mechanic medal media melody melt member memory mention menu mercy merge merit merry mesh '
+    b'message metal method middle midnight milk million mimic mind minimum minor minute miracle mirror misery '
+    b'miss mistake mix mixed mixture mobile model modify mom moment monitor monkey monster month moon moral '
+    b'more morning mosquito mother motion motor mountain mouse move movie much muffin mule multiply muscle '
+    b'museum mushroom music must mutual myself mystery myth naive name napkin narrow nasty nation nature near '
+    b'neck need negative neglect neither nephew nerve nest net network neutral never news next nice night '
+    b'noble noise nominee noodle normal north nose notable note nothing notice novel now nuclear number nurse '
+    b'nut oak obey object oblige obscure observe obtain obvious occur ocean october odor off offer office '
+    b'often oil okay old olive olympic omit once one onion online only open opera opinion oppose option '
+    b'orange orbit orchard order ordinary organ orient original orphan ostrich other outdoor outer output '
+    b'outside oval oven over own owner oxygen oyster ozone pact paddle page pair palace palm panda panel '
+    b'panic panther paper parade parent park parrot party pass patch path patient patrol pattern pause pave '
+    b'payment peace peanut pear peasant pelican pen penalty pencil people pepper perfect permit person pet '
+    b'phone photo phrase physical piano picnic picture piece pig pigeon pill pilot pink pioneer pipe pistol '
+    b'pitch pizza place planet plastic plate play please pledge pluck plug plunge poem poet point polar pole '
+    b'police pond pony pool popular portion position possible post potato pottery poverty powder power '
+    b'practice praise predict prefer prepare present pretty prevent price pride primary print priority prison '
+    b'private prize problem process produce profit program project promote proof property prosper protect '
+    b'proud provide public pudding pull pulp pulse pumpkin punch pupil puppy purchase purity purpose purse '
+    b'push put puzzle pyramid quality quantum quarter question quick quit quiz quote rabbit raccoon race rack '
+    b'radar radio rail rain raise rally ramp ranch random range rapid rare rate rather raven raw razor ready '
+    b'real reason rebel rebuild recall receive recipe record recycle reduce reflect reform refuse region '
+    b'regret regular reject relax release relief rely remain remember remind remove render renew rent reopen '
+    b'repair repeat replace report require rescue resemble resist resource response result retire retreat '
+    b'return reunion reveal review reward rhythm rib ribbon rice rich ride ridge rifle right rigid ring riot '
+    b'ripple risk ritual rival river road roast robot robust rocket romance roof rookie room rose rotate '
+    b'rough round route royal rubber rude rug rule run runway rural sad saddle sadness safe sail salad salmon '
+    b'salon salt salute same sample sand satisfy satoshi sauce sausage save say scale scan scare scatter '
+    b'scene scheme school science scissors scorpion scout scrap screen script scrub sea search season seat '
+    b'second secret section security seed seek segment select sell seminar senior sense sentence series '
+    b'service session settle setup seven shadow shaft shallow share shed shell sheriff shield shift shine '
+    b'ship shiver shock shoe shoot shop short shoulder shove shrimp shrug shuffle shy sibling sick side siege '
+    b'sight sign silent silk silly silver similar simple since sing siren sister situate six size skate '
+    b'sketch ski skill skin skirt skull slab slam sleep slender slice slide slight slim slogan slot slow '
+    b'slush small smart smile smoke smooth snack snake snap sniff snow soap soccer social sock soda soft '
+    b'solar soldier solid solution solve someone song soon sorry sort soul sound soup source south space '
+    b'spare spatial spawn speak special speed spell spend sphere spice spider spike spin spirit split spoil '
+    b'sponsor spoon sport spot spray spread spring spy square squeeze squirrel stable stadium staff stage '
+    b'stairs stamp stand start state stay steak steel stem step stereo stick still sting stock stomach stone '
+    b'stool story stove strategy street strike strong struggle student stuff stumble style subject submit '
+    b'subway success such sudden suffer sugar suggest suit summer sun sunny sunset super supply supreme sure '
+    b'surface surge surprise surround survey suspect sustain swallow swamp swap swarm swear sweet swift swim '
+    b'swing switch sword symbol symptom syrup system table tackle tag tail talent talk tank tape target task '
+    b'taste tattoo taxi teach team tell ten tenant tennis tent term test text thank that theme then theory '
+    b'there they thing this thought three thrive throw thumb thunder ticket tide tiger tilt timber time tiny '
+    b'tip tired tissue title toast tobacco today toddler toe together toilet token tomato tomorrow tone '
+    b'tongue tonight tool tooth top topic topple torch tornado tortoise toss total tourist toward tower town '
+    b'toy track trade traffic tragic train transfer trap trash travel tray treat tree trend trial tribe trick '
+    b'trigger trim trip trophy trouble truck true truly trumpet trust truth try tube tuition tumble tuna '
+    b'tunnel turkey turn turtle twelve twenty twice twin twist two type typical ugly umbrella unable unaware '
+    b'uncle uncover under undo unfair unfold unhappy uniform unique unit universe unknown unlock until '
+    b'unusual unveil update upgrade uphold upon upper upset urban urge usage use used useful useless usual '
+    b'utility vacant vacuum vague valid valley valve van vanish vapor various vast vault vehicle velvet '
+    b'vendor venture venue verb verify version very vessel veteran viable vibrant vicious victory video view '
+    b'village vintage violin virtual virus visa visit visual vital vivid vocal voice void volcano volume vote '
+    b'voyage wage wagon wait walk wall walnut want warfare warm warrior wash wasp waste water wave way wealth '
+    b'weapon wear weasel weather web wedding weekend weird welcome west wet whale what wheat wheel when where '
+    b'whip whisper wide width wife wild will win window wine wing wink winner winter wire wisdom wise wish '
+    b'witness wolf woman wonder wood wool word work world worry worth wrap wreck wrestle wrist write wrong '
+    b'yard year yellow you young youth zebra zero zone zoo'
+)
+
+monero_words = (
+    b'abbey abducts ability ablaze abnormal abort abrasive absorb abyss academy aces aching acidic acoustic '
+    b'acquire across actress acumen adapt addicted adept adhesive adjust adopt adrenalin adult adventure '
+    b'aerial afar affair afield afloat afoot afraid after against agenda aggravate agile aglow agnostic agony '
+    b'agreed ahead aided ailments aimless airport aisle ajar akin alarms album alchemy alerts algebra '
+    b'alkaline alley almost aloof alpine already also altitude alumni always amaze ambush amended amidst ammo '
+    b'amnesty among amply amused anchor android anecdote angled ankle annoyed answers antics anvil anxiety '
+    b'anybody apart apex aphid aplomb apology apply apricot aptitude aquarium arbitrary archer ardent arena '
+    b'argue arises army around arrow arsenic artistic ascend ashtray aside asked asleep aspire assorted '
+    b'asylum athlete atlas atom atrium attire auburn auctions audio august aunt austere autumn avatar avidly '
+    b'avoid awakened awesome awful awkward awning awoken axes axis axle aztec azure baby bacon badge baffles '
+    b'bagpipe bailed bakery balding bamboo banjo baptism basin batch bawled bays because beer befit begun '
+    b'behind being below bemused benches berries bested betting bevel beware beyond bias bicycle bids '
+    b'bifocals biggest bikini bimonthly binocular biology biplane birth biscuit bite biweekly blender blip '
+    b'bluntly boat bobsled bodies bogeys boil boldly bomb border boss both bounced bovine bowling boxes '
+    b'boyfriend broken brunt bubble buckets budget buffet bugs building bulb bumper bunch business butter '
+    b'buying buzzer bygones byline bypass cabin cactus cadets cafe cage cajun cake calamity camp candy casket '
+    b'catch cause cavernous cease cedar ceiling cell cement cent certain chlorine chrome cider cigar cinema '
+    b'circle cistern citadel civilian claim click clue coal cobra cocoa code coexist coffee cogs cohesive '
+    b'coils colony comb cool copy corrode costume cottage cousin cowl criminal cube cucumber cuddled cuffs '
+    b'cuisine cunning cupcake custom cycling cylinder cynical dabbing dads daft dagger daily damp dangerous '
+    b'dapper darted dash dating dauntless dawn daytime dazed debut decay dedicated deepest deftly degrees '
+    b'dehydrate deity dejected delayed demonstrate dented deodorant depth desk devoid dewdrop dexterity '
+    b'dialect dice diet different digit dilute dime dinner diode diplomat directed distance ditch divers '
+    b'dizzy doctor dodge does dogs doing dolphin domestic donuts doorway dormant dosage dotted double dove '
+    b'down dozen dreams drinks drowning drunk drying dual dubbed duckling dude duets duke dullness dummy '
+    b'dunes duplex duration dusted duties dwarf dwelt dwindling dying dynamite dyslexic each eagle earth easy '
+    b'eating eavesdrop eccentric echo eclipse economics ecstatic eden edgy edited educated eels efficient '
+    b'eggs egotistic eight either eject elapse elbow eldest eleven elite elope else eluded emails ember '
+    b'emerge emit emotion empty emulate energy enforce enhanced enigma enjoy enlist enmity enough enraged '
+    b'ensign entrance envy epoxy equip erase erected erosion error eskimos espionage essential estate etched '
+    b'eternal ethics etiquette evaluate evenings evicted evolved examine excess exhale exit exotic exquisite '
+    b'extra exult fabrics factual fading fainted faked fall family fancy farming fatal faulty fawns faxed '
+    b'fazed feast february federal feel feline females fences ferry festival fetches fever fewest fiat fibula '
+    b'fictional fidget fierce fifteen fight films firm fishing fitting five fixate fizzle fleet flippant '
+    b'flying foamy focus foes foggy foiled folding fonts foolish fossil fountain fowls foxes foyer framed '
+    b'friendly frown fruit frying fudge fuel fugitive fully fuming fungal furnished fuselage future fuzzy '
+    b'gables gadget gags gained galaxy gambit gang gasp gather gauze gave gawk gaze gearbox gecko geek gels '
+    b'gemstone general geometry germs gesture getting geyser ghetto ghost giant giddy gifts gigantic gills '
+    b'gimmick ginger girth giving glass gleeful glide gnaw gnome goat goblet godfather goes goggles going '
+    b'goldfish gone goodbye gopher gorilla gossip gotten gourmet governing gown greater grunt guarded guest '
+    b'guide gulp gumball guru gusts gutter guys gymnast gypsy gyrate habitat hacksaw haggled hairy hamburger '
+    b'happens hashing hatchet haunted having hawk haystack hazard hectare hedgehog heels hefty height hemlock '
+    b'hence heron hesitate hexagon hickory hiding highway hijack hiker hills himself hinder hippo hire '
+    b'history hitched hive hoax hobby hockey hoisting hold honked hookup hope hornet hospital hotel hounded '
+    b'hover howls hubcaps huddle huge hull humid hunter hurried husband huts hybrid hydrogen hyper iceberg '
+    b'icing icon identity idiom idled idols igloo ignore iguana illness imagine imbalance imitate impel '
+    b'inactive inbound incur industrial inexact inflamed ingested initiate injury inkling inline inmate '
+    b'innocent inorganic input inquest inroads insult intended inundate invoke inwardly ionic irate iris '
+    b'irony irritate island isolated issued italics itches items itinerary itself ivory jabbed jackets jaded '
+    b'jagged jailed jamming january jargon jaunt javelin jaws jazz jeans jeers jellyfish jeopardy jerseys '
+    b'jester jetting jewels jigsaw jingle jittery jive jobs jockey jogger joining joking jolted jostle '
+    b'journal joyous jubilee judge juggled juicy jukebox july jump junk jury justice juvenile kangaroo karate '
+    b'keep kennel kept kernels kettle keyboard kickoff kidneys king kiosk kisses kitchens kiwi knapsack knee '
+    b'knife knowledge knuckle koala laboratory ladder lagoon lair lakes lamb language laptop large last later '
+    b'launching lava lawsuit layout lazy lectures ledge leech left legion leisure lemon lending leopard '
+    b'lesson lettuce lexicon liar library licks lids lied lifestyle light likewise lilac limits linen lion '
+    b'lipstick liquid listen lively loaded lobster locker lodge lofty logic loincloth long looking lopped '
+    b'lordship losing lottery loudly love lower loyal lucky luggage lukewarm lullaby lumber lunar lurk lush '
+    b'luxury lymph lynx lyrics macro madness magically mailed major makeup malady mammal maps masterful match '
+    b'maul maverick maximum mayor maze meant mechanic medicate meeting megabyte melting memoir menu merger '
+    b'mesh metro mews mice midst mighty mime mirror misery mittens mixture moat mobile mocked mohawk moisture '
+    b'molten moment money moon mops morsel mostly motherly mouth movement mowing much muddy muffin mugged '
+    b'mullet mumble mundane muppet mural musical muzzle myriad mystery myth nabbing nagged nail names nanny '
+    b'napkin narrate nasty natural nautical navy nearby necklace needed negative neither neon nephew nerves '
+    b'nestle network neutral never newt nexus nibs niche niece nifty nightly nimbly nineteen nirvana nitrogen '
+    b'nobody nocturnal nodes noises nomad noodles northern nostril noted nouns novelty nowhere nozzle nuance '
+    b'nucleus nudged nugget nuisance null number nuns nurse nutshell nylon oaks oars oasis oatmeal obedient '
+    b'object obliged obnoxious observant obtains obvious occur ocean october odds odometer offend often '
+    b'oilfield ointment okay older olive olympics omega omission omnibus onboard oncoming oneself ongoing '
+    b'onion online onslaught onto onward oozed opacity opened opposite optical opus orange orbit orchid '
+    b'orders organs origin ornament orphans oscar ostrich otherwise otter ouch ought ounce ourselves oust '
+    b'outbreak oval oven owed owls owner oxidant oxygen oyster ozone pact paddles pager pairing palace '
+    b'pamphlet pancakes paper paradise pastry patio pause pavements pawnshop payment peaches pebbles peculiar '
+    b'pedantic peeled pegs pelican pencil people pepper perfect pests petals phase pheasants phone phrases '
+    b'physics piano picked pierce pigment piloted pimple pinched pioneer pipeline pirate pistons pitched '
+    b'pivot pixels pizza playful pledge pliers plotting plus plywood poaching pockets podcast poetry point '
+    b'poker polar ponies pool popular portents possible potato pouch poverty powder pram present pride '
+    b'problems pruned prying psychic public puck puddle puffin pulp pumpkins punch puppy purged push putty '
+    b'puzzled pylons pyramid python queen quick quote rabbits racetrack radar rafts rage railway raking rally '
+    b'ramped randomly rapid rarest rash rated ravine rays razor react rebel recipe reduce reef refer regular '
+    b'reheat reinvest rejoices rekindle relic remedy renting reorder repent request reruns rest return '
+    b'reunion revamp rewind rhino rhythm ribbon richly ridges rift rigid rims ringing riots ripped rising '
+    b'ritual river roared robot rockets rodent rogue roles romance roomy roped roster rotate rounded rover '
+    b'rowboat royal ruby rudely ruffled rugged ruined ruling rumble runway rural rustled ruthless sabotage '
+    b'sack sadness safety saga sailor sake salads sample sanity sapling sarcasm sash satin saucepan saved '
+    b'sawmill saxophone sayings scamper scenic school science scoop scrub scuba seasons second sedan seeded '
+    b'segments seismic selfish semifinal sensible september sequence serving session setup seventh sewage '
+    b'shackles shelter shipped shocking shrugged shuffled shyness siblings sickness sidekick sieve sifting '
+    b'sighting silk simplest sincerely sipped siren situated sixteen sizes skater skew skirting skulls '
+    b'skydive slackens sleepless slid slower slug smash smelting smidgen smog smuggled snake sneeze sniff '
+    b'snout snug soapy sober soccer soda software soggy soil solved somewhere sonic soothe soprano sorry '
+    b'southern sovereign sowed soya space speedy sphere spiders splendid spout sprig spud spying square '
+    b'stacking stellar stick stockpile strained stunning stylishly subtly succeed suddenly suede suffice '
+    b'sugar suitcase sulking summon sunken superior surfer sushi suture swagger swept swiftly sword swung '
+    b'syllabus symptoms syndrome syringe system taboo tacit tadpoles tagged tail taken talent tamper tanks '
+    b'tapestry tarnished tasked tattoo taunts tavern tawny taxi teardrop technical tedious teeming tell '
+    b'template tender tepid tequila terminal testing tether textbook thaw theatrics thirsty thorn threaten '
+    b'thumbs thwart ticket tidy tiers tiger tilt timber tinted tipsy tirade tissue titans toaster tobacco '
+    b'today toenail toffee together toilet token tolerant tomorrow tonic toolbox topic torch tossed total '
+    b'touchy towel toxic toyed trash trendy tribal trolling truth trying tsunami tubes tucks tudor tuesday '
+    b'tufts tugs tuition tulips tumbling tunnel turnip tusks tutor tuxedo twang tweezers twice twofold tycoon '
+    b'typist tyrant ugly ulcers ultimate umbrella umpire unafraid unbending uncle under uneven unfit ungainly '
+    b'unhappy union unjustly unknown unlikely unmask unnoticed unopened unplugs unquoted unrest unsafe until '
+    b'unusual unveil unwind unzip upbeat upcoming update upgrade uphill upkeep upload upon upper upright '
+    b'upstairs uptight upwards urban urchins urgent usage useful usher using usual utensils utility utmost '
+    b'utopia uttered vacation vague vain value vampire vane vapidly vary vastness vats vaults vector veered '
+    b'vegan vehicle vein velvet venomous verification vessel veteran vexed vials vibrate victim video '
+    b'viewpoint vigilant viking village vinegar violin vipers virtual visited vitals vivid vixen vocal vogue '
+    b'voice volcano vortex voted voucher vowels voyage vulture wade waffle wagtail waist waking wallets '
+    b'wanted warped washing water waveform waxing wayside weavers website wedge weekday weird welders went '
+    b'wept were western wetsuit whale when whipped whole wickets width wield wife wiggle wildly winter '
+    b'wipeout wiring wise withdrawn wives wizard wobbly woes woken wolf womanly wonders woozy worry wounded '
+    b'woven wrap wrist wrong yacht yahoo yanks yard yawning yearbook yellow yesterday yeti yields yodel yoga '
+    b'younger yoyo zapped zeal zebra zero zesty zigzags zinger zippers zodiac zombie zones zoom'
+)
+
+
+class WordlistIndex:
+    """
+    WordlistIndex maps lowercase bytes tokens to integer word ids and answers wordlist membership without decoding.
+    """
+    def __init__(self, english, monero):
+        self.words = sorted(set(english) | set(monero))
+        self.word_ids = {word: word_id for word_id, word in enumerate(self.words, 1)}  # Ids start at 1, so they are all truthy
+        self.english_ids = frozenset(self.word_ids[word] for word in english)
+        self.monero_ids = frozenset(self.word_ids[word] for word in monero)
+
+    def __contains__(self, token):
+        return token in self.word_ids
+
+    def get(self, token):
+        return self.word_ids.get(token)
+
+    def word(self, word_id):
+        return self.words[word_id - 1]
+
+    def in_one_wordlist(self, tokens):
+        word_ids = [self.word_ids.get(token) for token in tokens]
+        if None in word_ids:
+            return False
+        return all(word_id in self.english_ids for word_id in word_ids) or all(word_id in self.monero_ids for word_id in word_ids)
+
+
+index = WordlistIndex(english_words.split(), monero_words.split())